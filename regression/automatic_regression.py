@@ -42,18 +42,24 @@ modules = [
     'scripts/aerodynamics/control_surfaces_vlm.py',
     'scripts/aerodynamics/sears_haack.py',
     'scripts/aerodynamics/sideslip_and_rotation_vlm.py',
+    'scripts/aerodynamics/surrogate_training_cache.py',
     'scripts/airfoil_import/airfoil_import_test.py',
     'scripts/airfoil_import/airfoil_interpolation_test.py',
     'scripts/airfoil_analysis/airfoil_panel_method_test.py',
+    'scripts/airfoil_analysis/airfoil_boundary_layer_test.py',
     'scripts/atmosphere/atmosphere.py',
+    'scripts/atmosphere/atmosphere_vectorized.py',
     'scripts/atmosphere/constant_temperature.py',
     'scripts/AVL/test_AVL.py',
+    'scripts/AVL/concurrent_training_test.py',
     'scripts/B737/mission_B737.py',
+    'scripts/B737/mission_B737_batched.py',
     'scripts/battery/aircraft_discharge_comparisons.py',
     'scripts/battery/battery_cell_discharge_tests.py',
     'scripts/cmalpha/cmalpha.py',
     'scripts/cnbeta/cnbeta.py',
     'scripts/concorde/concorde.py',
+    'scripts/core/data_access_benchmark.py',
     'scripts/ducted_fan/ducted_fan_network.py',
     'scripts/ducted_fan/battery_ducted_fan_network.py',
     'scripts/ducted_fan/serial_hybrid_ducted_fan_network.py',
@@ -81,26 +87,38 @@ modules = [
     'scripts/noise_fidelity_zero/DC_10_noise.py', 
     'scripts/noise_fidelity_one/propeller_noise.py',
     'scripts/noise_fidelity_one/aircraft_noise.py',
+    'scripts/noise_fidelity_one/engine_noise_microphones_test.py',
+    'scripts/noise_fidelity_one/noise_metrics_test.py',
     'scripts/nonuniform_propeller_inflow/nonuniform_propeller_inflow.py',
     'scripts/optimization_packages/optimization_packages.py',
     'scripts/payload_range/payload_range.py',
     'scripts/plots/plot_test.py',
     'scripts/propeller/propeller_test.py',
+    'scripts/propeller/stacked_rotor_test.py',
     'scripts/propeller_speeds/range_endurance_speeds.py',
     'scripts/propulsion_surrogate/propulsion_surrogate.py',
     'scripts/ramjet_network/ramjet_network.py',
+    'scripts/ramjet_network/mach_inversion_test.py',
     'scripts/Regional_Jet_Optimization/Optimize2.py',
     'scripts/scramjet_network/scramjet_network.py',
     'scripts/rocket_network/Rocketdyne_F1.py',
     'scripts/rocket_network/Rocketdyne_J2.py',
     'scripts/segments/segment_test.py',
+    'scripts/segments/block_sparse_jacobian_test.py',
+    'scripts/segments/flat_state_test.py',
     'scripts/segments/transition_segment_test.py',
     'scripts/slipstream/slipstream_test.py',
     'scripts/slipstream/propeller_interactions.py',
+    'scripts/slipstream/wake_induced_velocity_test.py',
+    'scripts/slipstream/wake_treecode_benchmark.py',
+    'scripts/slipstream/wake_warm_start_test.py',
+    'scripts/slipstream/wake_sharing_test.py',
+    'scripts/slipstream/aero_derivatives_test.py',
     'scripts/solar_network/solar_network.py',
     'scripts/solar_network/solar_low_fidelity_network.py',
     'scripts/solar_radiation/solar_radiation.py',
     'scripts/SU2_surrogate/BWB-450.py',
+    'scripts/SU2_surrogate/concurrent_training_test.py',
     'scripts/sweeps/test_sweeps.py',
     'scripts/test_input_output/test_xml_read_write.py',
     'scripts/test_input_output/test_freemind_write.py',
@@ -0,0 +1,105 @@
+# concurrent_training_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the AVL surrogate training with several AVL runs at once. A stub executable stands in for AVL,
+    it copies the recorded AVL results that the input deck asks for into the folder of its case. The training
+    data of the concurrent runs is compared against the training data read from the recorded results one Mach
+    number at a time
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+import numpy as np
+import os
+import sys
+import shutil
+import tempfile
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup, configs_setup
+
+# stub of AVL, copies the recorded results named in the input deck and logs when it runs
+stub_text = \
+'''#!{python}
+import sys, os, shutil, time
+start = time.time()
+lines = [line.strip() for line in sys.stdin.read().split('\\n')]
+for command, filename in zip(lines[:-1],lines[1:]):
+    if command in ['st','fn','fs','sb']:
+        shutil.copy(os.path.join({recorded!r},filename),filename)
+time.sleep(0.5)
+with open(os.path.join({timings!r},str(os.getpid())),'w') as f:
+    f.write(str(start) + ' ' + str(time.time()) + ' ' + os.getcwd())
+'''
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    origin = os.getcwd()
+    work   = tempfile.mkdtemp()
+    try:
+        recorded = os.path.join(work,'recorded')
+        timings  = os.path.join(work,'timings')
+        shutil.copytree(os.path.join(origin,'avl_files'),recorded)
+        os.makedirs(timings)
+
+        stub = os.path.join(work,'avl_stub')
+        with open(stub,'w') as f:
+            f.write(stub_text.format(python=sys.executable,recorded=recorded,timings=timings))
+        os.chmod(stub,0o755)
+
+        # the work folder mirrors the scripts folder, so the airfoil files are found next to it
+        vehicle = configs_setup(vehicle_setup()).cruise
+        os.symlink(os.path.abspath(os.path.join(origin,'..','Vehicles')),os.path.join(work,'Vehicles'))
+        os.makedirs(os.path.join(work,'AVL'))
+        os.chdir(os.path.join(work,'AVL'))
+
+        # training data read from the recorded results, one Mach number at a time
+        shutil.copytree(recorded,'avl_files')
+        serial = avl_setup(vehicle)
+        serial.initialize(30,10,True,False,True,False,False,0.,0.,0.,None)
+
+        # training data from concurrent runs of the stub
+        concurrent = avl_setup(vehicle)
+        concurrent.settings.filenames.avl_bin_name     = stub
+        concurrent.settings.number_of_concurrent_cases = 3
+        concurrent.initialize(30,10,False,False,False,False,False,0.,0.,0.,None)
+
+        error = np.max(np.abs(concurrent.training.coefficients - serial.training.coefficients))
+        print('Concurrent training error: ' + str(error))
+        assert error == 0.
+        assert np.all(np.isfinite(concurrent.training.coefficients))
+
+        # each run had its own folder, at most three ran at once and the folders were removed
+        runs = []
+        for name in os.listdir(timings):
+            with open(os.path.join(timings,name)) as f:
+                start, end, folder = f.read().split(' ')
+                runs.append((float(start),float(end),folder))
+        assert len(runs) == len(concurrent.training.Mach)
+        assert len(set([run[2] for run in runs])) == len(runs)
+        overlap = max([sum([(s <= start) and (start < e) for s, e, _ in runs]) for start, _, _ in runs])
+        print('Largest number of concurrent runs: ' + str(overlap))
+        assert 1 < overlap <= 3
+        assert not [folder for folder in os.listdir('.') if folder.startswith('avl_files_')]
+
+    finally:
+        os.chdir(origin)
+        shutil.rmtree(work)
+
+    return
+
+def avl_setup(vehicle):
+    avl          = SUAVE.Analyses.Aerodynamics.AVL_Inviscid()
+    avl.geometry = vehicle
+    return avl
+
+if __name__ == '__main__':
+    main()
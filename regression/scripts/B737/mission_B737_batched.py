@@ -0,0 +1,86 @@
+# mission_B737_batched.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the batched segment mission, the Boeing 737 mission is solved segment by segment
+    and with all segments in one root finding problem and the results compared
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+
+from mission_B737 import full_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    sequential = mission_setup(batched = False).evaluate()
+    batched    = mission_setup(batched = True).evaluate()
+
+    for segment in batched.segments:
+        assert(segment.converged)
+
+    # Store errors relative to the sequential solution
+    error = Data()
+    error.total_mass       = relative_error(sequential, batched, 'weights.total_mass')
+    error.time             = relative_error(sequential, batched, 'frames.inertial.time')
+    error.position_vector  = relative_error(sequential, batched, 'frames.inertial.position_vector')
+    error.throttle         = relative_error(sequential, batched, 'propulsion.throttle')
+    error.lift_coefficient = relative_error(sequential, batched, 'aerodynamics.lift_coefficient')
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    # a single boundary pass can not meet an unreachable boundary tolerance
+    mission = mission_setup(batched = True)
+    mission.maximum_boundary_passes = 1
+    mission.boundary_tolerance      = 1e-14
+    results = mission.evaluate()
+
+    assert(not mission.state.numerics.converged)
+    assert(not any(segment.converged for segment in results.segments))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Mission Setup
+# ----------------------------------------------------------------------
+
+def mission_setup(batched):
+
+    configs, analyses = full_setup()
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    if batched:
+        base_mission = mission
+        mission      = SUAVE.Analyses.Mission.Batched_Segments()
+        mission.tag  = base_mission.tag
+        for segment in base_mission.segments:
+            mission.append_segment(segment)
+
+    return mission
+
+def relative_error(truth, results, key):
+
+    truth   = np.vstack([segment.conditions.deep_get(key) for segment in truth.segments])
+    results = np.vstack([segment.conditions.deep_get(key) for segment in results.segments])
+
+    return np.max(np.abs(truth - results)) / np.max(np.abs(truth))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# concurrent_training_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the SU2 surrogate training with several SU2 runs at once. A stub executable stands in for
+    SU2_CFD, it writes a history file with coefficients that follow from the Mach number and angle of attack
+    of the configuration file. The training data of the concurrent runs is compared against the serial runs
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Units
+import numpy as np
+import os
+import sys
+import shutil
+import tempfile
+
+# stub of SU2_CFD, CL = 0.1*AoA + M and CD = 0.01*AoA^2 + M/10 with AoA in degrees
+stub_text = \
+'''#!{python}
+import sys, os, time
+start = time.time()
+tag   = sys.argv[1][:-len('.cfg')]
+assert os.path.exists(tag + '.su2')
+with open(sys.argv[1]) as f:
+    settings = dict([[word.strip() for word in line.split('=')] for line in f.read().split('\\n') if '=' in line])
+mach = float(settings['MACH_NUMBER'])
+AoA  = float(settings['AOA'])
+time.sleep(0.2)
+with open(tag + '_history.dat','w') as f:
+    f.write(','.join(['0.']*8 + [str(0.01*AoA**2 + mach/10.),str(0.1*AoA + mach)]) + '\\n')
+with open(os.path.join({timings!r},str(os.getpid())),'w') as f:
+    f.write(str(start) + ' ' + str(time.time()) + ' ' + os.getcwd())
+'''
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    origin = os.getcwd()
+    path   = os.environ.get('PATH','')
+    work   = tempfile.mkdtemp()
+    try:
+        timings = os.path.join(work,'timings')
+        stubs   = os.path.join(work,'bin')
+        os.makedirs(timings)
+        os.makedirs(stubs)
+        stub = os.path.join(stubs,'SU2_CFD')
+        with open(stub,'w') as f:
+            f.write(stub_text.format(python=sys.executable,timings=timings))
+        os.chmod(stub,0o755)
+        os.environ['PATH'] = stubs + os.pathsep + path
+
+        os.chdir(work)
+        geometry                = Data()
+        geometry.tag            = 'stub_wing'
+        geometry.reference_area = 10.
+        with open(geometry.tag + '.su2','w') as f:
+            f.write('% mesh of the stub\n')
+
+        # one SU2 run at a time
+        serial = su2_setup(geometry)
+        serial.sample_training()
+        serial_runs = len(os.listdir(timings))
+        shutil.rmtree(timings)
+        os.makedirs(timings)
+
+        # three SU2 runs at once
+        concurrent = su2_setup(geometry)
+        concurrent.settings.number_of_concurrent_cases = 3
+        concurrent.sample_training()
+
+        AoA, mach = concurrent.training.grid_points.T
+        CL_truth  = 0.1*AoA/Units.deg + mach
+        CD_truth  = 0.01*(AoA/Units.deg)**2 + mach/10.
+        error     = np.max(np.abs(concurrent.training.coefficients - serial.training.coefficients))
+        print('Concurrent training error: ' + str(error))
+        assert error == 0.
+        assert np.all(np.abs(concurrent.training.coefficients[:,0] - CL_truth) < 1e-12)
+        assert np.all(np.abs(concurrent.training.coefficients[:,1] - CD_truth) < 1e-12)
+
+        # each run had its own folder, at most three ran at once and the folders were removed
+        runs = []
+        for name in os.listdir(timings):
+            with open(os.path.join(timings,name)) as f:
+                start, end, folder = f.read().split(' ')
+                runs.append((float(start),float(end),folder))
+        assert serial_runs == len(runs) == 9
+        assert len(set([run[2] for run in runs])) == len(runs)
+        overlap = max([sum([(s <= start) and (start < e) for s, e, _ in runs]) for start, _, _ in runs])
+        print('Largest number of concurrent runs: ' + str(overlap))
+        assert 1 < overlap <= 3
+        assert not [folder for folder in os.listdir('.') if folder.startswith('SU2_' + geometry.tag + '_')]
+
+    finally:
+        os.environ['PATH'] = path
+        os.chdir(origin)
+        shutil.rmtree(work)
+
+    return
+
+def su2_setup(geometry):
+    su2          = SUAVE.Analyses.Aerodynamics.SU2_inviscid()
+    su2.geometry = geometry
+    return su2
+
+if __name__ == '__main__':
+    main()
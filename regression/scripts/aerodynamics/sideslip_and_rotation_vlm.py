@@ -1,7 +1,7 @@
 # sideslip_and_rotation_vlm.py
 # 
 # Created:  July 2021, A. Blaufox
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 # 
 # File to test sideslip and rotation rates (pith, roll, yaw) in VLM
 
@@ -15,6 +15,8 @@ import numpy as np
 import SUAVE
 from SUAVE.Core                                                     import Data, Units
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift           import VLM as VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM       import influence_matrix_cache
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution import vortex_distribution_cache
 from SUAVE.Plots.Geometry.plot_vehicle_vlm_panelization             import plot_vehicle_vlm_panelization
 
 sys.path.append('../Vehicles')
@@ -63,6 +65,22 @@ def main():
         argmax_err = np.argmax(np.abs(errors))
         assert max_err < 1e-6 , print('Failed at {} test, case {}'.format(key, argmax_err+1))
     
+    # a second evaluation reuses the vortex distribution and the factored influence matrix of each mach number
+    hits    = influence_matrix_cache.hits
+    VD_hits = vortex_distribution_cache.hits
+    data_2  = VLM(conditions, settings, geometry)
+    assert influence_matrix_cache.hits - hits == len(np.unique(conditions.freestream.mach_number))
+    assert vortex_distribution_cache.hits - VD_hits == 1
+    assert data_2.VD is data.VD
+    assert np.all(data_2.CL == data.CL)
+    
+    # changing the geometry generates a new vortex distribution
+    VD_misses = vortex_distribution_cache.misses
+    geometry.wings.main_wing.Segments[0].twist += 1. * Units.degrees
+    data_3    = VLM(conditions, settings, geometry)
+    assert vortex_distribution_cache.misses - VD_misses == 1
+    assert np.all(data_3.CL != data.CL)
+    
     return
 
 # ----------------------------------------------------------------------
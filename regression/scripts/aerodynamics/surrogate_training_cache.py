@@ -0,0 +1,101 @@
+# surrogate_training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+#
+# File to test the on-disk cache of the vortex lattice surrogate training data
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import sys
+import os
+import shutil
+import tempfile
+import numpy as np
+
+import SUAVE
+from SUAVE.Core                                                     import Units
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM       import influence_matrix_cache
+
+sys.path.append('../Vehicles')
+
+from Boeing_737  import vehicle_setup   as b737_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+
+    cache_directory = tempfile.mkdtemp()
+    try:
+        vehicle = b737_setup()
+
+        # the first analysis samples the training data and saves it
+        aerodynamics_1 = analysis_setup(vehicle,cache_directory)
+        aerodynamics_1.initialize()
+        assert len(os.listdir(cache_directory)) == 1
+
+        # an analysis of the same vehicle loads the training data without running the vortex lattice
+        misses         = influence_matrix_cache.misses
+        hits           = influence_matrix_cache.hits
+        aerodynamics_2 = analysis_setup(vehicle,cache_directory)
+        aerodynamics_2.initialize()
+        assert influence_matrix_cache.misses == misses and influence_matrix_cache.hits == hits
+        assert 'vortex_distribution' in vehicle
+
+        training_1 = aerodynamics_1.process.compute.lift.inviscid_wings.training
+        training_2 = aerodynamics_2.process.compute.lift.inviscid_wings.training
+        for key in ['lift_coefficient_sub','drag_coefficient_sub']:
+            assert np.all(training_1[key] == training_2[key])
+        for wing in vehicle.wings.keys():
+            assert np.all(training_1.wing_lift_coefficient_sub[wing] == training_2.wing_lift_coefficient_sub[wing])
+            assert np.all(training_1.wing_drag_coefficient_sub[wing] == training_2.wing_drag_coefficient_sub[wing])
+
+        # the surrogates of both analyses agree
+        state_1 = get_state()
+        state_2 = get_state()
+        aerodynamics_1.process.compute.lift.inviscid_wings.evaluate(state_1,aerodynamics_1.settings,vehicle)
+        aerodynamics_2.process.compute.lift.inviscid_wings.evaluate(state_2,aerodynamics_2.settings,vehicle)
+        CL_1    = state_1.conditions.aerodynamics.lift_coefficient
+        CL_2    = state_2.conditions.aerodynamics.lift_coefficient
+        assert np.all(CL_1 == CL_2)
+        print('Cached surrogate lift coefficients: ', CL_2.flatten())
+
+        # changing the geometry samples the training data again
+        vehicle.wings.main_wing.Segments[0].twist += 1. * Units.degrees
+        misses         = influence_matrix_cache.misses
+        aerodynamics_3 = analysis_setup(vehicle,cache_directory)
+        aerodynamics_3.initialize()
+        assert influence_matrix_cache.misses > misses
+        assert len(os.listdir(cache_directory)) == 2
+        training_3 = aerodynamics_3.process.compute.lift.inviscid_wings.training
+        assert np.all(training_3.lift_coefficient_sub != training_1.lift_coefficient_sub)
+
+    finally:
+        shutil.rmtree(cache_directory)
+
+    return
+
+# ----------------------------------------------------------------------
+#   Setup Functions
+# ----------------------------------------------------------------------
+def analysis_setup(vehicle,cache_directory):
+    aerodynamics          = SUAVE.Analyses.Aerodynamics.Fidelity_Zero()
+    aerodynamics.geometry = vehicle
+    aerodynamics.settings.number_spanwise_vortices  = 7
+    aerodynamics.settings.number_chordwise_vortices = 2
+    aerodynamics.process.compute.lift.inviscid_wings.training_cache_directory = cache_directory
+
+    return aerodynamics
+
+def get_state():
+    state                                            = SUAVE.Analyses.Mission.Segments.Conditions.State()
+    state.conditions                                 = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    state.conditions.freestream.mach_number          = np.array([[0.3],[0.6],[0.78]])
+    state.conditions.aerodynamics.angle_of_attack    = np.array([[0.],[2.],[4.]]) * Units.degrees
+
+    return state
+
+if __name__ == '__main__':
+    main()
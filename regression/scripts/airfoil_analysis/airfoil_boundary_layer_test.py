@@ -0,0 +1,88 @@
+# airfoil_boundary_layer_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the boundary layer of the airfoil panel method, all (angle of attack, Reynolds number)
+    cases are marched along the surface together. The truth values are from the per-case solution with
+    the SciPy ODE solver at tight tolerances"""
+
+#----------------------------------------------------------------------
+#   Imports
+# ---------------------------------------------------------------------
+from SUAVE.Core import Units
+from SUAVE.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis      import airfoil_analysis
+from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.compute_naca_4series \
+     import  compute_naca_4series
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+    # Define Panelization
+    npanel = 200
+
+    # -----------------------------------------------
+    # Batch analysis of single airfoil - NACA 2410
+    # -----------------------------------------------
+    Re_batch           = np.atleast_2d(np.array([1E5,2E5,3E5])).T
+    AoA_batch          = np.atleast_2d(np.array([0.,2.,4.,6.])*Units.degrees).T
+    airfoil_geometry   = compute_naca_4series(0.02,0.4,0.1,npoints=npanel)
+
+    ti                 = time.time()
+    airfoil_properties = airfoil_analysis(airfoil_geometry,AoA_batch,Re_batch, npanel, batch_analysis = True)
+    print('Batch analysis of ' + str(len(AoA_batch)*len(Re_batch)) + ' cases : ' + str(time.time() - ti) + ' s')
+
+    # boundary layer at both ends of the surface
+    theta_truth      = np.array([[[0.00321476, 0.00427876],[0.00227318, 0.00302554],[0.00185604, 0.00247034]],
+                                 [[0.00279967, 0.00494492],[0.00197967, 0.00349658],[0.00161639, 0.        ]],
+                                 [[0.00248048, 0.00583385],[0.00175396, 0.        ],[0.00143211, 0.00373738]],
+                                 [[0.0022196 , 0.00707662],[0.00156949, 0.        ],[0.00128148, 0.00490986]]])
+    delta_star_truth = np.array([[[0.00661081, 0.00889904],[0.00467455, 0.00629257],[0.00381675, 0.00513786]],
+                                 [[0.00565783, 0.01029891],[0.00400069, 0.00728243],[0.00326655, 0.        ]],
+                                 [[0.00461991, 0.01216163],[0.00326677, 0.        ],[0.0026673 , 0.01121214]],
+                                 [[0.00553293, 0.0147616 ],[0.00391237, 0.        ],[0.00319444, 0.01472958]]])
+    H_truth          = np.array([[[2.05639024, 2.07981645],[2.05639025, 2.07981645],[2.05639025, 2.07981645]],
+                                 [[2.02088966, 2.08272608],[2.02088966, 2.08272608],[2.02088966, 0.        ]],
+                                 [[1.86250398, 2.08466693],[1.86250398, 0.        ],[1.86250398, 3.        ]],
+                                 [[2.49276319, 2.08596735],[2.49276319, 0.        ],[2.49276319, 3.        ]]])
+    Cf_truth         = np.array([[[0.02239176, 6.64295737e-02],[0.01583336, 4.69728021e-02],[0.01292789, 3.83531323e-02]],
+                                 [[0.01189766, 8.98913281e-02],[0.00841292, 6.35627677e-02],[0.00686912, 0.              ]],
+                                 [[0.00368597, 1.21542422e-01],[0.00260637, 0.              ],[0.00212809, 1.55981073e-04]],
+                                 [[0.00271697, 1.66289976e-01],[0.00192119, 0.              ],[0.00156865, 1.99374597e-04]]])
+    Cd_truth         = np.array([[0.00559429, 0.00430038, 0.00370889],
+                                 [0.00826678, 0.00693405, 0.00934662],
+                                 [0.01268771, 0.0159116 , 0.00355936],
+                                 [0.0194757 , 0.02326462, 0.00751412]])
+
+    for name, truth in [('theta',theta_truth),('delta_star',delta_star_truth),('H',H_truth),('Cf',Cf_truth)]:
+        results = np.ma.getdata(airfoil_properties[name])[:,:,[0,-1]]
+        error   = np.max(np.abs(results - truth)/np.maximum(np.abs(truth),1E-6))
+        print(name + ' error : ' + str(error))
+        assert error < 1e-3
+
+    error = np.max(np.abs(airfoil_properties.Cd - Cd_truth)/Cd_truth)
+    print('Cd error : ' + str(error))
+    assert error < 1e-3
+
+    # -----------------------------------------------
+    # Single condition analysis gives the same cases
+    # -----------------------------------------------
+    Re_vals            = np.atleast_2d(np.array([1E5,2E5,3E5])).T
+    AoA_vals           = np.atleast_2d(np.array([0.,2.,6.])*Units.degrees).T
+    single_properties  = airfoil_analysis(airfoil_geometry,AoA_vals,Re_vals, npanel, batch_analysis = False, airfoil_stations = [0,0,0])
+
+    for name in ['theta','delta','delta_star','H','Cf']:
+        results = np.ma.getdata(single_properties[name])
+        truth   = np.ma.getdata(airfoil_properties[name])[[0,1,3],[0,1,2],:]
+        error   = np.max(np.abs(results - truth)/np.maximum(np.abs(truth),1E-6))
+        print(name + ' single condition difference : ' + str(error))
+        assert error < 1e-6
+
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+# atmosphere_vectorized.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression and benchmark for the vectorized US 1976 standard atmosphere, the values are compared
+    against the US_Standard_1976 analysis and the evaluations per second of both are timed"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+
+import numpy as np
+import timeit
+import warnings
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    vectorized = SUAVE.Analyses.Atmospheric.US_Standard_1976_Vectorized()
+    vectorized.initialize()
+
+    # test elevations -3 km <= z <= 90 km, including the breaks
+    z = np.hstack([np.linspace(-3,90,100),atmosphere.breaks.altitude/Units.km]) * Units.km
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for temperature_deviation, var_gamma in [(0.,False),(15.,False),(-10.,True)]:
+            truth   = atmosphere.compute_values(z,temperature_deviation,var_gamma)
+            results = vectorized.compute_values(z,temperature_deviation,var_gamma)
+            for key in truth.keys():
+                if key == 'tag': continue
+                error = np.max(np.abs(results[key] - truth[key]) / np.abs(truth[key]))
+                print('%-22s relative difference = %.4e' % (key,error))
+                assert(error < 1e-12)
+
+    # single precision output
+    vectorized.settings.single_precision = True
+    results = vectorized.compute_values(np.linspace(0.,10.,16) * Units.km)
+    assert(results.density.dtype == np.float32)
+    vectorized.settings.single_precision = False
+
+    # evaluations per second, a mission segment and a large sweep
+    print('Evaluations per second, US_Standard_1976 and US_Standard_1976_Vectorized:')
+    for points in [16,10000]:
+        z     = np.linspace(0.,12.,points)[:,None] * Units.km
+        rates = Data()
+        rates.standard   = evaluation_rate(atmosphere,z)
+        rates.vectorized = evaluation_rate(vectorized,z)
+        print(points,'points:',int(rates.standard),int(rates.vectorized))
+        assert(rates.vectorized > rates.standard)
+
+    return
+
+def evaluation_rate(atmosphere,z,number=200):
+
+    times = timeit.repeat(lambda: atmosphere.compute_values(z,5.),number=number,repeat=5)
+
+    return number / min(times)
+
+if __name__ == '__main__':
+    main()
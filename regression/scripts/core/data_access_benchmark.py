@@ -0,0 +1,149 @@
+# data_access_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression and microbenchmark for the attribute access of Data and DataOrdered, the dot and key
+    access, copying and pickling are checked and the access is timed against the lookup that treats
+    every missing key as an exception"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, DataOrdered, Container
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+import numpy as np
+import pickle
+import copy
+import timeit
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    semantics_test()
+
+    timing = benchmark()
+
+    print('Access times in microseconds, exception lookup and current:')
+    print(timing)
+
+    # method lookups no longer raise an exception, key access is not slower
+    assert(timing.method_lookup.current < 0.8 * timing.method_lookup.exception)
+    assert(timing.key_write.current     < 0.8 * timing.key_write.exception)
+    assert(timing.key_read.current      < 1.2 * timing.key_read.exception)
+
+    return
+
+def semantics_test():
+
+    # keys and object attributes
+    conditions = Conditions()
+    conditions.expand_rows(4)
+    conditions.mass = np.ones((4,1))
+    assert(conditions['mass'] is conditions.mass)
+    assert(conditions._size == 4)
+    assert('_size' not in conditions)
+    assert(np.all(conditions.ones_row(2) == 1.))
+
+    # a key is found before an attribute of the same name
+    data = Data()
+    data['items_list'] = 1
+    data.keys_found    = data.keys()
+    assert(data.items_list == 1)
+    assert(callable(data.items))
+
+    # missing keys and attributes
+    try:
+        data.missing_key
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError('missing key did not raise an AttributeError')
+    assert(getattr(data,'missing_key',None) is None)
+    assert(not hasattr(data,'missing_key'))
+
+    del data.items_list
+    assert('items_list' not in data)
+
+    # copying and pickling keep the keys and the attributes
+    for new in (copy.deepcopy(conditions),pickle.loads(pickle.dumps(conditions))):
+        assert(isinstance(new,Conditions))
+        assert(np.all(new.mass == conditions.mass))
+        assert(new._size == 4)
+
+    # ordered data and containers
+    ordered = DataOrdered()
+    ordered.b = 2
+    ordered.a = 1
+    assert(ordered.keys() == ['b','a'])
+    assert(ordered[0] == 2)
+    ordered = pickle.loads(pickle.dumps(ordered))
+    assert(ordered.keys() == ['b','a'])
+
+    container = Container()
+    container.append(Data(tag='first'))
+    assert(container.first.tag == 'first')
+
+    return
+
+def benchmark():
+
+    conditions = Conditions()
+    conditions.mass = np.ones((4,1))
+
+    legacy = Exception_Conditions()
+    legacy.mass = np.ones((4,1))
+
+    def method_lookup(data):
+        return lambda: data.ones_row
+
+    def key_read(data):
+        return lambda: data.mass
+
+    def key_write(data):
+        mass = data.mass
+        def write():
+            data.mass = mass
+        return write
+
+    timing = Data()
+    for name, test in [('method_lookup',method_lookup),('key_read',key_read),('key_write',key_write)]:
+        timing[name] = Data()
+        timing[name].exception = best_time(test(legacy))
+        timing[name].current   = best_time(test(conditions))
+
+    return timing
+
+def best_time(function,number=20000):
+
+    return min(timeit.repeat(function,number=number,repeat=7)) / number * 1e6
+
+# ----------------------------------------------------------------------
+#   Exception lookup
+# ----------------------------------------------------------------------
+
+class Exception_Conditions(Conditions):
+    """ Conditions with the attribute access that tries the key and catches the exception
+    """
+
+    def __getattribute__(self, k):
+        try:
+            return dict.__getitem__(self,k)
+        except:
+            return object.__getattribute__(self,k)
+
+    def __setattr__(self, k, v):
+        try:
+            object.__getattribute__(self, k)
+        except:
+            self[k] = v
+        else:
+            object.__setattr__(self, k, v)
+
+if __name__ == '__main__':
+    main()
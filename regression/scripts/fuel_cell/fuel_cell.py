@@ -12,8 +12,10 @@ from SUAVE.Components.Energy.Storages.Batteries import Battery
 from SUAVE.Core import Units, Data
 from SUAVE.Core import Data
 from SUAVE.Methods.Power.Fuel_Cell.Discharge import larminie, setup_larminie, zero_fidelity
+from SUAVE.Methods.Power.Fuel_Cell.Discharge import find_current_density_larminie, find_power_diff_larminie
 from SUAVE.Methods.Power.Fuel_Cell.Sizing import initialize_from_power, initialize_larminie_from_power
 import numpy as np
+import scipy as sp
 import matplotlib.pyplot as plt
 
 
@@ -49,10 +51,19 @@ def main():
     err_mdot1      = (mdot1 - mdot1_truth)/mdot1_truth
     
     
+    # many control points at once against the bounded minimizer at each point
+    lb             = .1*Units.mA/(Units.cm**2.)
+    ub             = 1200.0*Units.mA/(Units.cm**2.)
+    powers         = np.atleast_2d(np.linspace(1., 250., 20)).T
+    current        = find_current_density_larminie(fuel_cell, powers, lb, ub)
+    current_truth  = np.array([[sp.optimize.fminbound(find_power_diff_larminie, lb, ub, args=(fuel_cell, p))] for p in powers[:,0]])
+    err_current    = np.max(np.abs(current - current_truth)/current_truth)
+    
     err       = Data()
     err.fuel_cell_mass_error          = err_m0
     err.fuel_cell_fidelity_zero_error = err_mdot0
     err.fuel_cell_larminie_error      = err_mdot1
+    err.fuel_cell_current_error       = err_current
     for k,v in list(err.items()):
         assert(np.abs(v)<1E-6)    
     print(err)
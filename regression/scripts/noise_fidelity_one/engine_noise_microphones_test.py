@@ -0,0 +1,101 @@
+# engine_noise_microphones_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the SAE turbofan jet noise model evaluated at several microphones at once. The levels of
+    each microphone are compared against the levels of the microphone evaluated on its own
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Noise.Fidelity_One.Engine import noise_SAE
+import numpy as np
+import sys
+
+sys.path.append('../Vehicles')
+from Boeing_737 import vehicle_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    vehicle  = vehicle_setup()
+    turbofan = vehicle.networks.turbofan
+    settings = SUAVE.Analyses.Noise.Fidelity_One().settings
+    n_cpts   = 12
+
+    turbofan.fan.rotation              = 0.
+    turbofan.core_nozzle.noise_speed   = np.atleast_2d(np.linspace(400.,450.,n_cpts)).T
+    turbofan.fan_nozzle.noise_speed    = np.atleast_2d(np.linspace(280.,300.,n_cpts)).T
+
+    # distances and polar angles of three microphones
+    distances = np.array([np.linspace(2000.,300.,n_cpts),np.linspace(1500.,600.,n_cpts),np.linspace(900.,100.,n_cpts)]).T
+    angles    = np.array([np.linspace(0.3,2.5,n_cpts),np.linspace(0.5,2.9,n_cpts),np.linspace(1.2,1.6,n_cpts)]).T
+
+    # all microphones at once
+    noise = noise_SAE(turbofan,segment_setup(n_cpts,distances,angles),None,vehicle,settings)
+    assert noise.SPL_spectrum.shape == (n_cpts,3,24)
+    assert noise.SPL_dBA.shape      == (n_cpts,3)
+
+    # one microphone at a time
+    for i in range(3):
+        single = noise_SAE(turbofan,segment_setup(n_cpts,distances[:,i],angles[:,i]),None,vehicle,settings)
+        assert np.all(noise.SPL_spectrum[:,i] == single.SPL_spectrum)
+        assert np.all(noise.SPL_dBA[:,i]      == single.SPL_dBA)
+        assert noise.EPNL_total[i]  == single.EPNL_total
+        assert noise.SENEL_total[i] == single.SENEL_total
+
+    # regression of the levels of the first microphone
+    EPNL_true  = 80.78414589547477
+    SENEL_true = 76.01977948542078
+    print('EPNL  : ' + str(noise.EPNL_total[0]))
+    print('SENEL : ' + str(noise.SENEL_total[0]))
+    assert np.abs((noise.EPNL_total[0]  - EPNL_true)/EPNL_true)   < 1e-6
+    assert np.abs((noise.SENEL_total[0] - SENEL_true)/SENEL_true) < 1e-6
+
+    return
+
+def segment_setup(n_cpts,distances,angles):
+    """ conditions of a climb out of a turbofan aircraft, with the distances and polar angles of the microphones
+    """
+
+    ones       = np.ones((n_cpts,1))
+    segment    = Data()
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.expand_rows(n_cpts)
+
+    conditions.noise = Data()
+    conditions.noise.sources = Data()
+    conditions.noise.sources.turbofan = Data()
+    conditions.noise.sources.turbofan.core = Data()
+    conditions.noise.sources.turbofan.fan  = Data()
+    conditions.noise.sources.turbofan.core.exit_stagnation_temperature = np.atleast_2d(np.linspace(700.,800.,n_cpts)).T
+    conditions.noise.sources.turbofan.core.exit_stagnation_pressure    = np.atleast_2d(np.linspace(1.5e5,1.7e5,n_cpts)).T
+    conditions.noise.sources.turbofan.fan.exit_stagnation_temperature  = np.atleast_2d(np.linspace(320.,340.,n_cpts)).T
+    conditions.noise.sources.turbofan.fan.exit_stagnation_pressure     = np.atleast_2d(np.linspace(1.3e5,1.4e5,n_cpts)).T
+
+    conditions.freestream.velocity          = 80. * ones
+    conditions.freestream.altitude          = np.atleast_2d(np.linspace(0.,300.,n_cpts)).T
+    conditions.freestream.speed_of_sound    = np.atleast_2d(np.linspace(340.,338.,n_cpts)).T
+    conditions.freestream.density           = np.atleast_2d(np.linspace(1.225,1.19,n_cpts)).T
+    conditions.freestream.dynamic_viscosity = 1.8e-5 * ones
+    conditions.freestream.temperature       = np.atleast_2d(np.linspace(288.,286.,n_cpts)).T
+    conditions.freestream.pressure          = np.atleast_2d(np.linspace(101325.,97000.,n_cpts)).T
+    conditions.aerodynamics.angle_of_attack = 5. * Units.degrees * ones
+    conditions.frames.inertial.time         = np.atleast_2d(np.linspace(0.,30.,n_cpts)).T
+
+    segment.conditions = conditions
+    segment.dist       = distances
+    segment.theta      = angles
+    segment.phi        = np.zeros(n_cpts)
+
+    return segment
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# noise_metrics_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the noise metrics of several noise components and microphones evaluated at once. The metrics
+    are compared against the metrics of each time history evaluated on its own
+"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import compute_noise_metrics, pnl_noise, noise_tone_correction, \
+     epnl_noise, senel_noise
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    # spectra of a flyover, 3 noise components at 4 microphones with 20 time steps and 24 bands
+    n_steps   = 20
+    time      = np.linspace(-1.,1.,n_steps)
+    bands     = np.arange(24)
+    distances = np.array([150.,300.,600.,1200.])
+    SPL       = np.zeros((3,4,n_steps,24))
+    for i in range(3):
+        for j in range(4):
+            SPL[i,j] = 100. + 10.*i - 20.*np.log10(distances[j]/150.) - 15.*np.abs(time)[:,None] \
+                       - 0.05*(bands - 12. - 2.*i)**2
+
+    # a tone in the 1 kHz band of the first component during the later half of the flyover
+    SPL[0,:,n_steps//2:,13] += 10.
+
+    metrics = compute_noise_metrics(SPL)
+    assert metrics.PNLT.shape == (3,4,n_steps)
+    assert metrics.EPNL.shape == (3,4)
+
+    # each time history on its own
+    for i in range(3):
+        for j in range(4):
+            assert np.all(metrics.PNL[i,j]             == pnl_noise(SPL[i,j]))
+            assert np.all(metrics.tone_correction[i,j] == noise_tone_correction(SPL[i,j]))
+            assert metrics.EPNL[i,j]  == epnl_noise(metrics.PNLT[i,j])
+            assert metrics.SENEL[i,j] == senel_noise(metrics.SPL_dBA_max[i,j])
+
+    # the tone is corrected at every time step where it is present
+    assert np.all(metrics.tone_correction[0,:,:n_steps//2] == 0.)
+    assert np.all(metrics.tone_correction[0,:,n_steps//2:] > 0.)
+
+    # regression of the metrics of the first component at the first microphone
+    EPNL_true  = 119.7957528655696
+    SENEL_true = 114.23629957491528
+    print('EPNL  : ' + repr(metrics.EPNL[0,0]))
+    print('SENEL : ' + repr(metrics.SENEL[0,0]))
+    assert np.abs((metrics.EPNL[0,0]  - EPNL_true)/EPNL_true)   < 1e-6
+    assert np.abs((metrics.SENEL[0,0] - SENEL_true)/SENEL_true) < 1e-6
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -53,6 +53,20 @@ def main():
     
     check_results(payload_range_results)
     
+    # the same diagram with the points spread over worker processes
+    serial_range = np.array(payload_range_results.range)
+    
+    configs, analyses = full_setup()
+    
+    configs.finalize()
+    analyses.finalize()
+    
+    parallel_results = payload_range(configs.base,analyses.missions,cruise_segment_tag,reserves,processes=2)
+    
+    error = np.abs(parallel_results.range[1:] - serial_range[1:]) / serial_range[1:]
+    print('Parallel range errors: ' + str(error))
+    assert(np.all(error < 1e-3))
+    
     return
 
 
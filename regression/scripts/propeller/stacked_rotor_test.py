@@ -0,0 +1,115 @@
+# stacked_rotor_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression and benchmark of the stacked evaluation of the motors and rotors of a network, rotors with
+    the same blades but different rotation rates, orientations and locations are spun in one call. The
+    results are compared against spinning every rotor on its own"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Methods.Propulsion.spin_motors_and_rotors import spin_motors_and_rotors
+
+import numpy as np
+import copy
+import time
+import sys
+
+sys.path.append('../Vehicles/Propellers')
+from APC_10x7_thin_electric import propeller_geometry
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    n_rotors   = 8
+    conditions = simulation_conditions()
+    voltage    = 12. * np.ones((len(conditions.freestream.velocity),1))
+    Cp         = 0.04 + 0.001*np.arange(n_rotors)[None,:] * np.ones_like(voltage)
+
+    motors, rotors = motors_and_rotors(n_rotors)
+
+    # every motor and rotor on its own
+    ti    = time.time()
+    truth = []
+    for i, (motor, rotor) in enumerate(zip(motors,rotors)):
+        motor.inputs.voltage      = voltage
+        motor.inputs.propeller_CP = Cp[:,i,None]
+        motor.omega(conditions)
+        rotor.inputs.omega        = motor.outputs.omega
+        F, Q, P, Cp_r, outputs, etap = rotor.spin(conditions)
+        _, etam = motor.current(conditions)
+        truth.append((F,Q,P,Cp_r,etap,etam,motor.outputs.current))
+    t_single = time.time() - ti
+
+    # all motors and rotors in one call
+    motors, rotors = motors_and_rotors(n_rotors)
+    ti      = time.time()
+    results = spin_motors_and_rotors(motors,rotors,voltage,Cp,conditions)
+    t_stack = time.time() - ti
+    print('Rotors one by one : ' + str(t_single) + ' s, stacked : ' + str(t_stack) + ' s')
+
+    for i in range(n_rotors):
+        F, Q, P, Cp_r, outputs, etap, etam = results[i]
+        for value, true_value in zip((F,Q,P,Cp_r,etap,etam,motors[i].outputs.current),truth[i]):
+            error = np.max(np.abs(value - true_value))/np.max(np.abs(true_value))
+            assert error < 1e-6
+        assert rotors[i].outputs.thrust_coefficient.shape == truth[i][3].shape
+    print('Stacked rotors match the rotors one by one')
+
+    return
+
+def motors_and_rotors(n_rotors):
+    """ Rotors with the same blades at different locations, rotation senses and tilts, each with a motor
+    """
+
+    base_rotor = propeller_geometry()
+
+    motors = []
+    rotors = []
+    for i in range(n_rotors):
+        rotor          = copy.deepcopy(base_rotor)
+        rotor.tag      = 'rotor_' + str(i)
+        rotor.origin   = [[0., 0.3*(i - n_rotors/2), 0.]]
+        rotor.rotation = (-1)**i
+        rotor.orientation_euler_angles = [0., 0.02*i, 0.]
+        rotors.append(rotor)
+
+        motor                  = SUAVE.Components.Energy.Converters.Motor()
+        motor.tag              = 'motor_' + str(i)
+        motor.resistance       = 0.05 + 0.005*i
+        motor.no_load_current  = 0.5
+        motor.speed_constant   = 900. * Units['rpm/volt']
+        motor.propeller_radius = rotor.tip_radius
+        motors.append(motor)
+
+    return motors, rotors
+
+def simulation_conditions():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude=np.array([[0.],[500.],[1000.],[2000.]]) * Units.ft)
+    Vv         = np.array([[5.],[10.],[15.],[20.]])
+    ones       = np.ones_like(Vv)
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.freestream.density           = atmo_data.density
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound
+    conditions.freestream.temperature       = atmo_data.temperature
+    conditions.freestream.mach_number       = Vv/atmo_data.speed_of_sound
+    conditions.freestream.velocity          = Vv
+    conditions.frames.body.transform_to_inertial = np.tile(np.eye(3)[None,:,:],(len(Vv),1,1))
+    conditions.frames.inertial.velocity_vector   = np.hstack([Vv,0*Vv,0*Vv])
+    conditions.propulsion.throttle               = ones
+
+    return conditions
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# mach_inversion_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the element-wise inversions of the compressible flow relations used by the nozzles,
+    combustors and ramjet/scramjet networks. The truth values are from fsolve on one element at a time"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods.Propulsion import fm_solver, rayleigh, mach_area, exit_Mach_shock
+
+import numpy as np
+from scipy.optimize import fsolve
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    rng   = np.random.RandomState(1)
+    n     = 200
+    gamma = 1.3 + 0.1*rng.rand(n)
+
+    # area-Mach relation from subsonic and supersonic inlet Mach numbers
+    M0         = np.concatenate([0.1 + 0.8*rng.rand(n//2),1.2 + 2.*rng.rand(n//2)])
+    area_ratio = 1.1 + rng.rand(n)
+    ti         = time.time()
+    M1         = fm_solver(area_ratio,M0,gamma)
+    print('fm_solver, ' + str(n) + ' elements : ' + str(time.time() - ti) + ' s')
+    fm         = lambda M1,AR,M0,g: M0/M1*((1.+(g-1.)/2.*M1*M1)/(1.+(g-1.)/2.*M0*M0))**((g+1.)/(2.*(g-1.)))-AR
+    truth      = [fsolve(fm,[0.1 if M0[i] < 1. else 1.1],args=(area_ratio[i],M0[i],gamma[i]),xtol=1E-13,factor=0.1,full_output=1) for i in range(n)]
+    check('fm_solver',M1,truth,fm(M1,area_ratio,M0,gamma))
+    assert np.all((M1 < 1.) == (M0 < 1.))
+
+    # Rayleigh flow, heated below the thermal choking limit
+    TtR_max  = (1.+gamma*M0*M0)**2./((2.*(1.+gamma)*M0*M0)*(1.+(gamma-1.)/2.*M0*M0))
+    TtR      = 1. + 0.9*rng.rand(n)*(TtR_max - 1.)
+    M1, Ptr  = rayleigh(gamma,M0,TtR)
+    rl       = lambda M1,g,M0,T: (1.+g*M0*M0)**2.*M1*M1*(1.+(g-1.)/2.*M1*M1)/((1.+g*M1*M1)**2.*M0*M0*(1.+(g-1.)/2.*M0*M0))-T
+    truth    = [fsolve(rl,[0.01 if M0[i] <= 1. else 1.1],args=(gamma[i],M0[i],TtR[i]),xtol=1E-13,factor=0.1,full_output=1) for i in range(n)]
+    check('rayleigh',M1,truth,rl(M1,gamma,M0,TtR))
+
+    # isentropic nozzle area ratio, one column of control points
+    for subsonic in [True,False]:
+        Me    = mach_area(2.,np.atleast_2d(gamma).T,subsonic)
+        ma    = lambda Me,g: 4. - ((1./Me)**2.)*(((2./(g+1.))*(1.+((g-1.)/2.)*Me**2.))**((g+1.)/((g-1.))))
+        truth = [fsolve(ma,[0.01 if subsonic else 2.],args=(g,),xtol=1E-13,factor=0.1,full_output=1) for g in gamma]
+        assert Me.shape == (n,1)
+        check('mach_area, subsonic ' + str(subsonic),Me[:,0],truth,ma(Me[:,0],gamma)/4.)
+
+    # exit Mach number with a shock in the nozzle
+    Pt_out = 2. + rng.rand(n)
+    Me     = exit_Mach_shock(2.,gamma,Pt_out,1.)
+    es     = lambda Me,g,Pt: Pt/2.-(((g+1.)/2.)**((g+1.)/(2.*(g-1.))))*Me*((1.+(g-1.)/2.*Me**2.)**0.5)
+    truth  = [fsolve(es,[0.1],args=(gamma[i],Pt_out[i]),xtol=1E-13,full_output=1) for i in range(n)]
+    check('exit_Mach_shock',Me,truth,es(Me,gamma,Pt_out))
+
+    return
+
+def check(name,value,fsolve_results,residual):
+    converged = np.array([result[2] == 1 for result in fsolve_results])
+    truth     = np.array([result[0][0] for result in fsolve_results])
+    error     = np.max(np.abs(value - truth)[converged]/truth[converged])
+    print(name + ' error : ' + str(error) + ', fsolve converged on ' + str(np.sum(converged)) + ' of ' + str(len(truth)))
+    assert error < 1e-9
+    assert np.max(np.abs(residual)) < 1e-10
+
+if __name__ == '__main__':
+    main()
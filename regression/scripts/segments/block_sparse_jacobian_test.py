@@ -0,0 +1,103 @@
+# block_sparse_jacobian_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the graph colored block sparse Jacobian used by converge_root, run
+    on the Boeing 737 segment test mission and compared against the dense finite difference Jacobian"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data
+
+import numpy as np
+
+from segment_test import full_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    _, dense_evaluations             = evaluate_mission('none')
+    results, evaluations             = evaluate_mission('block_sparse')
+
+    # the sixteen control point cruise needs fewer process evaluations than with the dense Jacobian
+    print('Process evaluations, dense and block sparse:')
+    print(dense_evaluations)
+    print(evaluations)
+    assert(evaluations.cruise_2 < dense_evaluations.cruise_2)
+    assert(sum(evaluations.values()) < sum(dense_evaluations.values()))
+
+    # evaluations made for the Jacobian count against max_evaluations, the segment process
+    # evaluates the iterate process once more after converge
+    assert(evaluations.cruise_non_converged <= 10 + 1)
+    assert(not results.segments.cruise_non_converged.converged)
+
+    # Extract sample values from computation
+    climb_throttle_1   = results.segments.climb_1.conditions.propulsion.throttle[3][0]
+    climb_throttle_5   = results.segments.climb_5.conditions.propulsion.throttle[3][0]
+    climb_throttle_9   = results.segments.climb_9.conditions.propulsion.throttle[3][0]
+    cruise_CL_1        = results.segments.cruise_1.conditions.aerodynamics.lift_coefficient[2][0]
+    descent_throttle_1 = results.segments.descent_1.conditions.propulsion.throttle[3][0]
+    single_pt_CL_1     = results.segments.single_point_1.conditions.aerodynamics.lift_coefficient[0][0]
+    loiter_CL          = results.segments.loiter.conditions.aerodynamics.lift_coefficient[2][0]
+
+    # Truth values, identical to the dense Jacobian solution in segment_test.py
+    climb_throttle_1_truth   = 1.0779171064877817
+    climb_throttle_5_truth   = 1.1836691794281005
+    climb_throttle_9_truth   = 1.2803044387670226
+    cruise_CL_1_truth        = 0.697527528118587
+    descent_throttle_1_truth = 0.09557733021666127
+    single_pt_CL_1_truth     = 0.25119411851114865
+    loiter_CL_truth          = 0.5115243029776504
+
+    # Store errors
+    error = Data()
+    error.climb_throttle_1   = np.max(np.abs(climb_throttle_1     - climb_throttle_1_truth))
+    error.climb_throttle_5   = np.max(np.abs(climb_throttle_5     - climb_throttle_5_truth))
+    error.climb_throttle_9   = np.max(np.abs(climb_throttle_9     - climb_throttle_9_truth))
+    error.cruise_CL_1        = np.max(np.abs(cruise_CL_1          - cruise_CL_1_truth ))
+    error.descent_throttle_1 = np.max(np.abs(descent_throttle_1   - descent_throttle_1_truth))
+    error.single_pt_CL_1     = np.max(np.abs(single_pt_CL_1       - single_pt_CL_1_truth ))
+    error.loiter_CL          = np.max(np.abs(loiter_CL            - loiter_CL_truth ))
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+def evaluate_mission(solver_jacobian):
+
+    configs, analyses = full_setup()
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    # count the process evaluations of each segment
+    evaluations = Data()
+    for segment in mission.segments:
+        segment.state.numerics.solver_jacobian = solver_jacobian
+        evaluations[segment.tag] = 0
+        segment.process.iterate.count_evaluations = count_evaluations(evaluations)
+
+    results = mission.evaluate()
+
+    return results, evaluations
+
+def count_evaluations(evaluations):
+
+    def count(segment):
+        evaluations[segment.tag] += 1
+
+    return count
+
+if __name__ == '__main__':
+    main()
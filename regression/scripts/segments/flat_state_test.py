@@ -0,0 +1,119 @@
+# flat_state_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression for the flat unknowns and residuals used by converge_root, the Boeing 737 segment
+    test mission is solved with the unknowns and residuals kept in flat buffers"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Data, Flat_Layout
+from SUAVE.Analyses.Mission.Segments.Conditions import Unknowns
+
+import numpy as np
+import copy
+
+from segment_test import full_setup, simple_sizing
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    layout_test()
+
+    configs, analyses = full_setup()
+    simple_sizing(configs, analyses)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+
+    for segment in mission.segments:
+        segment.state.numerics.flat_state = True
+
+    results = mission.evaluate()
+
+    # the residual arrays of a converged segment are views into its flat buffer
+    residuals = results.segments.cruise_1.state.residuals
+    layout    = residuals.flat_layout()
+    assert(residuals.forces.base is layout.buffer)
+    assert(np.all(layout.pack() == residuals.pack_array()))
+
+    # Extract sample values from computation
+    climb_throttle_1   = results.segments.climb_1.conditions.propulsion.throttle[3][0]
+    climb_throttle_5   = results.segments.climb_5.conditions.propulsion.throttle[3][0]
+    climb_throttle_9   = results.segments.climb_9.conditions.propulsion.throttle[3][0]
+    cruise_CL_1        = results.segments.cruise_1.conditions.aerodynamics.lift_coefficient[2][0]
+    descent_throttle_1 = results.segments.descent_1.conditions.propulsion.throttle[3][0]
+    single_pt_CL_1     = results.segments.single_point_1.conditions.aerodynamics.lift_coefficient[0][0]
+    loiter_CL          = results.segments.loiter.conditions.aerodynamics.lift_coefficient[2][0]
+
+    # Truth values, identical to the packed solution in segment_test.py
+    climb_throttle_1_truth   = 1.0779171064877817
+    climb_throttle_5_truth   = 1.1836691794281005
+    climb_throttle_9_truth   = 1.2803044387670226
+    cruise_CL_1_truth        = 0.697527528118587
+    descent_throttle_1_truth = 0.09557733021666127
+    single_pt_CL_1_truth     = 0.25119411851114865
+    loiter_CL_truth          = 0.5115243029776504
+
+    # Store errors
+    error = Data()
+    error.climb_throttle_1   = np.max(np.abs(climb_throttle_1     - climb_throttle_1_truth))
+    error.climb_throttle_5   = np.max(np.abs(climb_throttle_5     - climb_throttle_5_truth))
+    error.climb_throttle_9   = np.max(np.abs(climb_throttle_9     - climb_throttle_9_truth))
+    error.cruise_CL_1        = np.max(np.abs(cruise_CL_1          - cruise_CL_1_truth ))
+    error.descent_throttle_1 = np.max(np.abs(descent_throttle_1   - descent_throttle_1_truth))
+    error.single_pt_CL_1     = np.max(np.abs(single_pt_CL_1       - single_pt_CL_1_truth ))
+    error.loiter_CL          = np.max(np.abs(loiter_CL            - loiter_CL_truth ))
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    return
+
+def layout_test():
+
+    unknowns = Unknowns()
+    unknowns.throttle        = np.linspace(0.,1.,8)[:,None]
+    unknowns.body_angle      = np.ones((8,2))
+    unknowns.cruise_distance = 10.
+    unknowns.controls        = Unknowns()
+    unknowns.controls.flaps  = np.arange(3)
+    unknowns.controls.vector = np.array([1.,2.,3.])
+
+    packed = unknowns.pack_array()
+    layout = unknowns.flat_layout()
+
+    # packs in the same order, the float arrays become views into the buffer
+    assert(np.all(layout.pack() == packed))
+    assert(unknowns.throttle.base is layout.buffer)
+    assert(unknowns.flat_layout() is layout)
+
+    # unpacks like unpack_array, replaced arrays are bound to the buffer again
+    unknowns.body_angle = np.zeros((8,2))
+    layout.unpack(2.*packed)
+    check = copy.deepcopy(unknowns)
+    check.unpack_array(2.*packed)
+    assert(np.all(check.pack_array() == 2.*packed))
+    assert(np.all(unknowns.pack_array() == 2.*packed))
+    assert(unknowns.body_angle.base is layout.buffer)
+
+    # a copy, a new key or a new shape is laid out again
+    assert(check.flat_layout() is not layout)
+    unknowns.altitudes = np.ones((8,1))
+    assert(unknowns.flat_layout() is not layout)
+    unknowns.throttle  = np.ones((4,1))
+    assert(len(unknowns.flat_layout().pack()) == len(unknowns.pack_array()))
+
+    return
+
+if __name__ == '__main__':
+    main()
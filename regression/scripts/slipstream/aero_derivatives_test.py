@@ -0,0 +1,86 @@
+# aero_derivatives_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the aerodynamic derivatives of the X-57 cruise segment. The perturbations evaluated as stacked
+    blocks of control points are compared against the perturbations evaluated one at a time, and the forward
+    differences against central differences"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Methods.Flight_Dynamics.Static_Stability.compute_aero_derivatives import compute_aero_derivatives, \
+     evaluate_perturbations, evaluate_perturbation
+
+import numpy as np
+from copy import deepcopy
+
+from slipstream_test import X57_setup
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    configs, analyses = X57_setup(wake_fidelity=0,identical_props=True)
+    configs.finalize()
+    analyses.finalize()
+    mission = analyses.missions.base
+    mission.evaluate()
+    segment = mission.segments.cruise
+
+    # perturbations of pitch, throttle and speed
+    h          = 1e-4
+    conditions = segment.state.conditions
+    pitch      = conditions.frames.body.inertial_rotations[:,1].copy()
+    throttle   = conditions.propulsion.throttle.copy()
+    velocity   = conditions.frames.inertial.velocity_vector.copy()
+
+    def perturb_pitch(conditions,rows):
+        conditions.frames.body.inertial_rotations[rows,1] = pitch*(1+h)
+    def perturb_throttle(conditions,rows):
+        conditions.propulsion.throttle[rows] = throttle*(1+h)
+    def perturb_velocity(conditions,rows):
+        conditions.frames.inertial.velocity_vector[rows] = velocity*(1+h)
+    perturbations = [perturb_pitch,perturb_throttle,perturb_velocity]
+
+    # the stacked blocks against one perturbation at a time
+    stacked  = evaluate_perturbations(segment,deepcopy(segment),perturbations)
+    separate = [evaluate_perturbation(segment,deepcopy(segment),perturb) for perturb in perturbations]
+    prop     = list(conditions.noise.sources.propellers.keys())[0]
+    for block, single in zip(stacked,separate):
+        for result in [block,single]:
+            assert result.frames.inertial.time.shape == conditions.frames.inertial.time.shape
+        for key in ['lift_coefficient','drag_coefficient','moment_coefficient']:
+            change = np.max(np.abs(single.aerodynamics[key] - conditions.aerodynamics[key]))
+            error  = np.max(np.abs(block.aerodynamics[key] - single.aerodynamics[key]))
+            print(key + ' stacked perturbation error: ' + str(error) + ', change: ' + str(change))
+            assert error <= 1e-6*change + 1e-14
+        change = np.max(np.abs(single.noise.sources.propellers[prop].thrust_coefficient - \
+                               conditions.noise.sources.propellers[prop].thrust_coefficient))
+        error  = np.max(np.abs(block.noise.sources.propellers[prop].thrust_coefficient - \
+                               single.noise.sources.propellers[prop].thrust_coefficient))
+        print('thrust_coefficient stacked perturbation error: ' + str(error) + ', change: ' + str(change))
+        assert error <= 1e-3*change + 1e-14
+
+    # forward and central differences agree, the lift of the X-57 hardly changes with speed
+    forward = deepcopy(segment)
+    central = deepcopy(segment)
+    compute_aero_derivatives(forward)
+    compute_aero_derivatives(central,difference_scheme='central')
+    forward = forward.state.conditions.aero_derivatives
+    central = central.state.conditions.aero_derivatives
+    for key in ['dCL_dAlpha','dCM_dAlpha','dCD_dV','dCT_dThrottle','dCP_dThrottle']:
+        assert forward[key].shape == central[key].shape
+        error = np.max(np.abs(forward[key] - central[key])/np.abs(central[key]))
+        print(key + ' forward against central difference: ' + str(error))
+        assert error < 1e-2
+    assert forward.dCL_dV.shape == conditions.aerodynamics.lift_coefficient.shape
+    print('dCL_dAlpha: ' + str(central.dCL_dAlpha[:,0]))
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# wake_induced_velocity_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the velocity induced by the Fidelity One rotor wake, the evaluation points are
+    processed in chunks within a memory budget and on a pool of threads. The induced velocities do not
+    depend on the chunks. The truth values are from the kernel that tiles all points at once"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    WD, VD, cpts = wake_and_evaluation_points()
+
+    # sum of the induced velocities over the evaluation points at two azimuthal stations
+    truth    = dict()
+    truth[0] = np.array([[ 19.377147047039,  25.211851995429,  -9.329058881256],
+                         [  4.788514681356, -24.020525370088,  -7.579020345612]])
+    truth[2] = np.array([[ -7.828284497943,  19.352480250642,   9.958900931126],
+                         [-18.102533889108,   5.25775245384 ,  10.63636589464 ]])
+
+    for azi_start_idx in [0,2]:
+        # all evaluation points in one chunk
+        V_ind = compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=azi_start_idx)
+        error = np.max(np.abs(np.sum(V_ind,axis=1) - truth[azi_start_idx])/np.abs(truth[azi_start_idx]))
+        print('Induced velocity error : ' + str(error))
+        assert error < 1e-9
+
+        # small chunks, on one and on several threads
+        for memory_budget, number_of_threads in [(1E6,1),(1E6,3),(1.,2)]:
+            V_ind_chunks = compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=azi_start_idx,
+                                                         memory_budget=memory_budget,number_of_threads=number_of_threads)
+            assert np.array_equal(V_ind_chunks,V_ind)
+
+    return
+
+def wake_and_evaluation_points(Na=3,cpts=2,B=2,Nr=6,nts=20,n_cp=150):
+    """ Random wake panels with the layout of the Fidelity One wake distribution
+    """
+
+    rng = np.random.RandomState(1)
+    nv  = B*Nr*nts
+
+    WD = Data()
+    for key in ['XA1','YA1','ZA1','XA2','YA2','ZA2','XB1','YB1','ZB1','XB2','YB2','ZB2']:
+        WD[key] = rng.rand(Na,cpts,nv)
+    WD.GAMMA = rng.rand(Na,cpts,nv)
+    WD.reshaped_wake     = Data()
+    WD.reshaped_wake.XA1 = np.zeros((Na,cpts,B,Nr,nts))
+
+    VD      = Data()
+    VD.XC   = rng.rand(n_cp)*2
+    VD.YC   = rng.rand(n_cp)*2
+    VD.ZC   = rng.rand(n_cp)*2
+    VD.n_cp = n_cp
+
+    return WD, VD, cpts
+
+if __name__ == '__main__':
+    main()
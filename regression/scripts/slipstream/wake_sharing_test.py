@@ -0,0 +1,86 @@
+# wake_sharing_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the Fidelity One wake shared by identical rotors, the rotors keep one vortex distribution
+    and their offset from the rotor that was evaluated. The induced velocities of a shared wake are compared
+    against a copy of the vortex distribution that is moved to the rotor"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
+
+import numpy as np
+import copy
+
+from wake_warm_start_test import propeller_setup, simulation_conditions
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    conditions = simulation_conditions()
+    prop       = propeller_setup(warm_start=False)
+    prop.spin(conditions)
+
+    # evaluation points around the rotors
+    rng     = np.random.RandomState(1)
+    VD      = Data()
+    VD.XC   = rng.rand(100)*0.5
+    VD.YC   = rng.rand(100)*1.0 - 0.5
+    VD.ZC   = rng.rand(100)*0.4 - 0.2
+    VD.n_cp = 100
+    cpts    = len(conditions.freestream.velocity)
+
+    # an identical rotor turning the same way, the shared wake against a moved copy of the wake
+    other          = copy.copy(prop)
+    other.origin   = np.array([[0.05, 0.4, -0.02]])
+    other.Wake     = prop.Wake.shared_copy(prop,other)
+    assert other.Wake.vortex_distribution is prop.Wake.vortex_distribution
+
+    moved_wake = copy.deepcopy(prop.Wake)
+    moved_wake.shift_wake_VD(moved_wake.vortex_distribution,other.origin[0] - prop.origin[0])
+    V_truth    = compute_wake_induced_velocity(moved_wake.vortex_distribution,VD,cpts)
+    V_shared   = other.Wake.evaluate_wake_velocities(other,VD,cpts)
+    error      = np.max(np.abs(V_shared - V_truth))/np.max(np.abs(V_truth))
+    print('Shared wake error : ' + str(error))
+    assert error < 1e-10
+
+    # the moved vortex distribution of the shared wake is the moved copy
+    WD = other.Wake.offset_vortex_distribution()
+    for key in ['XA1','YB2','ZA2','GAMMA']:
+        assert np.allclose(WD[key],moved_wake.vortex_distribution[key],rtol=0,atol=1e-12)
+        assert np.allclose(WD.reshaped_wake[key],moved_wake.vortex_distribution.reshaped_wake[key],rtol=0,atol=1e-12)
+
+    # an identical rotor turning the other way has the mirror image of the wake
+    mirrored          = copy.copy(prop)
+    mirrored.origin   = np.array([[0.05, -0.4, -0.02]])
+    mirrored.rotation = -prop.rotation
+    mirrored.Wake     = prop.Wake.shared_copy(prop,mirrored)
+
+    mirrored_wake = mirrored.Wake.offset_vortex_distribution()
+    V_truth       = compute_wake_induced_velocity(mirrored_wake,VD,cpts)
+    V_shared      = mirrored.Wake.evaluate_wake_velocities(mirrored,VD,cpts)
+    error         = np.max(np.abs(V_shared - V_truth))/np.max(np.abs(V_truth))
+    print('Mirrored shared wake error : ' + str(error))
+    assert error < 1e-10
+
+    # a rotor turning the other way at the same origin induces the mirror image of the flow
+    opposite          = copy.copy(prop)
+    opposite.rotation = -prop.rotation
+    opposite.Wake     = prop.Wake.shared_copy(prop,opposite)
+    VD_mirror         = copy.copy(VD)
+    VD_mirror.YC      = 2*prop.origin[0][1] - VD.YC
+    V_mirror          = prop.Wake.evaluate_wake_velocities(prop,VD_mirror,cpts)*np.array([1.,-1.,1.])
+    V_opposite        = opposite.Wake.evaluate_wake_velocities(opposite,VD,cpts)
+    assert np.allclose(V_opposite,V_mirror,rtol=1e-12,atol=0)
+
+    return
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+# wake_treecode_benchmark.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression and benchmark of the treecode for the velocity induced by the Fidelity One rotor wake,
+    the treecode is compared against the direct sum in accuracy and runtime as the wake gets longer"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
+
+import numpy as np
+import time
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    VD = wing_control_points()
+
+    print('time steps, opening angle, direct [s], treecode [s], relative error')
+    for nts in [72,288,576]:
+        WD = helical_wake(nts)
+
+        ti       = time.time()
+        V_direct = compute_wake_induced_velocity(WD,VD,1)
+        t_direct = time.time() - ti
+
+        for opening_angle in [0.,0.3,0.5]:
+            ti     = time.time()
+            V_tree = compute_wake_induced_velocity(WD,VD,1,method='treecode',opening_angle=opening_angle)
+            t_tree = time.time() - ti
+            error  = np.max(np.abs(V_tree - V_direct))/np.max(np.abs(V_direct))
+            print('%4d %4.1f %8.3f %8.3f %10.3e' % (nts,opening_angle,t_direct,t_tree,error))
+
+            # without expansions the treecode is the direct sum
+            if opening_angle == 0.:
+                assert error < 1e-12
+            else:
+                assert error < 1e-2
+
+    # the expansions pay off for long wakes
+    assert t_tree < t_direct
+
+    return
+
+def helical_wake(nts,B=3,Nr=10,R=1.,advance_ratio=0.3,steps_per_rotation=36):
+    """ Helical wake panels of a rotor with the layout of the Fidelity One wake distribution
+    """
+
+    r   = np.linspace(0.2*R,R,Nr+1)[:,None]
+    t   = 2*np.pi*np.arange(nts+1)/steps_per_rotation
+    psi = 2*np.pi*np.arange(B)/B
+
+    # blade, radial station and time step of each panel corner
+    b, i, j = np.meshgrid(np.arange(B),np.arange(Nr),np.arange(nts),indexing='ij')
+
+    WD = Data()
+    for corner, di, dj in [('A1',0,0),('B1',1,0),('B2',1,1),('A2',0,1)]:
+        angle         = t[j + dj] + psi[b]
+        WD['X'+corner] = (advance_ratio*R*t[j + dj]).reshape(1,1,-1)
+        WD['Y'+corner] = (r[i + di,0]*np.cos(angle)).reshape(1,1,-1)
+        WD['Z'+corner] = (r[i + di,0]*np.sin(angle)).reshape(1,1,-1)
+
+    # circulation decaying along the wake
+    r_mid    = (r[i,0] + r[i + 1,0])/2
+    WD.GAMMA = (np.sin(np.pi*r_mid/R)*np.exp(-0.01*j)).reshape(1,1,-1)
+    WD.reshaped_wake     = Data()
+    WD.reshaped_wake.XA1 = np.zeros((1,1,B,Nr,nts))
+
+    return WD
+
+def wing_control_points(n_cp=100,R=1.):
+    """ Control points along the span of a wing behind the rotor
+    """
+
+    VD      = Data()
+    VD.YC   = np.linspace(-2*R,2*R,n_cp)
+    VD.XC   = 0.5*R*np.ones(n_cp)
+    VD.ZC   = -0.1*R*np.ones(n_cp)
+    VD.n_cp = n_cp
+
+    return VD
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# wake_warm_start_test.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+""" regression of the warm start of the Fidelity One rotor wake, the converged wake is reused while the
+    inflow changes less than the convergence tolerance and the convergence starts from the last converged
+    inflow otherwise. The warm started rotor performance is compared against a cold start"""
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import SUAVE
+from SUAVE.Core import Units
+from SUAVE.Analyses.Propulsion.Rotor_Wake_Fidelity_One import Rotor_Wake_Fidelity_One
+
+import numpy as np
+import sys
+
+sys.path.append('../Vehicles/Propellers')
+from APC_10x7_thin_electric import propeller_geometry
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+
+def main():
+
+    conditions = simulation_conditions()
+    prop       = propeller_setup(warm_start=True)
+
+    # first evaluation converges the wake from the fidelity zero inflow
+    T_cold = np.linalg.norm(prop.spin(conditions)[0])
+    print('Cold start iterations : ' + str(prop.Wake.convergence.iterations))
+    assert prop.Wake.convergence.iterations > 1
+
+    # the same inflow and a finite difference step reuse the converged wake
+    for scale in [1., 1. + 1E-7]:
+        prop.inputs.omega = prop.inputs.omega*scale
+        T = np.linalg.norm(prop.spin(conditions)[0])
+        assert prop.Wake.convergence.iterations == 0
+        assert abs(T - T_cold)/T_cold < 1e-6
+    assert prop.Wake.convergence.reused_evaluations == 2
+    assert prop.Wake.convergence.evaluations == 3
+
+    # a new operating point starts from the last converged inflow
+    prop.inputs.omega = prop.inputs.omega*1.05
+    T_warm            = np.linalg.norm(prop.spin(conditions)[0])
+    warm_iterations   = prop.Wake.convergence.iterations
+
+    cold_prop              = propeller_setup(warm_start=False)
+    cold_prop.inputs.omega = prop.inputs.omega
+    T_cold                 = np.linalg.norm(cold_prop.spin(conditions)[0])
+    cold_iterations        = cold_prop.Wake.convergence.iterations
+
+    print('Warm start iterations : ' + str(warm_iterations) + ', cold start iterations : ' + str(cold_iterations))
+    print('Warm start thrust difference : ' + str(abs(T_warm - T_cold)/T_cold))
+    assert 0 < warm_iterations < cold_iterations
+    assert abs(T_warm - T_cold)/T_cold < 1e-3
+
+    return
+
+def propeller_setup(warm_start):
+
+    prop              = propeller_geometry()
+    prop.rotation     = -1
+    prop.origin       = np.array([[0., 0., 0.]])
+    prop.inputs.omega = np.array([[6500 * Units.rpm]])
+
+    prop.Wake                          = Rotor_Wake_Fidelity_One()
+    prop.Wake.semi_prescribed_converge = True
+    prop.Wake.warm_start               = warm_start
+    prop.Wake.verbose                  = False
+    prop.Wake.wake_settings.number_rotor_rotations = 2
+
+    return prop
+
+def simulation_conditions():
+
+    atmosphere = SUAVE.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(altitude=14000 * Units.ft)
+
+    conditions = SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics()
+    conditions.freestream.density           = atmo_data.density
+    conditions.freestream.dynamic_viscosity = atmo_data.dynamic_viscosity
+    conditions.freestream.speed_of_sound    = atmo_data.speed_of_sound
+    conditions.freestream.temperature       = atmo_data.temperature
+
+    Vv = np.array([[ 20 * Units.mph]])
+    conditions.freestream.mach_number = Vv/atmo_data.speed_of_sound
+    conditions.freestream.velocity    = Vv
+    conditions.frames.body.transform_to_inertial = np.array([[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]])
+    conditions.frames.inertial.velocity_vector   = np.array([[Vv[0][0],0,0]])
+    conditions.propulsion.throttle               = np.array([[1]])
+
+    return conditions
+
+if __name__ == '__main__':
+    main()
@@ -6,6 +6,7 @@
 #           Oct 2018, M. Clarke
 #           Aug 2019, M. Clarke
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,6 +16,7 @@
 import SUAVE
 from SUAVE.Core import Units, Data
 from SUAVE.Core import redirect
+from SUAVE.Core.case_pool import run_cases
 
 from SUAVE.Analyses.Mission.Segments.Conditions.Aerodynamics import Aerodynamics
 from SUAVE.Analyses.Mission.Segments.Conditions.Conditions   import Conditions
@@ -24,12 +26,14 @@ from SUAVE.Methods.Aerodynamics.AVL.write_mass_file           import write_mass_
 from SUAVE.Methods.Aerodynamics.AVL.write_run_cases           import write_run_cases
 from SUAVE.Methods.Aerodynamics.AVL.write_input_deck          import write_input_deck
 from SUAVE.Methods.Aerodynamics.AVL.run_analysis              import run_analysis
+from SUAVE.Methods.Aerodynamics.AVL.read_results              import read_results
 from SUAVE.Methods.Aerodynamics.AVL.translate_data            import translate_conditions_to_cases, translate_results_to_conditions
 from SUAVE.Methods.Aerodynamics.AVL.purge_files               import purge_files
 from SUAVE.Methods.Aerodynamics.AVL.Data.Settings             import Settings
 from SUAVE.Methods.Aerodynamics.AVL.Data.Cases                import Run_Case
 from SUAVE.Methods.Geometry.Two_Dimensional.Planform.populate_control_sections   import populate_control_sections  
 from SUAVE.Components.Wings.Control_Surfaces import Aileron , Elevator , Slat , Flap , Rudder 
+from SUAVE.Input_Output.SUAVE.training_cache import fingerprint, load_training_cache, save_training_cache
 
 # Package imports 
 import os 
@@ -89,6 +93,7 @@ class AVL_Inviscid(Aerodynamics):
         self.settings.pitch_rate_coefficient    = 0.0
         self.settings.lift_coefficient          = None
         self.settings.print_output              = False 
+        self.settings.number_of_concurrent_cases = 1
         
         # Regression Status
         self.settings.keep_files                = False
@@ -107,6 +112,9 @@ class AVL_Inviscid(Aerodynamics):
         self.training.span_efficiency_factor    = None
         self.training_file                      = None
         
+        # directory of training data kept between runs, None to always run AVL for the training data
+        self.training_cache_directory           = None
+        
         # Surrogate model
         self.surrogates                         = Data()
 
@@ -188,16 +196,10 @@ class AVL_Inviscid(Aerodynamics):
         drag_model    = surrogates.drag_coefficient
         e_model       = surrogates.span_efficiency_factor
         
-        # Inviscid lift
-        data_len        = len(AoA)
-        inviscid_lift   = np.zeros([data_len,1])
-        inviscid_drag   = np.zeros([data_len,1])    
-        span_efficiency = np.zeros([data_len,1]) 
-        
-        for i,_ in enumerate(AoA): 
-            inviscid_lift[i]   = lift_model(AoA[i][0],Mach[i][0])[0] 
-            inviscid_drag[i]   = drag_model(AoA[i][0],Mach[i][0])[0] 
-            span_efficiency[i] = e_model(AoA[i][0],Mach[i][0])[0] 
+        # Inviscid lift, all control points at once
+        inviscid_lift   = np.atleast_2d(lift_model(AoA[:,0],Mach[:,0],grid=False)).T
+        inviscid_drag   = np.atleast_2d(drag_model(AoA[:,0],Mach[:,0],grid=False)).T
+        span_efficiency = np.atleast_2d(e_model(AoA[:,0],Mach[:,0],grid=False)).T
         
         # Store inviscid lift results     
         conditions.aerodynamics.lift_breakdown.inviscid_wings_lift = Data()
@@ -239,6 +241,8 @@ class AVL_Inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.training_cache_directory (optional - directory of training data from previous runs)
+        self.settings.number_of_concurrent_cases (Mach numbers that are run at once) [-]
         """          
         # Unpack
         run_folder             = os.path.abspath(self.settings.filenames.run_folder)
@@ -261,33 +265,47 @@ class AVL_Inviscid(Aerodynamics):
         CD = np.zeros_like(CL)  
         e  = np.zeros_like(CL)
         
+        # training data of the same geometry, settings and training conditions from previous runs
+        cache_name = None
+        cached     = None
+        if self.training_cache_directory is not None and not self.training_file:
+            key        = fingerprint(geometry,self.settings,AoA,Mach,skip=['vortex_distribution','networks','number_of_concurrent_cases'])
+            cache_name = 'AVL_Inviscid_' + key
+            cached     = load_training_cache(self.training_cache_directory,cache_name)
+        
         # remove old files in run directory
-        if os.path.exists('avl_files'):
+        if os.path.exists('avl_files') and cached is None:
             if not self.settings.regression_flag:
                 rmtree(run_folder)
                 
-        for i,_ in enumerate(Mach):
-            # Set training conditions
-            run_conditions = Aerodynamics()
-            run_conditions.freestream.density                  = atmo_data.density[0,0]  
-            run_conditions.freestream.gravity                  = 9.81        
-            run_conditions.freestream.speed_of_sound           = atmo_data.speed_of_sound[0,0] 
-            run_conditions.freestream.mach_number              = Mach[i]
-            run_conditions.freestream.velocity                 = Mach[i] * run_conditions.freestream.speed_of_sound
-            run_conditions.aerodynamics.side_slip_angle        = side_slip_angle
-            run_conditions.aerodynamics.angle_of_attack        = AoA 
-            run_conditions.aerodynamics.roll_rate_coefficient  = roll_rate_coefficient
-            run_conditions.aerodynamics.lift_coefficient       = lift_coefficient
-            run_conditions.aerodynamics.pitch_rate_coefficient = pitch_rate_coefficient
-            
+        if cached is None:
+            training_conditions = []
+            for i,_ in enumerate(Mach):
+                # Set training conditions
+                run_conditions = Aerodynamics()
+                run_conditions.freestream.density                  = atmo_data.density[0,0]  
+                run_conditions.freestream.gravity                  = 9.81        
+                run_conditions.freestream.speed_of_sound           = atmo_data.speed_of_sound[0,0] 
+                run_conditions.freestream.mach_number              = Mach[i]
+                run_conditions.freestream.velocity                 = Mach[i] * run_conditions.freestream.speed_of_sound
+                run_conditions.aerodynamics.side_slip_angle        = side_slip_angle
+                run_conditions.aerodynamics.angle_of_attack        = AoA 
+                run_conditions.aerodynamics.roll_rate_coefficient  = roll_rate_coefficient
+                run_conditions.aerodynamics.lift_coefficient       = lift_coefficient
+                run_conditions.aerodynamics.pitch_rate_coefficient = pitch_rate_coefficient
+                training_conditions.append(run_conditions)
             
-            #Run Analysis at AoA[i] and Mach[j]
-            results =  self.evaluate_conditions(run_conditions, trim_aircraft)
+            #Run Analysis at AoA[i] and Mach[j], the Mach numbers at once when AVL is run concurrently
+            if self.settings.number_of_concurrent_cases > 1 and not self.settings.regression_flag:
+                all_results = self.evaluate_conditions_concurrently(training_conditions, trim_aircraft)
+            else:
+                all_results = [self.evaluate_conditions(run_conditions, trim_aircraft) for run_conditions in training_conditions]
             
-            # Obtain CD , CL and e
-            CL[:,i] = results.aerodynamics.lift_coefficient[:,0]
-            CD[:,i] = results.aerodynamics.drag_breakdown.induced.total[:,0]      
-            e [:,i] = results.aerodynamics.drag_breakdown.induced.efficiency_factor[:,0]  
+            for i, results in enumerate(all_results):
+                # Obtain CD , CL and e
+                CL[:,i] = results.aerodynamics.lift_coefficient[:,0]
+                CD[:,i] = results.aerodynamics.drag_breakdown.induced.total[:,0]      
+                e [:,i] = results.aerodynamics.drag_breakdown.induced.efficiency_factor[:,0]  
         
         if self.training_file:
             # load data 
@@ -300,6 +318,17 @@ class AVL_Inviscid(Aerodynamics):
             CL = np.reshape(CL_1D, (len_AoA,-1))
             CD = np.reshape(CD_1D, (len_AoA,-1))
             e  = np.reshape(e_1D , (len_AoA,-1))
+        elif cached is not None:
+            CL = cached.lift_coefficient
+            CD = cached.drag_coefficient
+            e  = cached.span_efficiency_factor
+        elif cache_name is not None:
+            # keep the training data for later runs
+            results = Data()
+            results.lift_coefficient       = CL
+            results.drag_coefficient       = CD
+            results.span_efficiency_factor = e
+            save_training_cache(self.training_cache_directory,cache_name,results)
         
         # Save the data for regression
         if self.settings.save_regression_results: 
@@ -378,6 +407,49 @@ class AVL_Inviscid(Aerodynamics):
         Outputs:
         results        <SUAVE data type>
 
+        Properties Used:
+        self.settings.filenames.run_folder
+        self.settings.
+          print_output
+          keep_files
+        self.current_status.cases
+        """           
+        
+        # unpack
+        run_folder   = os.path.abspath(self.settings.filenames.run_folder)
+        print_output = self.settings.print_output
+        
+        # write the input files
+        with redirect.folder(run_folder,force=False):
+            self.write_input_files(run_conditions,trim_aircraft)
+
+            # RUN AVL!
+            results_avl = run_analysis(self,print_output)
+    
+        # translate results
+        results = translate_results_to_conditions(self.current_status.cases,results_avl)
+    
+        if not self.settings.keep_files:
+            rmtree( run_folder )
+            
+        return results
+
+    def write_input_files(self,run_conditions,trim_aircraft):
+        """Writes the geometry, mass, run case and input deck files of AVL into the current folder.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        run_conditions <SUAVE data type> aerodynamic conditions
+        trim_aircraft  <boolean>
+
+        Outputs:
+        AVL input files
+
         Properties Used:
         self.settings.filenames.
           run_folder
@@ -402,7 +474,6 @@ class AVL_Inviscid(Aerodynamics):
         dynamic_results_template_2       = self.settings.filenames.dynamic_output_template_2    # 'system_matrix_{}.dat'
         batch_template                   = self.settings.filenames.batch_template
         deck_template                    = self.settings.filenames.deck_template 
-        print_output                     = self.settings.print_output 
  
         # rename defaul avl aircraft tag
         self.tag                         = 'avl_analysis_of_{}'.format(self.geometry.tag) 
@@ -459,19 +530,61 @@ class AVL_Inviscid(Aerodynamics):
             case.eigen_result_filename_2    = dynamic_results_template_2.format(case.tag)     # 'system_matrix_{}.dat'
         
         # write the input files
-        with redirect.folder(run_folder,force=False):
-            write_geometry(self,run_script_path)
-            write_mass_file(self,run_conditions)
-            write_run_cases(self,trim_aircraft)
-            write_input_deck(self, trim_aircraft,control_surfaces)
+        write_geometry(self,run_script_path)
+        write_mass_file(self,run_conditions)
+        write_run_cases(self,trim_aircraft)
+        write_input_deck(self, trim_aircraft,control_surfaces)
+        
+        return
 
-            # RUN AVL!
-            results_avl = run_analysis(self,print_output)
-    
-        # translate results
-        results = translate_results_to_conditions(cases,results_avl)
-    
-        if not self.settings.keep_files:
-            rmtree( run_folder )
-            
-        return results
+    def evaluate_conditions_concurrently(self,training_conditions,trim_aircraft):
+        """Runs AVL for several sets of conditions at once. Each set of conditions is run in its own
+        folder next to the run folder, and the results are read in order.
+
+        Assumptions:
+        The output of AVL is written to output.log in the folder of each set of conditions
+
+        Source:
+        N/A
+
+        Inputs:
+        training_conditions  list of <SUAVE data type> aerodynamic conditions
+        trim_aircraft        <boolean>
+
+        Outputs:
+        all_results          list of <SUAVE data type>
+
+        Properties Used:
+        self.settings.filenames.
+          run_folder
+          avl_bin_name
+          features
+        self.settings.
+          number_of_concurrent_cases
+          keep_files
+        """
+        run_folder = os.path.abspath(self.settings.filenames.run_folder)
+
+        def write(case):
+            self.write_input_files(case.run_conditions,trim_aircraft)
+            case.command   = [self.settings.filenames.avl_bin_name,self.settings.filenames.features]
+            case.stdin     = self.current_status.deck_file
+            case.avl_cases = self.current_status.cases
+
+        def read(case):
+            self.current_status.cases = case.avl_cases
+            return translate_results_to_conditions(case.avl_cases,read_results(self))
+
+        cases = []
+        for run_conditions in training_conditions:
+            case                = Data()
+            case.run_conditions = run_conditions
+            case.write          = write
+            case.read           = read
+            cases.append(case)
+
+        # the folders of the cases are at the depth of the run folder, so relative paths are unchanged
+        all_results = run_cases(cases,self.settings.number_of_concurrent_cases,os.path.dirname(run_folder),
+                                os.path.basename(run_folder) + '_',self.settings.keep_files)
+
+        return all_results
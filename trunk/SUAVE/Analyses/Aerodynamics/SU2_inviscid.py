@@ -4,6 +4,7 @@
 # Created:  Sep 2016, E. Botero
 # Modified: Jan 2017, T. MacDonald
 #           Apr 2020, M. Clarke
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -15,8 +16,10 @@ from SUAVE.Core import Data, Units
 
 # Local imports
 from .Aerodynamics import Aerodynamics
-from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD
+from SUAVE.Input_Output.SU2.call_SU2_CFD import call_SU2_CFD, read_SU2_history
 from SUAVE.Input_Output.SU2.write_SU2_cfg import write_SU2_cfg
+from SUAVE.Input_Output.SUAVE.training_cache import fingerprint, load_training_cache, save_training_cache
+from SUAVE.Core.case_pool import run_cases
 from sklearn.gaussian_process.kernels import ExpSineSquared
 
 # Package imports
@@ -67,6 +70,7 @@ class SU2_inviscid(Aerodynamics):
         self.settings.parallel           = False
         self.settings.processors         = 1
         self.settings.maximum_iterations = 1500
+        self.settings.number_of_concurrent_cases = 1
 
         # Conditions table, used for surrogate model training
         self.training = Data()        
@@ -76,6 +80,9 @@ class SU2_inviscid(Aerodynamics):
         self.training.drag_coefficient = None
         self.training_file             = None
         
+        # directory of training data kept between runs, None to always run SU2 for the training data
+        self.training_cache_directory  = None
+        
         # Surrogate model
         self.surrogates = Data()
  
@@ -167,7 +174,8 @@ class SU2_inviscid(Aerodynamics):
         """Call methods to run SU2 for sample point evaluation.
 
         Assumptions:
-        None
+        Training data in the training cache is keyed on the geometry, so the mesh is assumed to
+        change only with the geometry.
 
         Source:
         N/A
@@ -186,6 +194,8 @@ class SU2_inviscid(Aerodynamics):
           angle_of_attack  [radians]
           Mach             [-]
         self.training_file (optional - file containing previous AVL data)
+        self.training_cache_directory (optional - directory of training data from previous runs)
+        self.settings.number_of_concurrent_cases (SU2 runs at once, without MPI parallel SU2) [-]
         """               
         # Unpack
         geometry = self.geometry
@@ -197,30 +207,56 @@ class SU2_inviscid(Aerodynamics):
         CL   = np.zeros([len(AoA)*len(mach),1])
         CD   = np.zeros([len(AoA)*len(mach),1])
 
-        # Condition input, local, do not keep (k is used to avoid confusion)
-        konditions              = Data()
-        konditions.aerodynamics = Data()
-
-        if self.training_file is None:
+        # training data of the same geometry, settings and training conditions from previous runs
+        cache_name = None
+        cached     = None
+        if self.training_cache_directory is not None and self.training_file is None:
+            key        = fingerprint(geometry,settings,AoA,mach,skip=['vortex_distribution','inputs','outputs','Wake',
+                                                                         'number_of_concurrent_cases'])
+            cache_name = 'SU2_inviscid_' + key
+            cached     = load_training_cache(self.training_cache_directory,cache_name)
+
+        if cached is not None:
+            xy = cached.grid_points
+            CL = cached.lift_coefficient
+            CD = cached.drag_coefficient
+        elif self.training_file is None:
             # Calculate aerodynamics for table
             table_size = len(AoA)*len(mach)
             xy = np.zeros([table_size,2])
             count = 0
             time0 = time.time()
+            table = []
             for i,_ in enumerate(AoA):
                 for j,_ in enumerate(mach):
                     
                     xy[count,:] = np.array([AoA[i],mach[j]])
-                    # Set training conditions
+                    # Set training conditions, local, do not keep (k is used to avoid confusion)
+                    konditions              = Data()
+                    konditions.aerodynamics = Data()
                     konditions.aerodynamics.angle_of_attack = AoA[i]
                     konditions.aerodynamics.mach            = mach[j]
-                    
-                    CL[count],CD[count] = call_SU2(konditions, settings, geometry)
+                    table.append(konditions)
                     count += 1
             
+            # run the cases at once, unless each SU2 run is already parallel
+            if settings.number_of_concurrent_cases > 1 and not settings.parallel:
+                CL[:,0], CD[:,0] = np.array(call_SU2_concurrently(table, settings, geometry)).T
+            else:
+                for count, konditions in enumerate(table):
+                    CL[count],CD[count] = call_SU2(konditions, settings, geometry)
+            
             time1 = time.time()
             
             print('The total elapsed time to run SU2: '+ str(time1-time0) + '  Seconds')
+            
+            # keep the training data for later runs
+            if cache_name is not None:
+                results = Data()
+                results.grid_points      = xy
+                results.lift_coefficient = CL
+                results.drag_coefficient = CD
+                save_training_cache(self.training_cache_directory,cache_name,results)
         else:
             data_array = np.loadtxt(self.training_file)
             xy         = data_array[:,0:2]
@@ -361,10 +397,47 @@ def call_SU2(conditions,settings,geometry):
     N/A
     """      
 
-    half_mesh_flag = settings.half_mesh_flag
     tag            = geometry.tag
     parallel       = settings.parallel
     processors     = settings.processors 
+    
+    # Build SU2 configuration file
+    write_SU2_case(conditions,settings,geometry)
+    
+    # Run SU2
+    CL, CD = call_SU2_CFD(tag,parallel,processors)
+        
+    return CL, CD
+
+def write_SU2_case(conditions,settings,geometry):
+    """Writes the SU2 configuration file of a training case in the current folder
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions.
+      mach_number        [-]
+      angle_of_attack    [radians]
+    settings.
+      half_mesh_flag     <boolean> Determines if a symmetry plane is used
+      maximum_iterations [-]
+    geometry.
+      tag
+      reference_area     [m^2]
+
+    Outputs:
+    <tag>.cfg
+
+    Properties Used:
+    N/A
+    """      
+
+    half_mesh_flag = settings.half_mesh_flag
+    tag            = geometry.tag
     iters          = settings.maximum_iterations
     
     SU2_settings = Data()
@@ -376,10 +449,55 @@ def call_SU2(conditions,settings,geometry):
     SU2_settings.angle_of_attack = conditions.aerodynamics.angle_of_attack / Units.deg
     SU2_settings.maximum_iterations = iters
     
-    # Build SU2 configuration file
     write_SU2_cfg(tag, SU2_settings)
     
-    # Run SU2
-    CL, CD = call_SU2_CFD(tag,parallel,processors)
-        
-    return CL, CD
+    return
+
+def call_SU2_concurrently(table,settings,geometry):
+    """Calculates lift and drag of several training cases using SU2 runs at once. Each case is
+    run in its own folder, which links the mesh of the geometry.
+
+    Assumptions:
+    The mesh <tag>.su2 is in the current folder. The output of each SU2 run is written
+    to output.log in the folder of the case.
+
+    Source:
+    N/A
+
+    Inputs:
+    table                        list of conditions, see call_SU2
+    settings.
+      number_of_concurrent_cases [-]
+      (passed to write_SU2_case)
+    geometry.
+      tag
+      (passed to write_SU2_case)
+
+    Outputs:
+    results                      list of CL and CD of each case [-]
+
+    Properties Used:
+    N/A
+    """
+
+    tag = geometry.tag
+
+    def write(case):
+        write_SU2_case(case.conditions,settings,geometry)
+
+    def read(case):
+        return read_SU2_history(tag)
+
+    cases = []
+    for conditions in table:
+        case            = Data()
+        case.conditions = conditions
+        case.command    = ['SU2_CFD',tag + '.cfg']
+        case.link       = [tag + '.su2']
+        case.write      = write
+        case.read       = read
+        cases.append(case)
+
+    results = run_cases(cases,settings.number_of_concurrent_cases,prefix='SU2_' + tag + '_')
+
+    return results
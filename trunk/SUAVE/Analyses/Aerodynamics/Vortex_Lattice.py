@@ -12,6 +12,7 @@
 #           Sep 2020, M. Clarke 
 #           May 2021, E. Botero
 #           Jun 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -24,6 +25,8 @@ from SUAVE.Core import Data
 from SUAVE.Core import Units
  
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.VLM import VLM
+from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution import generate_vortex_distribution
+from SUAVE.Input_Output.SUAVE.training_cache import fingerprint, load_training_cache, save_training_cache
 
 # local imports
 from .Aerodynamics import Aerodynamics
@@ -102,6 +105,9 @@ class Vortex_Lattice(Aerodynamics):
         self.training.wing_drag_coefficient_sub      = None
         self.training.wing_drag_coefficient_sup      = None
         
+        # directory of training data kept between runs, None to always sample the training data
+        self.training_cache_directory                = None
+        
         # blending function 
         self.hsub_min                                = 0.85
         self.hsub_max                                = 0.95
@@ -394,6 +400,8 @@ class Vortex_Lattice(Aerodynamics):
         self.geometry.wings.*.tag
         self.settings                 (passed to calculate vortex lattice)
         self.training.angle_of_attack [radians]
+        self.training.Mach            [-]
+        self.training_cache_directory (optional - directory of training data from previous runs)
         """
         # unpack
         geometry      = self.geometry
@@ -405,6 +413,18 @@ class Vortex_Lattice(Aerodynamics):
         sub_len       = int(sum(Mach<1.))
         sup_len       = len(Mach)-sub_len
         
+        # reuse the training data of the same geometry, settings and training conditions. With the
+        # propeller wake model the training data also depends on the state of the rotor wakes
+        cache_name = None
+        if self.training_cache_directory is not None and not settings.propeller_wake_model:
+            key        = fingerprint(geometry,settings,AoA,Mach,skip=['vortex_distribution','networks'])
+            cache_name = 'Vortex_Lattice_' + key
+            cached     = load_training_cache(self.training_cache_directory,cache_name)
+            if cached is not None:
+                training.update(cached)
+                generate_vortex_distribution(geometry,settings)
+                return
+        
         # Assign placeholders        
         CL_sub    = np.zeros((lenAoA,sub_len))
         CL_sup    = np.zeros((lenAoA,sup_len))
@@ -475,6 +495,14 @@ class Vortex_Lattice(Aerodynamics):
         training.wing_drag_coefficient_sub    = CDi_w_sub        
         training.wing_drag_coefficient_sup    = CDi_w_sup
         
+        # keep the training data for later runs
+        if cache_name is not None:
+            cached = Data()
+            for key in ['lift_coefficient_sub','lift_coefficient_sup','wing_lift_coefficient_sub','wing_lift_coefficient_sup',
+                        'drag_coefficient_sub','drag_coefficient_sup','wing_drag_coefficient_sub','wing_drag_coefficient_sup']:
+                cached[key] = training[key]
+            save_training_cache(self.training_cache_directory,cache_name,cached)
+        
         return
         
     def build_surrogate(self):
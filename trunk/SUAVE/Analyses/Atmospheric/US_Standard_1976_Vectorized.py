@@ -0,0 +1,194 @@
+## @ingroup Analyses-Atmospheric
+# US_Standard_1976_Vectorized.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from warnings import warn
+
+from SUAVE.Analyses.Atmospheric import US_Standard_1976
+
+from SUAVE.Attributes.Gases import Air
+from SUAVE.Attributes.Planets import Earth
+
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import atleast_2d_col
+
+# ----------------------------------------------------------------------
+#  Classes
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Atmospheric
+class US_Standard_1976_Vectorized(US_Standard_1976):
+
+    """ Implements the U.S. Standard Atmosphere (1976 version) with the constants of each layer tabulated
+    once. The layer of every altitude is found with a single search on the breaks, so all altitudes are
+    evaluated in one vectorized pass.
+
+    Assumptions:
+    None
+
+    Source:
+    U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+    """
+
+    def __defaults__(self):
+        """This sets the default values for the analysis to function.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        None
+
+        Output:
+        None
+
+        Properties Used:
+        None
+        """
+
+        self.settings.single_precision = False
+        self.layers = Data()
+
+    def initialize(self):
+        """Tabulates the base altitude, temperature, pressure and lapse rate of every layer. The fluid and
+        planet properties are checked once here instead of on every evaluation.
+
+        Assumptions:
+        The layers are found again if the breaks are changed after initialize
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        None
+
+        Output:
+        None
+
+        Properties Used:
+        self.
+          fluid_properties.gas_specific_constant [J/(kg*K)]
+          planet.sea_level_gravity               [m/s^2]
+          breaks.
+            altitude                             [m]
+            temperature                          [K]
+            pressure                             [Pa]
+        """
+
+        if not self.fluid_properties == Air():
+            warn('US Standard Atmosphere not using Air fluid properties')
+        if not self.planet == Earth():
+            warn('US Standard Atmosphere not using Earth planet properties')
+
+        breaks = self.breaks
+        grav   = self.planet.sea_level_gravity
+        R      = self.fluid_properties.gas_specific_constant
+
+        alpha    = -np.diff(breaks.temperature)/np.diff(breaks.altitude)
+        isotherm = alpha == 0.
+
+        layers = Data()
+        layers.altitude    = np.array(breaks.altitude,dtype=float)
+        layers.temperature = np.array(breaks.temperature[:-1],dtype=float)
+        layers.pressure    = np.array(breaks.pressure[:-1],dtype=float)
+        layers.lapse_rate  = alpha
+        layers.isothermal  = isotherm
+        layers.exponent    = np.where(isotherm,0.,grav/(np.where(isotherm,1.,alpha)*R))
+        layers.scale       = grav/(R*layers.temperature)
+
+        self.layers = layers
+
+        return
+
+    def compute_values(self,altitude,temperature_deviation=0.0,var_gamma=False):
+
+        """Computes atmospheric values.
+
+        Assumptions:
+        US 1976 Standard Atmosphere. Altitudes outside the breaks are clipped to the breaks.
+
+        Source:
+        U.S. Standard Atmosphere, 1976, U.S. Government Printing Office, Washington, D.C., 1976
+
+        Inputs:
+        altitude                                 [m]
+        temperature_deviation                    [K]
+
+        Output:
+        atmo_data.
+          pressure                               [Pa]
+          temperature                            [K]
+          speed_of_sound                         [m/s]
+          dynamic_viscosity                      [kg/(m*s)]
+          kinematic_viscosity                    [m^2/s]
+          thermal_conductivity                   [W/(m*K)]
+          prandtl_number                         [-]
+
+        Properties Used:
+        self.
+          settings.single_precision              [boolean]
+          fluid_properties                       [Data]
+          planet.mean_radius                     [m]
+          layers                                 [Data]
+        """
+
+        layers = self.layers
+        if not layers or not np.array_equal(layers.altitude,self.breaks.altitude):
+            self.initialize()
+            layers = self.layers
+
+        gas = self.fluid_properties
+        Rad = self.planet.mean_radius
+        zb  = layers.altitude
+
+        # convert geometric to geopotential altitude
+        zs = atleast_2d_col(altitude)
+        zs = zs/(1 + zs/Rad)
+
+        if np.amin(zs) < zb[0] or np.amax(zs) > zb[-1]:
+            warn('altitude requested outside of the atmospheric model, returning values at the nearest break',RuntimeWarning)
+            zs = np.clip(zs,zb[0],zb[-1])
+
+        # the layer of each altitude, an altitude on a break belongs to the layer above it
+        i  = np.clip(np.searchsorted(zb,zs,side='right') - 1,0,len(zb)-2)
+        dz = zs - zb[i]
+        T0 = layers.temperature[i]
+        a0 = layers.lapse_rate[i]
+
+        p = np.where(layers.isothermal[i],
+                     layers.pressure[i] * np.exp(-1.*dz*layers.scale[i]),
+                     layers.pressure[i] * (1.-a0*dz/T0)**layers.exponent[i])
+        T = T0 - dz*a0 + temperature_deviation
+
+        rho = gas.compute_density(T,p)
+        a   = gas.compute_speed_of_sound(T,p,var_gamma)
+        mu  = gas.compute_absolute_viscosity(T)
+        K   = gas.compute_thermal_conductivity(T)
+        Pr  = gas.compute_prandtl_number(T)
+
+        dtype = np.float32 if self.settings.single_precision else np.float64
+
+        atmo_data = Conditions()
+        atmo_data.expand_rows(zs.shape[0])
+        atmo_data.pressure             = p.astype(dtype,copy=False)
+        atmo_data.temperature          = T.astype(dtype,copy=False)
+        atmo_data.density              = rho.astype(dtype,copy=False)
+        atmo_data.speed_of_sound       = a.astype(dtype,copy=False)
+        atmo_data.dynamic_viscosity    = mu.astype(dtype,copy=False)
+        atmo_data.kinematic_viscosity  = (mu/rho).astype(dtype,copy=False)
+        atmo_data.thermal_conductivity = K.astype(dtype,copy=False)
+        atmo_data.prandtl_number       = Pr.astype(dtype,copy=False)
+
+        return atmo_data
@@ -4,4 +4,5 @@
 
 from .Atmospheric import Atmospheric
 from .US_Standard_1976 import US_Standard_1976
+from .US_Standard_1976_Vectorized import US_Standard_1976_Vectorized
 from .Constant_Temperature import Constant_Temperature
\ No newline at end of file
@@ -0,0 +1,96 @@
+## @ingroup Analyses-Mission
+# Batched_Segments.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Analyses import Process
+from SUAVE.Methods import Missions as Methods
+
+from .Mission import Mission
+
+# ----------------------------------------------------------------------
+#   Class
+# ----------------------------------------------------------------------
+
+## @ingroup Analyses-Mission
+class Batched_Segments(Mission):
+    """ Solves all segments at once in a single root finding problem. The control points of all segments
+        are evaluated in one pass, with the batched process steps evaluated once over the stacked control
+        points of every segment that shares the same analyses. Continuity between segments is enforced with
+        residuals on the quantities listed in continuity. This is not a faster drop in replacement for the
+        sequential mission, on the Boeing 737 mission both take about as long.
+
+        Assumptions:
+        Quantities carried from one segment to the next that are not in continuity are held fixed during a solve
+        and refreshed between solves. The batched steps only depend on the conditions and the analyses.
+
+        Source:
+        None
+    """
+
+    def __defaults__(self):
+        """This sets the default values.
+
+            Assumptions:
+            None
+
+            Source:
+            N/A
+
+            Inputs:
+            None
+
+            Outputs:
+            None
+
+            Properties Used:
+            None
+        """
+
+        self.tag = 'mission'
+
+        # quantities passed from one segment to the next which are solved for, others are refreshed between solves
+        self.continuity = ['weights.total_mass',
+                           'propulsion.battery_energy']
+
+        # iterate steps evaluated once over the stacked control points of all segments,
+        # each is checked to work point by point the first time it is evaluated
+        self.batched_steps = ['conditions.aerodynamics',
+                              'conditions.stability',
+                              'conditions.propulsion']
+
+        self.maximum_boundary_passes = 3
+        self.boundary_tolerance      = 1e-6
+
+        self.state.numerics.solver_jacobian   = 'block_sparse'
+        self.state.numerics.jacobian_sparsity = Methods.Segments.Common.Batched_Segments.batched_sparsity
+
+        # --------------------------------------------------------------
+        #   Initialize
+        # --------------------------------------------------------------
+        self.process.initialize.expand_sub_segments = Methods.Segments.Common.Sub_Segments.expand_sub_segments
+        self.process.initialize.batched_segments    = Methods.Segments.Common.Batched_Segments.initialize_batched_segments
+
+        # --------------------------------------------------------------
+        #   Converge
+        # --------------------------------------------------------------
+        self.process.converge.converge_root         = Methods.Segments.Common.Batched_Segments.converge_batched_segments
+
+        # --------------------------------------------------------------
+        #   Iterate
+        # --------------------------------------------------------------
+        self.process.iterate                        = Process()
+        self.process.iterate.unpack                 = Methods.Segments.Common.Batched_Segments.unpack_continuity
+        self.process.iterate.sub_segments           = Methods.Segments.Common.Batched_Segments.update_batched_segments
+        self.process.iterate.continuity             = Methods.Segments.Common.Batched_Segments.residual_continuity
+
+        # --------------------------------------------------------------
+        #   Finalize
+        # --------------------------------------------------------------
+        self.process.finalize.sub_segments          = Methods.Segments.Common.Batched_Segments.finalize_batched_segments
+
+        return
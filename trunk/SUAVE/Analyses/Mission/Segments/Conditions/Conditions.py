@@ -6,6 +6,7 @@
 #           Jun 2017, E. Botero
 #           Jan 2020, M. Clarke
 #           Oct 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,6 +17,7 @@ import numpy as np
 
 # SUAVE imports
 from SUAVE.Core                    import Data
+from SUAVE.Core.Flat_Layout        import Flat_Layout
 
 # ----------------------------------------------------------------------
 #  Conditions
@@ -34,7 +36,8 @@ class Conditions(Data):
         None   
     """ 
 
-    _size = 1
+    _size        = 1
+    _flat_layout = None
     
     def ones_row(self,cols):
         """ returns a row vector of ones with given number of columns 
@@ -141,6 +144,33 @@ class Conditions(Data):
                     self[k] = np.resize(v,[rows,v.shape[1]])
         
         return
+    
+    def flat_layout(self):
+        """ Returns the flat layout of these conditions, the packed values kept in one contiguous buffer.
+            The layout is found again if the conditions changed shape or were copied.
+        
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            layout   [Flat_Layout]
+    
+            Properties Used:
+            None
+        """
+        
+        layout = self._flat_layout
+        if layout is None or not layout.matches(self):
+            layout = Flat_Layout(self)
+            self._flat_layout = layout
+        
+        return layout
         
 ## @ingroup Analyses-Mission-Segments-Conditions        
 class expanded_array(Data):
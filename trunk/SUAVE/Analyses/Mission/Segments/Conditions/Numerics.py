@@ -3,6 +3,7 @@
 #
 # Created:  
 # Modified: Feb 2016, Andrew Wendorff
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -57,6 +58,7 @@ class Numerics(Conditions):
         self.converged                        = None
         self.max_evaluations                  = 0.
         self.step_size                        = None
+        self.flat_state                       = False
         
         self.dimensionless = Conditions()
         self.dimensionless.control_points = np.empty([0,0])
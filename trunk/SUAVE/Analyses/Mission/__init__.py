@@ -4,6 +4,7 @@
 
 # classes
 from .All_At_Once import All_At_Once
+from .Batched_Segments import Batched_Segments
 from .Mission import Mission
 from .Sequential_Segments import Sequential_Segments
 
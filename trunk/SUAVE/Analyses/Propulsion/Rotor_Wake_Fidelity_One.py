@@ -2,7 +2,7 @@
 # Rotor_Wake_Fidelity_One.py
 #
 # Created:  Jan 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,7 +11,7 @@ from SUAVE.Core import Data
 from SUAVE.Components import Wings
 from SUAVE.Components.Energy.Energy_Component import Energy_Component
 from SUAVE.Analyses.Propulsion.Rotor_Wake_Fidelity_Zero import Rotor_Wake_Fidelity_Zero
-from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.fidelity_one_wake_convergence import fidelity_one_wake_convergence
+from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.fidelity_one_wake_convergence import fidelity_one_wake_convergence, converged_inflow_change
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_wake_induced_velocity import compute_wake_induced_velocity
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.extract_wing_VD import extract_wing_collocation_points
@@ -66,11 +66,30 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         self.wake_settings.number_rotor_rotations     = 5
         self.wake_settings.number_steps_per_rotation  = 72
         self.wake_settings.initial_timestep_offset    = 0    # initial timestep
+        self.wake_settings.memory_budget              = 2E9  # bytes for the temporaries of the induced velocity kernel
+        self.wake_settings.number_of_threads          = 1    # threads evaluating the chunks of the induced velocity kernel
+        self.wake_settings.induced_velocity_method    = 'direct' # 'direct' sum or 'treecode' for long wakes
+        self.wake_settings.treecode_opening_angle     = 0.5  # accuracy of the treecode, smaller is more accurate
         
         # wake convergence criteria
         self.maximum_convergence_iteration            = 10
         self.axial_velocity_convergence_tolerance     = 1e-2
         
+        # warm start from the last converged wake, which is reused while the inflow changes less than the tolerance
+        self.warm_start                               = False
+        self.converged_wake                           = Data()
+        self.convergence                              = Data()
+        self.convergence.iterations                   = 0    # wake shape iterations of the last evaluation
+        self.convergence.total_iterations             = 0
+        self.convergence.evaluations                  = 0
+        self.convergence.reused_evaluations           = 0    # evaluations that reused the converged wake
+        
+        # offset of the rotor from the rotor whose vortex distribution the wake shares
+        self.wake_offset                              = Data()
+        self.wake_offset.origin_offset                = np.zeros(3)
+        self.wake_offset.rotation_sense               = 1            # -1 for a rotor turning against the rotor of the shared wake
+        self.wake_offset.mirror_origin                = np.zeros(3)  # origin of the rotor of the shared wake
+        
         # flags for slipstream interaction
         self.slipstream                 = False
         self.verbose                    = True
@@ -100,9 +119,11 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         None
         
         """
-        # run the BET once using fidelity zero inflow
+        # run the BET once using fidelity zero inflow, the wake is not copied
+        wake       = rotor.Wake
+        rotor.Wake = Rotor_Wake_Fidelity_Zero()
         rotor_temp = copy.deepcopy(rotor)
-        rotor_temp.Wake = Rotor_Wake_Fidelity_Zero()
+        rotor.Wake = wake
         _,_,_,_,outputs,_ = rotor_temp.spin(conditions)
         
         rotor.outputs = outputs
@@ -120,6 +141,8 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
     def evaluate(self,rotor,wake_inputs,conditions):
         """
         Wake evaluation is performed using a semi-prescribed vortex wake (PVW) method for Fidelity One.
+        With the warm start, the last converged wake is reused while the inflow at the rotor changes 
+        less than the convergence tolerance, such as in the finite difference steps of the mission solver.
         
         Assumptions:
         None
@@ -145,6 +168,18 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         None
         """   
         
+        self.convergence.evaluations += 1
+        
+        # Reuse the converged wake shape
+        if self.warm_start and converged_inflow_change(self,rotor,wake_inputs) < self.axial_velocity_convergence_tolerance:
+            if self.verbose:
+                print("\tReusing converged wake shape...")
+            self.convergence.iterations          = 0
+            self.convergence.reused_evaluations += 1
+            self.vortex_distribution             = self.converged_wake.vortex_distribution
+            
+            return self.converged_wake.va, self.converged_wake.vt
+        
         # Initialize rotor with single pass of VW 
         self.initialize(rotor,conditions)
         
@@ -233,14 +268,142 @@ class Rotor_Wake_Fidelity_One(Energy_Component):
         None
         """           
         #extract wake shape previously generated
-        wake_vortex_distribution = rotor.Wake.vortex_distribution
+        wake_vortex_distribution = self.vortex_distribution
+        offset                   = self.wake_offset
+        mirrored                 = offset.rotation_sense == -1
+        
+        # move the evaluation points into the frame of the rotor of the shared wake
+        if np.any(offset.origin_offset != 0) or mirrored:
+            points      = Data()
+            points.n_cp = VD.n_cp
+            points.XC   = VD.XC - offset.origin_offset[0]
+            points.YC   = VD.YC - offset.origin_offset[1]
+            points.ZC   = VD.ZC - offset.origin_offset[2]
+            if mirrored:
+                points.YC = 2*offset.mirror_origin[1] - points.YC
+        else:
+            points = VD
     
         # compute the induced velocity from the rotor wake on the lifting surfaces
-        VD.Wake         = wake_vortex_distribution
-        rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,VD,num_ctrl_pts)        
+        rot_V_wake_ind  = compute_wake_induced_velocity(wake_vortex_distribution,points,num_ctrl_pts,
+                                                        memory_budget     = self.wake_settings.memory_budget,
+                                                        number_of_threads = self.wake_settings.number_of_threads,
+                                                        method            = self.wake_settings.induced_velocity_method,
+                                                        opening_angle     = self.wake_settings.treecode_opening_angle)        
+        
+        # the mirror image of the wake induces the mirror image of the velocity
+        if mirrored:
+            rot_V_wake_ind[:,:,1] = -rot_V_wake_ind[:,:,1]
         
         return rot_V_wake_ind
     
+    def shared_copy(self,wake_rotor,rotor):
+        """
+        Makes the wake of an identical rotor that shares the vortex distribution of this wake. Only the
+        offset of the rotor origin and the rotation sense are kept, the vortex distribution is moved when
+        the induced velocities are evaluated rather than copied for every rotor.
+        
+        Assumptions:
+        A rotor turning against the rotor of the shared wake has the mirror image of the wake, mirrored 
+        about the x-z plane through the origin of the rotor of the shared wake
+        
+        Source:
+        N/A
+        
+        Inputs:
+        self       - wake that was evaluated
+        wake_rotor - rotor of this wake
+        rotor      - identical rotor
+        
+        Outputs:
+        wake       - wake of the identical rotor
+        
+        Properties Used:
+        None
+        """
+        wake                = copy.copy(self)
+        wake.convergence    = copy.copy(self.convergence)
+        wake.converged_wake = copy.copy(self.converged_wake)
+        
+        wake.wake_offset                = Data()
+        wake.wake_offset.origin_offset  = np.array(rotor.origin[0],dtype=float) - np.array(wake_rotor.origin[0],dtype=float)
+        wake.wake_offset.rotation_sense = 1 if rotor.rotation == wake_rotor.rotation else -1
+        wake.wake_offset.mirror_origin  = np.array(wake_rotor.origin[0],dtype=float)
+        
+        return wake
+    
+    def offset_vortex_distribution(self):
+        """
+        Gives the vortex distribution of the wake at the rotor, with the offset of a shared wake applied.
+        This copies the vortex distribution of a shared wake, e.g. for plotting.
+        
+        Assumptions:
+        None
+        
+        Source:
+        N/A
+        
+        Inputs:
+        self       - rotor wake
+        
+        Outputs:
+        WD         - vortex distribution at the rotor
+        
+        Properties Used:
+        None
+        """
+        offset = self.wake_offset
+        if not np.any(offset.origin_offset != 0) and offset.rotation_sense == 1:
+            return self.vortex_distribution
+        
+        WD = Data()
+        for key, value in self.vortex_distribution.items():
+            if key == 'reshaped_wake':
+                WD.reshaped_wake = Data()
+                for sub_key, sub_value in value.items():
+                    WD.reshaped_wake[sub_key] = self.offset_wake_values(sub_key,sub_value)
+            else:
+                WD[key] = self.offset_wake_values(key,value)
+        
+        return WD
+    
+    def offset_wake_values(self,key,values):
+        """
+        Applies the offset of a shared wake to one array of the vortex distribution, the coordinates are
+        mirrored and moved and the circulation changes sign for a mirrored wake.
+        
+        Assumptions:
+        None
+        
+        Source:
+        N/A
+        
+        Inputs:
+        key        - name of the array in the vortex distribution
+        values     - array of the vortex distribution
+        
+        Outputs:
+        values     - array at the rotor
+        
+        Properties Used:
+        None
+        """
+        offset   = self.wake_offset
+        mirrored = offset.rotation_sense == -1
+        if not isinstance(values,np.ndarray):
+            return values
+        if 'X' in key:
+            return values + offset.origin_offset[0]
+        elif 'Y' in key:
+            if mirrored:
+                values = 2*offset.mirror_origin[1] - values
+            return values + offset.origin_offset[1]
+        elif 'Z' in key:
+            return values + offset.origin_offset[2]
+        elif 'GAMMA' in key and mirrored:
+            return -values
+        return values
+    
     def shift_wake_VD(self,wVD, offset):
         """
         This shifts the wake by the (x,y,z) coordinates of the offset. 
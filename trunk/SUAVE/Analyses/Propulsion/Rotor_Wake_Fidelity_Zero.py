@@ -2,7 +2,7 @@
 # Rotor_Wake_Fidelity_Zero.py
 #
 # Created:  Jan 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -52,6 +52,7 @@ class Rotor_Wake_Fidelity_Zero(Energy_Component):
 
         self.tag            = 'rotor_wake'
         self.wake_method    = 'Fidelity_Zero'
+        self.inflow_solver  = 'fsolve'     # 'fsolve' on all stations or 'newton' station by station, used for stacked rotors
 
     
     def evaluate(self,rotor,wake_inputs,conditions):
@@ -12,6 +12,7 @@
 #           Jul 2021, R. Erhard
 #           Sep 2021, R. Erhard
 #           Feb 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -608,8 +609,7 @@ class Rotor(Energy_Component):
 
         # Go from vehicle frame to propeller vehicle frame: rot 1 including the extra body rotation
         cpts       = len(np.atleast_1d(self.inputs.y_axis_rotation))
-        rots       = np.array(self.orientation_euler_angles) * 1.
-        rots       = np.repeat(rots[None,:], cpts, axis=0)
+        rots       = np.broadcast_to(np.atleast_2d(self.orientation_euler_angles), (cpts,3)) * 1.
         rots[:,1] += np.atleast_2d(self.inputs.y_axis_rotation)[:,0]
         
         vehicle_2_prop_vec = sp.spatial.transform.Rotation.from_rotvec(rots).as_matrix()
@@ -10,6 +10,7 @@
 #           Aug 2021, M. Clarke
 #           Feb 2022, R. Erhard
 #           Mar 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -23,8 +24,8 @@ from SUAVE.Analyses.Mission.Segments.Conditions import Residuals
 from SUAVE.Components.Physical_Component import Container 
 from SUAVE.Methods.Power.Battery.pack_battery_conditions import pack_battery_conditions
 from SUAVE.Methods.Power.Battery.append_initial_battery_conditions import append_initial_battery_conditions
+from SUAVE.Methods.Propulsion.spin_motors_and_rotors import spin_motors_and_rotors
 from SUAVE.Core import Data , Units 
-import copy
 
 # ----------------------------------------------------------------------
 #  Network
@@ -170,38 +171,30 @@ class Battery_Propeller(Network):
             total_thrust        = 0. * state.ones_row(3)
             total_power         = 0.
             
+            # Unpack the motors and props
+            motor_list = [self.propeller_motors[key] for key in list(motors.keys())[:n_evals]]
+            prop_list  = [self.propellers[key] for key in list(props.keys())[:n_evals]]
+            
+            # Set rotor y-axis rotation
+            for prop in prop_list:
+                prop.inputs.y_axis_rotation = conditions.propulsion.propeller_y_axis_rotation
+            
+            # step 3 and 4, props with the same blades are spun in one call
+            prop_results = spin_motors_and_rotors(motor_list,prop_list,esc.outputs.voltageout,
+                                                  conditions.propulsion.propeller_power_coefficient[:,:n_evals],conditions)
+            
             # Iterate over motor/props
             for ii in range(n_evals):
                 
                 # Unpack the motor and props
-                motor_key = list(motors.keys())[ii]
-                prop_key  = list(props.keys())[ii]
-                motor     = self.propeller_motors[motor_key]
-                prop      = self.propellers[prop_key]
-
-                # Set rotor y-axis rotation                
-                prop.inputs.y_axis_rotation = conditions.propulsion.propeller_y_axis_rotation                    
-                
-                # link 
-                motor.inputs.voltage        = esc.outputs.voltageout
-                motor.inputs.propeller_CP   = np.atleast_2d(conditions.propulsion.propeller_power_coefficient[:,ii]).T
-                
-                # step 3
-                motor.omega(conditions)
-                
-                # link
-                prop.inputs.omega           = motor.outputs.omega 
-                
-                # step 4
-                F, Q, P, Cp, outputs, etap = prop.spin(conditions)
+                motor = motor_list[ii]
+                prop  = prop_list[ii]
+                F, Q, P, Cp, outputs, etap, etam = prop_results[ii]
                     
                 # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
                 eta        = conditions.propulsion.throttle[:,0,None]
                 P[eta>1.0] = P[eta>1.0]*eta[eta>1.0]
                 F[eta[:,0]>1.0,:] = F[eta[:,0]>1.0,:]*eta[eta[:,0]>1.0,:]
-    
-                # Run the motor for current
-                _ , etam =  motor.current(conditions)
                 
                 # Conditions specific to this instantation of motor and propellers
                 R                   = prop.tip_radius
@@ -226,16 +219,10 @@ class Battery_Propeller(Network):
                 conditions.noise.sources.propellers[prop.tag]      = outputs
             
             if identical_flag and prop.Wake.wake_method=="Fidelity_One":
-                # append wakes to all propellers, shifted by new origin
+                # share the wake of the evaluated propeller with all propellers, offset to their origins
                 for p in props:
-                    # make copy of prop wake and vortex distribution
-                    base_wake = copy.deepcopy(prop.Wake)
-                    wake_vd   = base_wake.vortex_distribution
-                    
-                    # apply offset 
-                    origin_offset = np.array(p.origin[0]) - np.array(prop.origin[0])
-                    p.Wake = base_wake
-                    p.Wake.shift_wake_VD(wake_vd, origin_offset)
+                    if p is not prop:
+                        p.Wake = prop.Wake.shared_copy(prop,p)
             elif identical_flag and prop.Wake.wake_method=="Fidelity_Zero":
                 for p in props:
                     p.outputs = outputs
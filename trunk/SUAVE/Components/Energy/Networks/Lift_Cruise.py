@@ -8,6 +8,7 @@
 #           Jul 2021, R. Erhard
 #           Aug 2021, M. Clarke
 #           Feb 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,13 +19,13 @@ import SUAVE
 
 # package imports
 import numpy as np
-import copy
 from SUAVE.Core import Units, Data
 from .Network import Network
 from SUAVE.Analyses.Mission.Segments.Conditions import Residuals
 from SUAVE.Components.Physical_Component import Container 
 from SUAVE.Methods.Power.Battery.pack_battery_conditions import pack_battery_conditions
 from SUAVE.Methods.Power.Battery.append_initial_battery_conditions import append_initial_battery_conditions
+from SUAVE.Methods.Propulsion.spin_motors_and_rotors import spin_motors_and_rotors
 
 # ----------------------------------------------------------------------
 #  Lift_Forward
@@ -194,36 +195,27 @@ class Lift_Cruise(Network):
             total_prop_thrust        = 0. * state.ones_row(3)
             total_prop_power         = 0.
             
+            # Unpack the motors and props
+            motor_list = [self.propeller_motors[key] for key in list(propeller_motors.keys())[:n_evals]]
+            prop_list  = [self.propellers[key] for key in list(propellers.keys())[:n_evals]]
+            
+            # Run the motors and propellers, propellers with the same blades are spun in one call
+            prop_results = spin_motors_and_rotors(motor_list,prop_list,propeller_esc.outputs.voltageout,
+                                                  conditions.propulsion.propeller_power_coefficient[:,:n_evals],conditions)
+            
             # Iterate over motor/props
             for ii in range(n_evals):    
                 
                 # Unpack the motor and props
-                motor_key = list(propeller_motors.keys())[ii]
-                prop_key  = list(propellers.keys())[ii]
-                motor     = self.propeller_motors[motor_key]
-                prop      = self.propellers[prop_key]            
-            
-                # link 
-                motor.inputs.voltage  = propeller_esc.outputs.voltageout
-                motor.inputs.propeller_CP = np.atleast_2d(conditions.propulsion.propeller_power_coefficient[:,ii]).T
-                
-                # Run the motor
-                motor.omega(conditions)
-                
-                # link
-                prop.inputs.omega           = motor.outputs.omega 
-                
-                # Run the propeller
-                F_forward, Q_forward, P_forward, Cp_forward, outputs_forward, etap_forward = prop.spin(conditions)
+                motor = motor_list[ii]
+                prop  = prop_list[ii]
+                F_forward, Q_forward, P_forward, Cp_forward, outputs_forward, etap_forward, etam_prop = prop_results[ii]
                     
                 # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
                 eta                       = conditions.propulsion.throttle[:,0,None]
                 P_forward[eta>1.0]        = P_forward[eta>1.0]*eta[eta>1.0]
                 F_forward[eta[:,0]>1.0,:] = F_forward[eta[:,0]>1.0,:]*eta[eta[:,0]>1.0,:]  
                 
-                # Run the motor for current
-                _, etam_prop = motor.current(conditions)
-                
                 # Conditions specific to this instantation of motor and propellers
                 R                        = prop.tip_radius
                 rpm                      = motor.outputs.omega / Units.rpm
@@ -251,17 +243,9 @@ class Lift_Cruise(Network):
                 for p in self.propellers:
                     conditions.noise.sources.propellers[p.tag]      = outputs_forward
                     
-                    # Append wake to each identical propeller
-                    if p.Wake.wake_method=="Fidelity_One":
-                    
-                        # make copy of prop wake and vortex distribution
-                        base_wake = copy.deepcopy(prop.Wake)
-                        wake_vd   = base_wake.vortex_distribution
-                        
-                        # apply offset 
-                        origin_offset = np.array(p.origin[0]) - np.array(prop.origin[0])
-                        p.Wake = base_wake
-                        p.Wake.shift_wake_VD(wake_vd, origin_offset)                    
+                    # Share the wake with each identical propeller, offset to its origin
+                    if p.Wake.wake_method=="Fidelity_One" and p is not prop:
+                        p.Wake = prop.Wake.shared_copy(prop,p)
                             
                                 
                 
@@ -311,36 +295,26 @@ class Lift_Cruise(Network):
             total_lift_rotor_thrust        = 0. * state.ones_row(3)
             total_lift_rotor_power         = 0.        
             
+            # Unpack the motors and lift_rotors
+            lift_rotor_motor_list = [self.lift_rotor_motors[key] for key in list(lift_rotor_motors.keys())[:n_evals]]
+            lift_rotor_list       = [self.lift_rotors[key] for key in list(lift_rotors.keys())[:n_evals]]
+            
+            # Run the motors and lift_rotors, lift_rotors with the same blades are spun in one call
+            lift_rotor_results = spin_motors_and_rotors(lift_rotor_motor_list,lift_rotor_list,lift_rotor_esc.outputs.voltageout,
+                                                        conditions.propulsion.lift_rotor_power_coefficient[:,:n_evals],konditions)
+            
             # Iterate over motor/lift_rotors
             for ii in range(n_evals):          
                 
                 # Unpack the motor and props
-                motor_key   = list(lift_rotor_motors.keys())[ii]
-                lift_rotor_key   = list(lift_rotors.keys())[ii]
-                lift_rotor_motor = self.lift_rotor_motors[motor_key]
-                lift_rotor       = self.lift_rotors[lift_rotor_key]            
-                        
-                # link 
-                lift_rotor_motor.inputs.voltage = lift_rotor_esc.outputs.voltageout
-                lift_rotor_motor.inputs.propeller_CP = np.atleast_2d(conditions.propulsion.lift_rotor_power_coefficient[:,ii]).T
-                
-                # Run the motor
-                lift_rotor_motor.omega(konditions)
-                
-                # link
-                lift_rotor.inputs.omega           = lift_rotor_motor.outputs.omega   
-                
-                # Run the propeller
-                F_lift, Q_lift, P_lift, Cp_lift, outputs_lift, etap_lift = lift_rotor.spin(konditions)
+                lift_rotor_motor = lift_rotor_motor_list[ii]
+                lift_rotor       = lift_rotor_list[ii]
+                F_lift, Q_lift, P_lift, Cp_lift, outputs_lift, etap_lift, etam_lift_rotor = lift_rotor_results[ii]
                 
                 # Check to see if magic thrust is needed, the ESC caps throttle at 1.1 already
                 eta                       = conditions.propulsion.throttle_lift[:,0,None]
                 P_lift[eta>1.0]           = P_lift[eta>1.0]*eta[eta>1.0]
                 F_lift[eta[:,0]>1.0,:]    = F_lift[eta[:,0]>1.0,:]*eta[eta[:,0]>1.0,:]  
-                    
-                
-                # Run the motor for current
-                _, etam_lift_rotor =lift_rotor_motor.current(konditions)  
                 
                 # Conditions specific to this instantation of motor and propellers
                 R                              = lift_rotor.tip_radius
@@ -370,17 +344,9 @@ class Lift_Cruise(Network):
                 for r in self.lift_rotors:
                     conditions.noise.sources.propellers[r.tag]      = outputs_lift
                     
-                    # Append wake to each identical propeller
-                    if r.Wake.wake_method=="Fidelity_One":
-                    
-                        # make copy of prop wake and vortex distribution
-                        base_wake = copy.deepcopy(lift_rotor.Wake)
-                        wake_vd   = base_wake.vortex_distribution
-                        
-                        # apply offset 
-                        origin_offset = np.array(p.origin[0]) - np.array(prop.origin[0])
-                        r.Wake = base_wake
-                        r.Wake.shift_wake_VD(wake_vd, origin_offset)  
+                    # Share the wake with each identical lift rotor, offset to its origin
+                    if r.Wake.wake_method=="Fidelity_One" and r is not lift_rotor:
+                        r.Wake = lift_rotor.Wake.shared_copy(lift_rotor,r)
                         
                 
             # link
@@ -6,6 +6,7 @@
 #           May 2020, E. Botero
 #           Jul 2020, E. Botero 
 #           Jul 2021, E. Botero
+#           Oct 2026, SUAVE Team
 
    
 # ----------------------------------------------------------------------
@@ -22,6 +23,8 @@ t_table = str.maketrans( chars          + string.ascii_uppercase ,
 
 import numpy as np
 
+from .Data import is_attribute
+
 # ----------------------------------------------------------------------
 #   Property Class
 # ----------------------------------------------------------------------   
@@ -681,7 +684,7 @@ class DataOrdered(OrderedDict):
         """        
         # Setting a new item creates a new link which goes at the end of the linked
         # list, and the inherited dictionary is updated with the new key/value pair.
-        if not hasattr(self,key) and not hasattr(self.__class__,key):
+        if not is_attribute(self,key):
         #if not self.has_key(key) and not hasattr(self.__class__,key):
             root = dict.__getitem__(self,'_root')
             last = root[0]
@@ -0,0 +1,201 @@
+## @ingroup Core
+# Flat_Layout.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from .Arrays import array_type, matrix_type
+
+dictgetitem = dict.__getitem__
+dictsetitem = dict.__setitem__
+
+# ----------------------------------------------------------------------
+#   Flat Layout
+# ----------------------------------------------------------------------
+
+## @ingroup Core
+class Flat_Layout(object):
+    """ Keeps the values a Data packs with pack_array in one contiguous buffer. The layout, the offset
+        and shape of every packed value, is found once. Every float array of the data is then replaced
+        by a view into the buffer, so packing and unpacking no longer walk the data or allocate.
+
+        Example:
+        layout = Flat_Layout(unknowns)
+        layout.unpack(vector) # same as unknowns.unpack_array(vector)
+        vector = layout.pack()  # same as unknowns.pack_array(), but is the buffer itself
+
+        Assumptions:
+        Packs in the same order and with the same type rules as Data.pack_array. Values that are not
+        float arrays (scalars, integer arrays) are copied in and out of the buffer on every call.
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,data):
+        """ Finds the layout of a Data and moves its float arrays into the buffer
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data      [Data]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        valid_types = ( int, float, array_type, matrix_type )
+
+        self.data   = data
+        self.nodes  = []
+        self.leaves = []
+
+        size = [0]
+
+        def do_layout(D,parent=None,key=None):
+            self.nodes.append((parent,key,D,len(D)))
+            for k,v in D.items():
+                if isinstance(v,dict):
+                    do_layout(v,D,k)
+                    continue
+                elif not isinstance(v,valid_types): continue
+                shape = np.shape(v)
+                if len(shape) > 2: continue
+                n = int(np.prod(shape))
+                self.leaves.append([D,k,size[0],size[0]+n,shape,None])
+                size[0] += n
+
+        do_layout(data)
+
+        self.buffer = np.empty(size[0])
+
+        for leaf in self.leaves:
+            D, k, start, end, shape, _ = leaf
+            v = dictgetitem(D,k)
+            self.buffer[start:end] = np.ravel(v,order='F')
+            if isinstance(v,array_type) and v.dtype == np.float64:
+                view = self.buffer[start:end].reshape(shape,order='F').view(type(v))
+                dictsetitem(D,k,view)
+                leaf[5] = view
+
+    def matches(self,data):
+        """ Checks that a Data still has the layout, the same nodes, keys and value shapes, and that its
+            arrays are still backed by this buffer. Copies of a Data do not share the buffer.
+
+            Assumptions:
+            Values that are not packed are not checked
+
+            Source:
+            N/A
+
+            Inputs:
+            data      [Data]
+
+            Outputs:
+            matches   [bool]
+
+            Properties Used:
+            N/A
+        """
+
+        if data is not self.data:
+            return False
+
+        for parent, key, D, n in self.nodes:
+            if len(D) != n:
+                return False
+            elif parent is not None and parent.get(key) is not D:
+                return False
+
+        buffer = self.buffer
+        for D, k, start, end, shape, view in self.leaves:
+            try:
+                v = dictgetitem(D,k)
+            except KeyError:
+                return False
+            if v is view:
+                if view.base is not buffer:
+                    return False
+            elif isinstance(v,dict) or np.shape(v) != shape:
+                return False
+
+        return True
+
+    def pack(self):
+        """ Packs the data into the buffer. Arrays that were replaced since the last call are copied in
+            and replaced by their view again.
+
+            Assumptions:
+            The returned vector is the buffer itself, it is overwritten by the next pack or unpack
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            buffer    [array]
+
+            Properties Used:
+            N/A
+        """
+
+        buffer = self.buffer
+        for D, k, start, end, shape, view in self.leaves:
+            v = dictgetitem(D,k)
+            if v is view:
+                continue
+            elif view is None:
+                buffer[start:end] = np.ravel(v,order='F')
+            else:
+                view[...] = v
+                dictsetitem(D,k,view)
+
+        return buffer
+
+    def unpack(self,M):
+        """ Unpacks a vector into the data through the buffer
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            M         [array]
+
+            Outputs:
+            data      [Data]
+
+            Properties Used:
+            N/A
+        """
+
+        buffer = self.buffer
+        buffer[:] = M
+        for D, k, start, end, shape, view in self.leaves:
+            v = dictgetitem(D,k)
+            if v is view:
+                continue
+            elif view is not None:
+                dictsetitem(D,k,view)
+            elif shape == ():
+                dictsetitem(D,k,buffer[start])
+            else:
+                v[...] = buffer[start:end].reshape(shape,order='F')
+
+        return self.data
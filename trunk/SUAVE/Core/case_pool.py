@@ -0,0 +1,121 @@
+## @ingroup Core
+# case_pool.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import os, shutil, subprocess, tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+from . import redirect
+
+# -------------------------------------------------------------------
+#  Run Cases
+# -------------------------------------------------------------------
+
+## @ingroup Core
+def run_cases(cases,number_of_workers=1,parent_folder='.',prefix='case_',keep_files=False):
+    """ Runs an external program for each case with a pool of workers. Every
+        case has its own temporary folder, so the files of the cases do not
+        collide. The input files are written and the results are read one case
+        at a time, in order, while the programs run concurrently.
+
+        Example:
+        case         = Data()
+        case.command = ['SU2_CFD','cruise.cfg']
+        case.link    = ['cruise.su2']
+        case.write   = lambda case: write_SU2_cfg('cruise',SU2_settings)
+        case.read    = lambda case: read_SU2_history('cruise')
+        results      = run_cases([case],number_of_workers=4)
+
+        Assumptions:
+        The programs only read and write files in the folder of their case
+
+        Source:
+        N/A
+
+        Inputs:
+            cases              - list of Data, each with
+              command          - program and its arguments                         <list>
+              write(case)      - writes the input files into the current folder    <function>
+              read(case)       - reads the results from the current folder         <function>
+              stdin            - file of the case folder that is sent to the
+                                 standard input of the program, may be set by
+                                 write (optional)                                  <string>
+              link             - files that are linked into the case folder
+                                 (optional)                                        <list>
+            number_of_workers  - largest number of programs that run at once       [-]
+            parent_folder      - folder in which the case folders are made         <string>
+            prefix             - prefix of the names of the case folders           <string>
+            keep_files         - keep the case folders after the results are read  <boolean>
+
+        Outputs:
+            results            - result of read for each case                      <list>
+            case.
+              folder           - folder of the case                                <string>
+              exit_status      - exit status of the program                        [-]
+
+        Properties Used:
+        N/A
+    """
+
+    folders = []
+    try:
+        # write the input files of each case in its own folder
+        for case in cases:
+            case.folder = tempfile.mkdtemp(prefix=prefix,dir=parent_folder)
+            folders.append(case.folder)
+            with redirect.folder(case.folder,link=case.get('link',None)):
+                case.write(case)
+
+        # run the programs, the workers only wait on the external processes
+        with ThreadPoolExecutor(max_workers=max(1,int(number_of_workers))) as pool:
+            exit_statuses = list(pool.map(run_case,cases))
+
+        # read the results of each case
+        results = []
+        for case, exit_status in zip(cases,exit_statuses):
+            case.exit_status = exit_status
+            with redirect.folder(case.folder):
+                results.append(case.read(case))
+
+    finally:
+        if not keep_files:
+            for folder in folders:
+                shutil.rmtree(folder,ignore_errors=True)
+
+    return results
+
+## @ingroup Core
+def run_case(case):
+    """ Runs the program of a case in its folder. The standard output and
+        error of the program are written to output.log in the folder.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+            case.
+              command          - program and its arguments                         <list>
+              folder           - folder of the case                                <string>
+              stdin            - file sent to the standard input (optional)        <string>
+
+        Outputs:
+            exit_status        - exit status of the program                        [-]
+
+        Properties Used:
+        N/A
+    """
+
+    stdin = case.get('stdin',None)
+    with open(os.path.join(case.folder,'output.log'),'w') as log:
+        if stdin is None:
+            return subprocess.call(case.command,cwd=case.folder,stdin=subprocess.DEVNULL,stdout=log,stderr=subprocess.STDOUT)
+        with open(os.path.join(case.folder,stdin),'r') as commands:
+            return subprocess.call(case.command,cwd=case.folder,stdin=commands,stdout=log,stderr=subprocess.STDOUT)
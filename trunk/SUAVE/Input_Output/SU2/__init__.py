@@ -1,5 +1,5 @@
 ## @defgroup Input_Output-SU2 SU2
 # Functions needed to interface with SU2
 # @ingroup Input_Output
-from .call_SU2_CFD import call_SU2_CFD
+from .call_SU2_CFD import call_SU2_CFD, read_SU2_history
 from .write_SU2_cfg import write_SU2_cfg
\ No newline at end of file
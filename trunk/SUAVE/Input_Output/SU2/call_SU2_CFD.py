@@ -4,6 +4,7 @@
 # Created:  Oct 2016, T. MacDonald
 # Modified: Jan 2017, T. MacDonald
 #           Mar 2018, T. MacDonald
+#           Oct 2026, SUAVE Team
 
 import subprocess
 from SUAVE.Core import Data
@@ -41,11 +42,41 @@ def call_SU2_CFD(tag,parallel=False,processors=1):
     else:
         subprocess.call(['SU2_CFD',tag+'.cfg'])
         
-    f = open(tag + '_history.dat')
+    CL, CD = read_SU2_history(tag)
+    
+    print('CL:',CL)
+    print('CD:',CD)
+            
+    return CL,CD
+
+
+## @ingroup Input_Output-SU2
+def read_SU2_history(tag):
+    """This reads the lift and drag coefficients of the last iteration of an SU2 analysis.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    tag                          <string>  This determines what history file is read.
+    <tag>_history.dat            This file has the SU2 convergence history.
+
+    Outputs:
+    CL                           [-]
+    CD                           [-]
+
+    Properties Used:
+    N/A
+    """       
+    
+    with open(tag + '_history.dat') as f:
+        lines = f.readlines()
         
     SU2_results = Data()    
     
-    lines = f.readlines()
     final_state = lines[-1].split(',')
     
     # Lift and Drag
@@ -56,9 +87,6 @@ def call_SU2_CFD(tag,parallel=False,processors=1):
     SU2_results.coefficient_of_lift  = CL
     SU2_results.coefficient_of_drag  = CD
     
-    print('CL:',CL)
-    print('CD:',CD)
-    
     # Moments
     # Moments are currently not recorded since no
     # reasonable reference length has been chosen
@@ -1,5 +1,6 @@
 ## @defgroup Input_Output-SUAVE SUAVE
-# Functions needed to save SUAVE data structures in JSON form
+# Functions needed to save SUAVE data structures in JSON form and to cache surrogate training data
 # @ingroup Input_Output
 from .load import load
-from .archive import archive
\ No newline at end of file
+from .archive import archive
+from .training_cache import fingerprint, load_training_cache, save_training_cache
@@ -0,0 +1,160 @@
+## @ingroup Input_Output-SUAVE
+# training_cache.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
+import numpy as np
+import hashlib
+import tempfile
+import zipfile
+import os
+
+# ----------------------------------------------------------------------
+#  Method
+# ----------------------------------------------------------------------
+
+## @ingroup Input_Output-SUAVE
+def fingerprint(*values,skip=()):
+    """Fingerprints SUAVE data structures, e.g. a geometry and the settings of an analysis.
+
+    Assumptions:
+    Arrays, strings, booleans, numbers, None and classes are fingerprinted by value. Other objects,
+    e.g. functions and files, are fingerprinted by their type only. Data structures that contain
+    themselves are followed once.
+
+    Source:
+    N/A
+
+    Inputs:
+    values     data structures, arrays or numbers
+    skip       keys of the data structures that are left out, at any depth
+
+    Outputs:
+    key        sha1 hash of the values <string>
+
+    Properties Used:
+    N/A
+    """
+
+    digest = hashlib.sha1()
+
+    def update(value,active):
+        if isinstance(value,array_type):
+            digest.update(str((value.dtype,value.shape)).encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value,dict):
+            if id(value) in active:
+                return
+            active.add(id(value))
+            digest.update(type(value).__name__.encode())
+            for k, v in value.items():
+                if k in skip:
+                    continue
+                digest.update(str(k).encode())
+                update(v,active)
+            active.remove(id(value))
+        elif isinstance(value,(list,tuple)):
+            digest.update(type(value).__name__.encode())
+            for v in value:
+                update(v,active)
+        elif isinstance(value,type):
+            digest.update(value.__qualname__.encode())
+        elif value is None or isinstance(value,(str,bool,int,float,np.number)):
+            digest.update(repr(value).encode())
+        else:
+            digest.update(type(value).__name__.encode())
+
+    for value in values:
+        update(value,set())
+
+    return digest.hexdigest()
+
+## @ingroup Input_Output-SUAVE
+def load_training_cache(directory,name):
+    """Loads surrogate training data that was saved by save_training_cache.
+
+    Assumptions:
+    A file that can not be read is the same as a missing file.
+
+    Source:
+    N/A
+
+    Inputs:
+    directory  <string> - directory of the training cache
+    name       <string> - name of the training data, e.g. the analysis and a fingerprint
+
+    Outputs:
+    training   training data, None if it is not in the cache
+
+    Properties Used:
+    N/A
+    """
+
+    filename = os.path.join(directory,name + '.npz')
+    if not os.path.isfile(filename):
+        return None
+
+    training = Data()
+    try:
+        with np.load(filename,allow_pickle=False) as arrays:
+            for path in arrays.files:
+                keys = path.split('/')
+                data = training
+                for k in keys[:-1]:
+                    if k not in data:
+                        data[k] = Data()
+                    data = data[k]
+                data[keys[-1]] = arrays[path]
+    except (OSError,ValueError,zipfile.BadZipFile):
+        return None
+
+    return training
+
+## @ingroup Input_Output-SUAVE
+def save_training_cache(directory,name,training):
+    """Saves the arrays of surrogate training data to a compressed npz file in the training cache.
+
+    Assumptions:
+    The training data holds arrays, possibly in nested data structures, e.g. one array per wing.
+    Keys do not contain a '/'.
+
+    Source:
+    N/A
+
+    Inputs:
+    directory  <string> - directory of the training cache, made if it does not exist
+    name       <string> - name of the training data, e.g. the analysis and a fingerprint
+    training   training data
+
+    Outputs:
+    <directory>/<name>.npz
+
+    Properties Used:
+    N/A
+    """
+
+    arrays = dict()
+
+    def flatten(data,prefix):
+        for k, v in data.items():
+            if isinstance(v,dict):
+                flatten(v,prefix + k + '/')
+            else:
+                arrays[prefix + k] = np.asarray(v)
+
+    flatten(training,'')
+
+    # write to a temporary file first, so that a concurrent run never reads a partial file
+    os.makedirs(directory,exist_ok=True)
+    handle, temporary = tempfile.mkstemp(suffix='.npz',dir=directory)
+    with os.fdopen(handle,'wb') as f:
+        np.savez_compressed(f,**arrays)
+    os.replace(temporary,os.path.join(directory,name + '.npz'))
+
+    return
@@ -2,7 +2,7 @@
 # save_vehicle_vtks.py
 #
 # Created:    Jun 2021, R. Erhard
-# Modified:
+# Modified:   Oct 2026, SUAVE Team
 #
 
 #----------------------------
@@ -109,8 +109,8 @@ def save_vehicle_vtks(vehicle, conditions=None, Results=Data(),
                 
                 try:
                     # check if rotor has wake present
-                    gamma = propi.Wake.wake_vortex_distribution.GAMMA[start_angle_idx,:,:,:,:]
-                    wVD = propi.Wake.wake_vortex_distribution
+                    wVD = propi.Wake.offset_vortex_distribution()
+                    gamma = wVD.GAMMA[start_angle_idx,:,:,:,:]
                     wake_present = True
                 except:
                     wake_present = False
@@ -1,29 +1,30 @@
 ## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
 # heads_method.py 
 # Created:  Mar 2021, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data 
 import numpy as np
-from scipy.interpolate import interp1d
 from scipy.integrate import odeint  
+from .surface_cases import surface_cases, gather_cases, scatter_cases, interpolate_cases, smooth_cases
 # ----------------------------------------------------------------------
 # heads_method.py 
 # ----------------------------------------------------------------------   
 ## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
 def heads_method(npanel,nalpha,nRe,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,RE_L,TURBULENT_COORD,
-                 VE_I, DVE_I,batch_analysis,tol):
+                 VE_I, DVE_I,batch_analysis,tol,substeps = 4):
     """ Computes the boundary layer characteristics in turbulent
-    flow pressure gradients
+    flow pressure gradients. All cases are marched along the surface together.
 
     Source:
     Head, M. R., and P. Bandyopadhyay. "New aspects of turbulent boundary-layer structure."
     Journal of fluid mechanics 107 (1981): 297-338.
 
     Assumptions:
-    None  
+    The boundary layer velocity and its derivative are linear between surface points  
 
     Inputs: 
     nalpha         - number of angle of attacks                                                    [unitless]
@@ -39,6 +40,7 @@ def heads_method(npanel,nalpha,nRe,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,RE
     DVE_I          - intial derivative value of boundary layer velocity at transition location     [unitless] 
     npanel         - number of points on surface                                                   [unitless]
     tol            - boundary layer error correction tolerance                                     [unitless]
+    substeps       - Runge-Kutta steps between surface points                                      [unitless]
 
     Outputs: 
     RESULTS.
@@ -65,88 +67,85 @@ def heads_method(npanel,nalpha,nRe,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,RE
     RE_X_H       = np.zeros_like(X_H)
     DELTA_H      = np.zeros_like(X_H)       
 
-    if batch_analysis:
-        N_ALPHA = nalpha
-    else:
-        N_ALPHA = 1  
-    for a_i in range(N_ALPHA):
-        for re_i in range(nRe):   
-            if not batch_analysis:  
-                a_i = re_i  
-            # length of tubulent surface  
-            l = TURBULENT_SURF[a_i,re_i] 
-            if l == 0.0:
-                pass
-            else: 
-                theta_0      = THETA_0[a_i,re_i] 
-                Re_L         = RE_L[a_i,re_i] 
-                nu           = l/Re_L    
-                x_i          = TURBULENT_COORD.data[:,a_i,re_i][TURBULENT_COORD.mask[:,a_i,re_i] ==False] 
-                Ve_i         = VE_I.data[:,a_i,re_i][TURBULENT_COORD.mask[:,a_i,re_i] ==False]
-                dVe_i        = DVE_I.data[:,a_i,re_i][TURBULENT_COORD.mask[:,a_i,re_i] ==False]  
-                del_0        = DEL_0[a_i,re_i]
-                del_star_0   = DELTA_STAR_0[a_i,re_i]
-                H_0          = del_star_0 / theta_0
-                H1_0         = getH1(np.atleast_1d(H_0))[0]
-                if np.isnan(H1_0):
-                    H1_0     = (del_0 - del_star_0) / theta_0 
-                y0           = [theta_0, getVe(0,x_i,Ve_i)*theta_0*H1_0]     
-                y            = odeint(odefcn,y0,x_i,args=(Re_L/l, x_i, Ve_i, dVe_i))  
-                
-                # Compute momentum thickness, theta 
-                theta        = y[:,0] 
-                Ve_theta_H1  = y[:,1]    
-                
-                # find theta values that do not converge and replace them with neighbor
-                idx1         = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol )[0]
-                if len(idx1)> 1: 
-                    np.put(theta,idx1 + 1, theta[idx1])    
-                idx1         = np.where(abs((Ve_theta_H1[1:] - Ve_theta_H1[:-1])/Ve_theta_H1[:-1]) >tol)[0]
-                if len(idx1)> 1: 
-                    np.put(Ve_theta_H1,idx1 + 1, Ve_theta_H1[idx1])    
-                  
-                # Compute mass flow shape factor, H1
-                H1           = Ve_theta_H1/(theta*Ve_i)
-                
-                # Compute H 
-                H            = getH(np.atleast_1d(H1)) 
-                H[H<0]       = 1E-6    # H cannot be negative 
-                # find H values that do not converge and replace them with neighbor
-                idx1               = np.where(abs((H[1:] - H[:-1])/H[:-1]) >tol)[0]
-                if len(idx1)> 1: 
-                    np.put(H,idx1 + 1, H[idx1])     
-                
-                # Compute Reynolds numbers based on momentum thickness  
-                Re_theta     = Re_L/l * Ve_i*theta 
-                
-                # Compute Reynolds numbers based on distance along airfoil
-                Re_x         = Ve_i* x_i / nu
-                
-                # Compute skin friction 
-                cf           = abs( getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))) 
-                
-                # Compute displacement thickness
-                del_star     = H*theta   
-                
-                # Compute boundary layer thickness 
-                delta        = theta*H1 + del_star 
-                delta[0]     = 0  
-                
-                # Reynolds number at x=0 cannot be negative (give nans)
-                Re_x[0]      = 1E-5                
+    # line up the turbulent surface points of all cases, columns are cases 
+    cases        = surface_cases(nalpha,nRe,batch_analysis,np.ma.getmaskarray(TURBULENT_COORD))
+    x_i          = gather_cases(cases,TURBULENT_COORD)
+    Ve_i         = gather_cases(cases,VE_I)
+    dVe_i        = gather_cases(cases,DVE_I)
+    l            = np.ma.getdata(TURBULENT_SURF)[cases.alpha,cases.Re]
+    theta_0      = np.ma.getdata(THETA_0)[cases.alpha,cases.Re]
+    Re_L         = np.ma.getdata(RE_L)[cases.alpha,cases.Re]
+    del_0        = np.ma.getdata(DEL_0)[cases.alpha,cases.Re]
+    del_star_0   = np.ma.getdata(DELTA_STAR_0)[cases.alpha,cases.Re]
     
-                # Find where matrices are not masked 
-                indices = np.where(TURBULENT_COORD.mask[:,a_i,re_i] == False)
-                
-                # Store results 
-                np.put(X_H[:,a_i,re_i],indices,x_i )
-                np.put(THETA_H[:,a_i,re_i],indices,theta)
-                np.put(DELTA_STAR_H[:,a_i,re_i],indices,del_star)
-                np.put(H_H[:,a_i,re_i],indices,H)
-                np.put(CF_H[:,a_i,re_i],indices ,cf)
-                np.put(RE_THETA_H[:,a_i,re_i],indices,Re_theta)
-                np.put(RE_X_H[:,a_i,re_i],indices,Re_x)
-                np.put(DELTA_H[:,a_i,re_i],indices,delta) 
+    # cases without a turbulent surface are left at zero 
+    cases.valid[:,l == 0.0] = False
+    valid        = cases.valid
+    
+    with np.errstate(divide='ignore',invalid='ignore'):
+        nu           = l/Re_L    
+        ReL_div_L    = Re_L/l
+        H_0          = del_star_0 / theta_0
+        H1_0         = getH1(H_0)
+        H1_0         = np.where(np.isnan(H1_0),(del_0 - del_star_0) / theta_0,H1_0)
+        
+        # march all cases along the surface together, with fixed Runge-Kutta steps 
+        # between surface points 
+        theta          = np.zeros_like(x_i)
+        Ve_theta_H1    = np.zeros_like(x_i)
+        theta[0]       = theta_0
+        Ve_theta_H1[0] = interpolate_cases(0,x_i,Ve_i,cases.count)*theta_0*H1_0
+        for k in range(len(x_i)-1):
+            args  = (theta[k],Ve_theta_H1[k],x_i[k+1] - x_i[k],ReL_div_L,Ve_i[k],Ve_i[k+1],dVe_i[k],dVe_i[k+1])
+            theta[k+1], Ve_theta_H1[k+1] = runge_kutta_step(*args,substeps)
+            
+            # cases that end up near the singularity of the entrainment correlation, H1 = 3, 
+            # are integrated again with the adaptive solver 
+            redo  = valid[k+1] & np.isfinite(theta[k]*Ve_theta_H1[k]) & ~(Ve_theta_H1[k+1]/(theta[k+1]*Ve_i[k+1]) > 3.3)
+            if np.any(redo):
+                theta[k+1,redo], Ve_theta_H1[k+1,redo] = adaptive_step(*[arg[redo] for arg in args])
+        
+        # find theta values that do not converge and replace them with neighbor
+        theta        = smooth_cases(theta,valid,tol)
+        Ve_theta_H1  = smooth_cases(Ve_theta_H1,valid,tol)
+          
+        # Compute mass flow shape factor, H1
+        H1           = Ve_theta_H1/(theta*Ve_i)
+        
+        # Compute H 
+        H            = getH(H1) 
+        H[H<0]       = 1E-6    # H cannot be negative 
+        # find H values that do not converge and replace them with neighbor
+        H            = smooth_cases(H,valid,tol)
+        
+        # Compute Reynolds numbers based on momentum thickness  
+        Re_theta     = ReL_div_L * Ve_i*theta 
+        
+        # Compute Reynolds numbers based on distance along airfoil
+        Re_x         = Ve_i* x_i / nu
+        
+        # Compute skin friction 
+        cf           = abs( getcf(Re_theta,H)) 
+        
+        # Compute displacement thickness
+        del_star     = H*theta   
+        
+        # Compute boundary layer thickness 
+        delta        = theta*H1 + del_star 
+        delta[0]     = 0  
+        
+    # Reynolds number at x=0 cannot be negative (give nans)
+    Re_x[0]      = 1E-5                
+    
+    # Store results 
+    scatter_cases(cases,x_i,X_H)
+    scatter_cases(cases,theta,THETA_H)
+    scatter_cases(cases,del_star,DELTA_STAR_H)
+    scatter_cases(cases,H,H_H)
+    scatter_cases(cases,cf,CF_H)
+    scatter_cases(cases,Re_theta,RE_THETA_H)
+    scatter_cases(cases,Re_x,RE_X_H)
+    scatter_cases(cases,delta,DELTA_H) 
 
     RESULTS = Data(
         X_H          = X_H,      
@@ -161,6 +160,39 @@ def heads_method(npanel,nalpha,nRe,DEL_0,THETA_0,DELTA_STAR_0, TURBULENT_SURF,RE
 
     return  RESULTS
 
+def adaptive_step(theta,Ve_theta_H1,h,ReL_div_L,Ve_0,Ve_1,dVe_0,dVe_1): 
+    """ Marches the boundary layer functions of a few cases from one surface point to the 
+    next with the adaptive SciPy ODE solver 
+    Assumptions:
+    The velocity and its derivative are linear between the surface points
+    Source:
+    None
+    Inputs:  
+    theta       - momentum thickness                            [m]
+    Ve_theta_H1 - product of the velocity, momentum thickness 
+                  and the mass flow shape factor                [m^2/s]
+    h           - distance to the next surface point            [unitless]
+    ReL_div_L   - ratio of Reynolds number to length of surface [unitless]
+    Ve_0, Ve_1  - boundary layer velocity at both points        [m/s]
+    dVe_0,dVe_1 - derivative of bounday layer velocity          [m/s-m]
+
+    Outputs:  
+    theta       - momentum thickness at the next point          [m]
+    Ve_theta_H1 - product at the next point                     [m^2/s]
+    Properties Used:
+    N/A 
+    """    
+    n = len(theta)
+    def f(y,t):
+        Ve  = Ve_0  + t*(Ve_1  - Ve_0)
+        dVe = dVe_0 + t*(dVe_1 - dVe_0)
+        dtheta_dx, dVe_theta_H1_dx = odefcn(y[:n],y[n:],ReL_div_L,Ve,dVe)
+        return np.hstack([dtheta_dx*h,dVe_theta_H1_dx*h])
+    
+    y = odeint(f,np.hstack([theta,Ve_theta_H1]),[0.,1.])[-1]
+    
+    return y[:n], y[n:]
+
 def getH(H1):
     """ Computes the shape factor, H
     Assumptions:
@@ -199,82 +231,74 @@ def getH1(H) :
     H1[idx1] = 3.3 + 1.5501*(H[idx1] - 0.6778)**-3.064
     return H1 
 
-def odefcn(y,x,ReL_div_L, x_i, Ve_i, dVe_i): 
-    """ Computes boundary layer functions using SciPy ODE solver 
+def odefcn(theta,Ve_theta_H1,ReL_div_L,Ve,dVe): 
+    """ Computes the derivatives of the boundary layer functions of all cases 
     Assumptions:
     None
     Source:
     None
     Inputs:  
-    y           - initial conditions of functions               [unitless]
-    x           - new x values at which to solve ODE            [unitless]
+    theta       - momentum thickness                            [m]
+    Ve_theta_H1 - product of the velocity, momentum thickness 
+                  and the mass flow shape factor                [m^2/s]
     ReL_div_L   - ratio of Reynolds number to length of surface [unitless]
-    x_i         - intial array of x values                      [unitless]
-    Ve_i        - intial boundary layer velocity                [m/s]
-    dVe_i       - initial derivative of bounday layer velocity  [m/s-m]
+    Ve          - boundary layer velocity                       [m/s]
+    dVe         - derivative of bounday layer velocity          [m/s-m]
 
     Outputs:  
-    f           - 2D function of momentum thickness and the product of 
-                  the velocity,momentum thickness and the mass flow shape factor
+    dtheta_dx       - derivative of the momentum thickness                  [unitless]
+    dVe_theta_H1_dx - derivative of the product of the velocity, momentum 
+                      thickness and the mass flow shape factor              [m/s]
     Properties Used:
     N/A 
     """    
-    theta       = y[0]
-    Ve_theta_H1 = y[1]  
-
-    if theta == 0:
-        H1 = Ve_theta_H1 / (theta + 1e-6) / getVe(x,x_i,Ve_i)
-    else:
-        H1 = Ve_theta_H1 / theta / getVe(x,x_i,Ve_i)
-
-    H           = getH(np.atleast_1d(H1))
-    Re_theta    = ReL_div_L * theta
-    cf          = getcf(np.atleast_1d(Re_theta),np.atleast_1d(H))
-    dydx_1      = 0.5*cf-(theta/getVe(x,x_i,Ve_i))*(2+H)*getdVe(x, x_i, dVe_i)
-    dydx_2      = getVe(x,x_i,Ve_i)*0.0306*(H1 - 3)**-0.6169 
-    f           = [dydx_1,dydx_2] 
-    return f 
+    H1              = Ve_theta_H1 / np.where(theta == 0,theta + 1e-6,theta) / Ve
+    H               = getH(H1)
+    Re_theta        = ReL_div_L * theta
+    cf              = getcf(Re_theta,H)
+    dtheta_dx       = 0.5*cf-(theta/Ve)*(2+H)*dVe
+    dVe_theta_H1_dx = Ve*0.0306*(H1 - 3)**-0.6169 
+    return dtheta_dx, dVe_theta_H1_dx 
 
-def getVe(x,x_i,Ve_i):
-    """ Interpolates the bounday layer velocity over a new dimension of x 
+def runge_kutta_step(theta,Ve_theta_H1,h,ReL_div_L,Ve_0,Ve_1,dVe_0,dVe_1,substeps): 
+    """ Marches the boundary layer functions of all cases from one surface point to the 
+    next with classic fourth order Runge-Kutta steps 
     Assumptions:
-    None
+    The velocity and its derivative are linear between the surface points
     Source:
     None
-    Inputs: 
-    x         - new x dimension                    [unitless]
-    x_i       - old x dimension                    [unitless]
-    Ve_i      - old boundary layer velocity values [m/s] 
+    Inputs:  
+    theta       - momentum thickness                            [m]
+    Ve_theta_H1 - product of the velocity, momentum thickness 
+                  and the mass flow shape factor                [m^2/s]
+    h           - distance to the next surface point            [unitless]
+    ReL_div_L   - ratio of Reynolds number to length of surface [unitless]
+    Ve_0, Ve_1  - boundary layer velocity at both points        [m/s]
+    dVe_0,dVe_1 - derivative of bounday layer velocity          [m/s-m]
+    substeps    - number of steps between the points            [unitless]
 
     Outputs:  
-    Ve        - new boundary layer velocity values [m/s]
+    theta       - momentum thickness at the next point          [m]
+    Ve_theta_H1 - product at the next point                     [m^2/s]
     Properties Used:
     N/A 
     """    
-    Ve_func = interp1d(x_i,Ve_i,fill_value = "extrapolate")
-    Ve      = Ve_func(x)
-    return Ve 
-
-def getdVe(x,x_i,dVe_i):
-    """ Interpolates the derivatives of the bounday layer velocity over a new dimension of x
-
-    Assumptions:
-    None
-    Source:
-    None
-    Inputs: 
-    x         - new x dimension                                  [unitless]
-    x_i       - old x dimension                                  [unitless]
-    dVe_i     - old derivative of boundary layer velocity values [m/s-m] 
-
-    Outputs:  
-    dVe       - new derivative of boundary layer velocity values [m/s-m]
-    Properties Used:
-    N/A 
-    """        
-    dVe_func = interp1d(x_i,dVe_i,fill_value = "extrapolate")
-    dVe      = dVe_func(x)
-    return dVe  
+    def f(t,theta,Ve_theta_H1):
+        Ve  = Ve_0  + t*(Ve_1  - Ve_0)
+        dVe = dVe_0 + t*(dVe_1 - dVe_0)
+        return odefcn(theta,Ve_theta_H1,ReL_div_L,Ve,dVe)
+    
+    dt = 1./substeps
+    dx = h*dt
+    for i in range(substeps):
+        t      = i*dt
+        k1, l1 = f(t,        theta,            Ve_theta_H1)
+        k2, l2 = f(t + dt/2, theta + dx*k1/2,  Ve_theta_H1 + dx*l1/2)
+        k3, l3 = f(t + dt/2, theta + dx*k2/2,  Ve_theta_H1 + dx*l2/2)
+        k4, l4 = f(t + dt,   theta + dx*k3,    Ve_theta_H1 + dx*l3)
+        theta       = theta       + dx*(k1 + 2*k2 + 2*k3 + k4)/6
+        Ve_theta_H1 = Ve_theta_H1 + dx*(l1 + 2*l2 + 2*l3 + l4)/6
+    return theta, Ve_theta_H1
 
 def getcf(Re_theta,H): 
     """ Computes the skin friction coefficient, cf
@@ -0,0 +1,194 @@
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+# surface_cases.py
+
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+from SUAVE.Core import Data
+import numpy as np
+
+# ----------------------------------------------------------------------
+# surface_cases
+# ----------------------------------------------------------------------
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def surface_cases(nalpha,nRe,batch_analysis,mask):
+    """ Lines up the surface points of every (angle of attack, Reynolds number) case so
+    that the boundary layer of all cases can be marched along the surface at once. The
+    unmasked points of each case are moved to the front of its column, in order, and the
+    column is padded with its last point.
+
+    Source:
+    None
+
+    Assumptions:
+    Without batch analysis the i-th angle of attack is paired with the i-th Reynolds number
+
+    Inputs:
+    nalpha         - number of angle of attacks                                  [unitless]
+    nRe            - number of reynolds numbers                                  [unitless]
+    batch_analysis - flag for batch analysis                                     [boolean]
+    mask           - masked surface points, npanel x nalpha x nRe                [boolean]
+
+    Outputs:
+    cases.
+      alpha        - angle of attack index of each case                          [unitless]
+      Re           - Reynolds number index of each case                          [unitless]
+      index        - surface point of each lined up point, npanel x ncases       [unitless]
+      count        - number of surface points of each case                       [unitless]
+      valid        - lined up points that are surface points, npanel x ncases    [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    if batch_analysis:
+        a_i  = np.repeat(np.arange(nalpha),nRe)
+        re_i = np.tile(np.arange(nRe),nalpha)
+    else:
+        a_i  = np.arange(nRe)
+        re_i = np.arange(nRe)
+
+    mask   = np.broadcast_to(mask,(np.shape(mask)[0],nalpha,nRe))[:,a_i,re_i]
+    index  = np.argsort(mask,axis=0,kind='stable')
+    count  = np.sum(~mask,axis=0)
+    npts   = np.arange(len(mask))[:,None]
+    valid  = npts < count
+
+    # pad each case with its last point so the padding adds nothing to the march
+    last          = np.maximum(count-1,0)
+    index[~valid] = np.broadcast_to(index[last,np.arange(len(count))],index.shape)[~valid]
+
+    cases       = Data()
+    cases.alpha = a_i
+    cases.Re    = re_i
+    cases.index = index
+    cases.count = count
+    cases.valid = valid
+
+    return cases
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def gather_cases(cases,values):
+    """ Lines up the surface values of every case, see surface_cases
+
+    Source:
+    None
+
+    Assumptions:
+    None
+
+    Inputs:
+    cases          - lined up cases from surface_cases                           [Data]
+    values         - surface values, npanel x nalpha x nRe                       [unitless]
+
+    Outputs:
+    lined_up       - lined up values, npanel x ncases                            [unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    values = np.ma.getdata(values)
+
+    return values[cases.index,cases.alpha,cases.Re]
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def scatter_cases(cases,lined_up,values):
+    """ Puts the lined up values of every case back on the surface points, see surface_cases
+
+    Source:
+    None
+
+    Assumptions:
+    None
+
+    Inputs:
+    cases          - lined up cases from surface_cases                           [Data]
+    lined_up       - lined up values, npanel x ncases                            [unitless]
+    values         - surface values to fill, npanel x nalpha x nRe               [unitless]
+
+    Outputs:
+    values         - surface values, npanel x nalpha x nRe                       [unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    valid = cases.valid
+    cols  = np.broadcast_to(np.arange(len(cases.count)),valid.shape)[valid]
+
+    values[cases.index[valid],cases.alpha[cols],cases.Re[cols]] = lined_up[valid]
+
+    return values
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def interpolate_cases(x,x_i,v_i,count):
+    """ Linearly interpolates, or extrapolates from the end intervals, the lined up values
+    of each case to one location per case
+
+    Source:
+    None
+
+    Assumptions:
+    The surface points of each case are in increasing order
+
+    Inputs:
+    x              - location of each case                                       [unitless]
+    x_i            - lined up surface points, npanel x ncases                    [unitless]
+    v_i            - lined up values, npanel x ncases                            [unitless]
+    count          - number of surface points of each case                       [unitless]
+
+    Outputs:
+    v              - value of each case at x                                     [unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    cols = np.arange(x_i.shape[1])
+    npts = np.arange(len(x_i))[:,None]
+    k    = np.sum((x_i <= x) & (npts < count),axis=0) - 1
+    k    = np.clip(k,0,np.maximum(count-2,0))
+    x0   = x_i[k,cols]
+    x1   = x_i[np.minimum(k+1,len(x_i)-1),cols]
+    v0   = v_i[k,cols]
+    v1   = v_i[np.minimum(k+1,len(x_i)-1),cols]
+
+    with np.errstate(divide='ignore',invalid='ignore'):
+        v = np.where(x1 != x0, v0 + (x - x0)*(v1 - v0)/(x1 - x0), v0)
+
+    return v
+
+## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
+def smooth_cases(values,valid,tol):
+    """ Replaces values that jump by more than a relative tolerance from their neighbor
+    with the neighbor, in every case that has more than one such jump
+
+    Source:
+    None
+
+    Assumptions:
+    None
+
+    Inputs:
+    values         - lined up values, npanel x ncases                            [unitless]
+    valid          - lined up points that are surface points, npanel x ncases    [boolean]
+    tol            - boundary layer error correction tolerance                   [unitless]
+
+    Outputs:
+    values         - lined up values                                             [unitless]
+
+    Properties Used:
+    N/A
+    """
+
+    with np.errstate(divide='ignore',invalid='ignore'):
+        jump = (abs((values[1:] - values[:-1])/values[:-1]) > tol) & valid[1:]
+    jump[:,np.sum(jump,axis=0) <= 1] = False
+
+    smoothed      = values.copy()
+    smoothed[1:]  = np.where(jump,values[:-1],values[1:])
+
+    return smoothed
@@ -2,14 +2,15 @@
 # thwaites_method.py 
 
 # Created:  Mar 2021, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 from SUAVE.Core import Data 
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.integrate import odeint 
+
+from .surface_cases import surface_cases, gather_cases, scatter_cases, interpolate_cases, smooth_cases
 
 # ----------------------------------------------------------------------
 # thwaites_method
@@ -17,14 +18,14 @@ from scipy.integrate import odeint
 ## @ingroup Methods-Aerodynamics-Airfoil_Panel_Method
 def thwaites_method(npanel,nalpha,nRe,L,RE_L,X_I,VE_I, DVE_I,batch_analysis,tol,THETA_0):
     """ Computes the boundary layer characteristics in laminar 
-    flow pressure gradients
+    flow pressure gradients. All cases are marched along the surface together.
     
     Source:
     Thwaites, Bryan. "Approximate calculation of the laminar boundary layer." 
     Aeronautical Quarterly 1.3 (1949): 245-280.
     
     Assumptions:
-    None  
+    The boundary layer velocity is linear between surface points  
 
     Inputs:  
     npanel         - number of points on surface                                                 [unitless]
@@ -64,76 +65,69 @@ def thwaites_method(npanel,nalpha,nRe,L,RE_L,X_I,VE_I, DVE_I,batch_analysis,tol,
     RE_X_T       = np.zeros_like(X_T)
     DELTA_T      = np.zeros_like(X_T)  
     
-    if batch_analysis:
-        N_ALPHA = nalpha
-    else:
-        N_ALPHA = 1 
+    # line up the surface points of all cases, columns are cases 
+    cases       = surface_cases(nalpha,nRe,batch_analysis,np.ma.getmaskarray(X_I))
+    x_i         = gather_cases(cases,X_I)
+    Ve_i        = gather_cases(cases,VE_I)
+    dVe_i       = gather_cases(cases,DVE_I)
+    valid       = cases.valid
+    l           = np.ma.getdata(L)[cases.alpha,cases.Re]
+    Re_L        = np.ma.getdata(RE_L)[cases.alpha,cases.Re]
+    nu          = l/Re_L 
+    
+    # integrate theta**2*Ve**6 along the surface of all cases at once, the integral of 
+    # Ve**5 over each panel is exact for the linearly interpolated velocity 
+    y0          = THETA_0**2 * interpolate_cases(0,x_i,Ve_i,cases.count)**6 
+    h           = np.diff(x_i,axis=0)
+    Ve5_int     = h*sum(Ve_i[:-1]**j * Ve_i[1:]**(5-j) for j in range(6))/6
+    theta2_Ve6  = np.zeros_like(x_i)
+    theta2_Ve6[0]  = y0
+    theta2_Ve6[1:] = y0 + np.cumsum(0.45*nu*Ve5_int,axis=0)
+    
+    with np.errstate(divide='ignore',invalid='ignore'):
+        # Compute momentum thickness, theta 
+        theta       = np.sqrt(theta2_Ve6/ Ve_i**6)
+        
+        # find theta values that do not converge and replace them with neighbor
+        theta       = smooth_cases(theta,valid,tol)
+        
+        # Thwaites separation criteria 
+        lambda_val  = theta**2 * dVe_i / nu 
+        
+        # Compute H 
+        H           = getH(lambda_val)
+        H[H<0]      = 1E-6   # H cannot be negative 
+        # find H values that do not converge and replace them with neighbor
+        H           = smooth_cases(H,valid,tol)
+        
+        # Compute Reynolds numbers based on momentum thickness  
+        Re_theta    = Ve_i * theta / nu
+        
+        # Compute Reynolds numbers based on distance along airfoil
+        Re_x        = Ve_i * x_i/ nu
+        
+        # Compute skin friction 
+        cf          = abs(getcf(lambda_val ,Re_theta)) 
+        
+        # Compute displacement thickness
+        del_star    = H*theta   
+        
+        # Compute boundary layer thickness 
+        delta       = 5.2*x_i/np.sqrt(Re_x)
+        delta[0]    = 0   
+    
+    # Reynolds number at x=0 cannot be negative 
+    Re_x[0]     = 1E-5
     
-    for a_i in range(N_ALPHA):
-        for re_i in range(nRe):    
-            if not batch_analysis:  
-                a_i = re_i 
-            # compute laminar boundary layer properties  
-            l           = L[a_i,re_i]
-            theta_0     = THETA_0 
-            Re_L        = RE_L[a_i,re_i]
-            nu          = l/Re_L    
-            x_i         = X_I.data[:,a_i,re_i][X_I.mask[:,a_i,re_i] ==False]
-            Ve_i        = VE_I.data[:,a_i,re_i][VE_I.mask[:,a_i,re_i] ==False]
-            dVe_i       = DVE_I.data[:,a_i,re_i][DVE_I.mask[:,a_i,re_i] ==False] 
-            y0          = theta_0**2 * getVe(0,x_i,Ve_i)**6   
-            theta2_Ve6  = odeint(odefcn, y0,x_i , args=(nu, x_i, Ve_i))  
-            
-            # Compute momentum thickness, theta 
-            theta       = np.sqrt(theta2_Ve6[:,0]/ Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-            
-            # Thwaites separation criteria 
-            lambda_val  = theta**2 * dVe_i / nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) >tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i * theta / nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i * x_i/ nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val ,Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,a_i,re_i] == False)
-            
-            # Store results 
-            np.put(X_T[:,a_i,re_i],indices,x_i)
-            np.put(THETA_T[:,a_i,re_i],indices,theta)
-            np.put(DELTA_STAR_T[:,a_i,re_i],indices,del_star)
-            np.put(H_T[:,a_i,re_i],indices,H)
-            np.put(CF_T[:,a_i,re_i],indices ,cf)
-            np.put(RE_THETA_T[:,a_i,re_i],indices,Re_theta)
-            np.put(RE_X_T[:,a_i,re_i],indices,Re_x)
-            np.put(DELTA_T[:,a_i,re_i],indices,delta)
+    # Store results 
+    scatter_cases(cases,x_i,X_T)
+    scatter_cases(cases,theta,THETA_T)
+    scatter_cases(cases,del_star,DELTA_STAR_T)
+    scatter_cases(cases,H,H_T)
+    scatter_cases(cases,cf,CF_T)
+    scatter_cases(cases,Re_theta,RE_THETA_T)
+    scatter_cases(cases,Re_x,RE_X_T)
+    scatter_cases(cases,delta,DELTA_T)
     
     RESULTS = Data(
         X_T          = X_T,      
@@ -171,79 +165,6 @@ def getH(lambda_val ):
     H[idx1] = 2.61 - 3.75*lambda_val[idx1]  + 5.24*lambda_val[idx1]**2   
     return H 
     
-def odefcn(y,x, nu,x_i,Ve_i):
-    """ Computes boundary layer functions using SciPy ODE solver 
-
-    Assumptions:
-    None
-
-    Source:
-    None
-
-    Inputs: 
-    y           - initial conditions of functions    [unitless]
-    x           - new x values at which to solve ODE [unitless]
-    nu          - kinematic viscosity                [m^2/s]
-    x_i         - intial array of x values           [unitless]
-    Ve_i        - intial boundary layer velocity     [m/s]
-    
-    Outputs:  
-    dydx        - expression for the momentum thickness and velocity (theta**2/Ve**6)
-
-    Properties Used:
-    N/A 
-    """        
-    dydx = 0.45*getVe(x,x_i,Ve_i)**5*nu
-    return dydx 
-    
-def getVe(x,x_i,Ve_i):
-    """ Interpolates the bounday layer velocity over a new dimension of x 
-
-    Assumptions:
-    None
-
-    Source:
-    None
-
-    Inputs: 
-    x         - new x dimension                    [unitless]
-    x_i       - old x dimension                    [unitless]
-    Ve_i      - old boundary layer velocity values [m/s] 
-    
-    Outputs:  
-    Ve        - new boundary layer velocity values [m/s]
-
-    Properties Used:
-    N/A 
-    """
-    Ve_func = interp1d(x_i,Ve_i, axis=0,fill_value = "extrapolate")
-    Ve      = Ve_func(x)
-    return Ve  
-
-def getdVe(x,x_i,dVe_i):
-    """ Interpolates the derivatives of the bounday layer velocity over a new dimension of x 
-
-    Assumptions:
-    None
-
-    Source:
-    None
-
-    Inputs: 
-    x         - new x dimension                                   [unitless]
-    x_i       - old x dimension                                   [unitless]
-    dVe_i     - old derivative of boundary layer velocity values  [m/s-m]
-    
-    Outputs:  
-    dVe       - new derivative of boundary layer velocity values  [m/s-m]
-
-    Properties Used:
-    N/A 
-    """
-    dVe_func = interp1d(x_i,dVe_i,fill_value = "extrapolate")
-    dVe      = dVe_func(x)
-    return dVe 
-
 def getcf(lambda_val , Re_theta):
     """ Computes the skin friction coefficient, cf
 
@@ -4,6 +4,7 @@
 # Created:  Oct 2020, E. Botero
 # Modified: May 2021, E. Botero   
 #           Jul 2021, A. Blaufox     
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,7 +12,10 @@
 
 # package imports 
 import numpy as np 
+import hashlib
+from scipy.linalg import lu_factor, lu_solve
 from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_wing_induced_velocity      import compute_wing_induced_velocity
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.generate_vortex_distribution       import generate_vortex_distribution 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.compute_RHS_matrix                 import compute_RHS_matrix 
@@ -241,30 +245,24 @@ def VLM(conditions,settings,geometry):
     RHS     = rhs.RHS*1
     ONSET   = rhs.ONSET*1
 
-    # Build induced velocity matrix, C_mn
-    # This is not affected by AoA, so we can use unique mach numbers only
+    # Build the induced velocity matrix, C_mn, the Aerodynamic Influence Coefficient Matrix and its LU
+    # factorization. These are not affected by AoA, so we use unique mach numbers only, and keep them
+    # between calls for the same vortex distribution
     m_unique, inv = np.unique(mach,return_inverse=True)
     m_unique      = np.atleast_2d(m_unique).T
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+    factors       = influence_matrix_factors(VD,m_unique,delta,phi,settings)
     
-    C_mn  = C_mn_small[inv,:,:,:]
-    RFLAG = RFLAG_small[inv,:]
-    EW    = EW_small[inv,:,:]
+    s     = factors.s
+    RFLAG = factors.RFLAG[inv,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
     
-    # Build Aerodynamic Influence Coefficient Matrix
-    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
-    if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
-    else:
-        A = EW
-
-    # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
+    # Compute vortex strength, back substituting all control points at the same mach number at once
+    GAMMA = np.zeros(np.shape(RHS),dtype=np.result_type(factors.dtype,RHS))
+    for i, LU in enumerate(factors.LU):
+        rows        = inv == i
+        GAMMA[rows] = lu_solve(LU,RHS[rows].T).T
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
@@ -400,7 +398,7 @@ def VLM(conditions,settings,geometry):
     # ONLY PERFORMED FOR COSINE CHORDWISE SPACING (LAX = 0).    
     # ** TO DO ** Add cosine spacing (earlier in VLM) to properly capture the magnitude of these earlier.
     # Right now, this computation still happens with linear spacing, though its effects are underestimated.
-    CLE = compute_rotation_effects(VD, settings, EW, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+    CLE = compute_rotation_effects(VD, settings, factors.EW, inv, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
                                    rhs, COSINP, SINALF, PITCH, ROLL, YAW, STB, RNMAX)    
     
     # Leading edge suction multiplier. See documentation. This is a negative integer if used
@@ -520,10 +518,128 @@ def VLM(conditions,settings,geometry):
     
     return results
 
+# ----------------------------------------------------------------------
+#  Influence matrix factorization cache
+# ----------------------------------------------------------------------
+
+# LU factors of the influence matrix, keyed on the vortex distribution and mach number
+influence_matrix_cache = Data()
+influence_matrix_cache.factors     = dict()
+influence_matrix_cache.max_entries = 32
+influence_matrix_cache.hits        = 0
+influence_matrix_cache.misses      = 0
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def influence_matrix_factors(VD,m_unique,delta,phi,settings):
+    """ Returns the LU factorization of the Aerodynamic Influence Coefficient Matrix for each unique mach 
+    number, along with the sonic vortex flags and the VORLAX frame velocities. Factors are kept in 
+    influence_matrix_cache, so the matrix is only built and factored again when the vortex distribution, 
+    mach number or matrix calculation changes.
+    
+    Assumptions:
+    The influence matrix depends on the vortex distribution and the mach number only
+    
+    Source:
+    N/A
+    
+    Inputs:
+    VD                                         [Unitless] 
+    m_unique                                   [Unitless], sorted unique mach numbers, column vector
+    delta                                      [radians], mean camber surface angle
+    phi                                        [radians], dihedral angle
+    settings.use_VORLAX_matrix_calculation     [boolean]
+    
+    Outputs:
+    factors.
+        LU                                     list of LU factors for each mach number
+        RFLAG                                  [boolean], sonic vortex flags for each mach number
+        EW                                     [Unitless], W velocity in the VORLAX frame for each mach number
+        s                                      [m], semispan of the horshoe vortices
+        dtype                                  floating point type of the factors
+    
+    Properties Used:
+    influence_matrix_cache
+    """
+    
+    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
+    geometry_key = vortex_distribution_key(VD)
+    keys         = [(geometry_key,float(m),bool(use_VORLAX_induced_velocity)) for m in m_unique[:,0]]
+    cache        = influence_matrix_cache.factors
+    missing      = [i for i, key in enumerate(keys) if key not in cache]
+    
+    influence_matrix_cache.hits   += len(keys) - len(missing)
+    influence_matrix_cache.misses += len(missing)
+    
+    if missing:
+        C_mn, s, RFLAG, EW = compute_wing_induced_velocity(VD,m_unique[missing],compute_EW=True)
+        
+        # Build Aerodynamic Influence Coefficient Matrix
+        if not use_VORLAX_induced_velocity:
+            A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta[:1])*np.cos(phi[:1]))) \
+                + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta[:1])*np.sin(phi[:1]))) \
+                - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi[:1])*np.cos(delta[:1])))   # validated from book eqn 7.42 
+        else:
+            A = EW
+            
+        for j, i in enumerate(missing):
+            entry       = Data()
+            entry.LU    = lu_factor(np.array(A[j],dtype=np.float64))
+            entry.RFLAG = RFLAG[j]
+            entry.EW    = EW[j]
+            entry.s     = s
+            cache[keys[i]] = entry
+            
+        # forget the oldest factors
+        while len(cache) > influence_matrix_cache.max_entries:
+            del cache[next(iter(cache))]
+            
+    entries = [cache[key] for key in keys]
+    
+    factors       = Data()
+    factors.LU    = [entry.LU for entry in entries]
+    factors.RFLAG = np.array([entry.RFLAG for entry in entries])
+    factors.EW    = np.array([entry.EW for entry in entries])
+    factors.s     = entries[0].s
+    factors.dtype = np.float64
+    
+    return factors
+
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def vortex_distribution_key(VD):
+    """ Fingerprints the arrays and numbers of a vortex distribution
+    
+    Assumptions:
+    N/A
+    
+    Source:
+    N/A
+    
+    Inputs:
+    VD                                         [Unitless] 
+    
+    Outputs:
+    key                                        [string]
+    
+    Properties Used:
+    N/A
+    """
+    
+    digest = hashlib.sha1()
+    for k in sorted(VD.keys()):
+        v = VD[k]
+        if isinstance(v,array_type):
+            digest.update(k.encode())
+            digest.update(str((v.dtype,v.shape)).encode())
+            digest.update(np.ascontiguousarray(v).tobytes())
+        elif isinstance(v,(int,float,bool,np.number)):
+            digest.update((k + repr(v)).encode())
+    
+    return digest.hexdigest()
+
 # ----------------------------------------------------------------------
 #  CLE rotation effects helper function
 # ----------------------------------------------------------------------
-def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+def compute_rotation_effects(VD, settings, EW_small, inv, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
                              rhs, COSINP, SINALF, PITCH, ROLL, YAW, STB, RNMAX):
     """ This computes the effects of the freestream and aircraft rotation rate on 
     CLE, the induced flow at the leading edge
@@ -543,8 +659,9 @@ def compute_rotation_effects(VD, settings, EW_small, GAMMA, len_mach, X, CHORD,
     ##    return 0 #CLE not calculated till later for linear spacing
     
     # Computate rotational effects (pitch, roll, yaw rates) on LE suction
-    # pick leading edge strip values for EW and reshape GAMMA -> gamma accordingly
-    EW    = EW_small[: ,LE_ind, :]
+    # pick leading edge strip values for EW of each unique mach number, expand them to every control point, 
+    # and reshape GAMMA -> gamma accordingly
+    EW    = EW_small[: ,LE_ind, :][inv]
     n_tot_strips = EW.shape[1]
     gamma = np.array(np.split(np.repeat(GAMMA, n_tot_strips, axis=0), len_mach))
     CLE = (EW*gamma).sum(axis=2)
@@ -4,6 +4,7 @@
 # Created:  May 2018, M. Clarke
 # Modified: Apr 2020, M. Clarke
 #           Jun 2021, A. Blaufox
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -13,6 +14,8 @@
 import numpy as np
 
 from SUAVE.Core import  Data
+from SUAVE.Core.Arrays import array_type
+from SUAVE.Input_Output.SUAVE.training_cache import fingerprint
 from SUAVE.Components.Wings import All_Moving_Surface
 from SUAVE.Components.Fuselages import Fuselage
 from SUAVE.Components.Nacelles  import Nacelle
@@ -20,6 +23,30 @@ from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.make_VLM_wings import
 from SUAVE.Methods.Geometry.Two_Dimensional.Cross_Section.Airfoil.import_airfoil_geometry\
      import import_airfoil_geometry
 
+# ----------------------------------------------------------------------
+#  Vortex Distribution Cache
+# ----------------------------------------------------------------------
+
+# vortex distributions already generated, keyed on a fingerprint of the geometry and discretization
+vortex_distribution_cache = Data()
+vortex_distribution_cache.distributions = dict()
+vortex_distribution_cache.max_entries   = 8
+vortex_distribution_cache.hits          = 0
+vortex_distribution_cache.misses        = 0
+
+# settings the vortex distribution depends on
+discretization_settings = ['spanwise_cosine_spacing',
+                           'model_fuselage',
+                           'model_nacelle',
+                           'floating_point_precision',
+                           'number_spanwise_vortices',
+                           'number_chordwise_vortices',
+                           'wing_spanwise_vortices',
+                           'wing_chordwise_vortices',
+                           'fuselage_spanwise_vortices',
+                           'fuselage_chordwise_vortices',
+                           'discretize_control_surfaces']
+
 # ----------------------------------------------------------------------
 #  Generate Vortex Distribution
 # ----------------------------------------------------------------------
@@ -58,6 +85,9 @@ def generate_vortex_distribution(geometry,settings):
     In addition, all control surfaces should be appended directly
        to the wing, not the wing segments    
     
+    The vortex distribution of a geometry and discretization that was already 
+    generated is taken from vortex_distribution_cache. Its arrays are read-only.
+    
     For control surfaces, "positve" deflection corresponds to the RH rule where the axis of rotation is the OUTBOARD-pointing hinge vector
     symmetry: the LH rule is applied to the reflected surface for non-ailerons. Ailerons follow a RH rule for both sides
     
@@ -80,9 +110,19 @@ def generate_vortex_distribution(geometry,settings):
     VD - vehicle vortex distribution              [Unitless] 
 
     Properties Used:
-    N/A 
+    vortex_distribution_cache
          
     '''
+    # reuse the vortex distribution of an unchanged geometry and discretization
+    key   = vortex_distribution_fingerprint(geometry,settings)
+    cache = vortex_distribution_cache.distributions
+    if key in cache:
+        vortex_distribution_cache.hits += 1
+        VD = cache[key]
+        geometry.vortex_distribution = VD
+        return VD
+    vortex_distribution_cache.misses += 1
+    
     # ---------------------------------------------------------------------------------------
     # STEP 0: Unpack settings
     # ---------------------------------------------------------------------------------------        
@@ -268,10 +308,46 @@ def generate_vortex_distribution(geometry,settings):
     # pack VD into geometry
     geometry.vortex_distribution = VD
     
+    # keep VD, its arrays are shared by every later call
+    for value in VD.values():
+        if isinstance(value,array_type):
+            value.flags.writeable = False
+    cache[key] = VD
+    while len(cache) > vortex_distribution_cache.max_entries:
+        del cache[next(iter(cache))]
+    
     if show_prints: print('finish discretization')            
     
     return VD 
 
+## @ingroup Methods-Aerodynamics-Common-Fidelity_Zero-Lift
+def vortex_distribution_fingerprint(geometry,settings):
+    ''' Fingerprints the wings, fuselages and nacelles of a geometry and the discretization settings
+    
+    Assumptions:
+    The vortex distribution only depends on the wings, fuselages, nacelles and the discretization settings
+    
+    Source:
+    None
+    
+    Inputs:
+    geometry.wings                                [Unitless]  
+    geometry.fuselages                            [Unitless]  
+    geometry.nacelles                             [Unitless]  
+    settings                                      [Unitless]  
+    
+    Outputs:
+    key                                           [string]
+    
+    Properties Used:
+    N/A 
+    '''
+    
+    values = [geometry.get(k) for k in ['wings','fuselages','nacelles']] + \
+             [settings.get(k) for k in discretization_settings]
+        
+    return fingerprint(*values)
+
 # ----------------------------------------------------------------------
 #  Discretize Wings
 # ----------------------------------------------------------------------
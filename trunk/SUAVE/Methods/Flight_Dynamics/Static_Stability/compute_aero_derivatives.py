@@ -2,7 +2,7 @@
 # compute_aero_derivatives.py
 # 
 # Created:   Aug 2021, R. Erhard
-# Modified: 
+# Modified:  Oct 2026, SUAVE Team
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
@@ -10,21 +10,29 @@
 import numpy as np 
 from copy import deepcopy
 
+from SUAVE.Core import Data
+
 ## @ingroup Methods-Flight_Dynamics-Static_Stability
-def compute_aero_derivatives(segment): 
+def compute_aero_derivatives(segment,difference_scheme='forward'): 
     """This function computes the aerodynamic derivatives of the aircraft about a 
     mission segment, and stores them in the aero_derivatives data structure associated
-    with the state conditions of the given mission segment. All derivatives are 
-    computed using forward difference.
+    with the state conditions of the given mission segment. The perturbations of pitch,
+    heading, throttle and speed are stacked as extra control points of one copy of the 
+    segment, so the conditions are evaluated once for all of them. Control surface 
+    deflections change the geometry, they are evaluated one after the other on the 
+    same copy.
     
     Assumptions:
        Linearized equations are used for each state variable
+       The control points of the segment do not depend on each other in the conditions 
+       of an iteration, apart from the differential operators of the numerics
 
     Source:
       N/A
 
     Inputs:
       segment                SUAVE mission segment
+      difference_scheme      'forward' or 'central' differences     <string>
       
     Outputs: 
        segment.state.conditions.aero_derivatives
@@ -40,11 +48,20 @@ def compute_aero_derivatives(segment):
          .dCD_dThrottle    -   derivative of drag coefficient with respect to throttle                     [-] 
          .dCT_dThrottle    -   derivative of rotor thrust coefficient with respect to throttle             [-] 
          .dCP_dThrottle    -   derivative of rotor power coefficient with respect to throttle              [-] 
+         .dCL_dV           -   derivative of lift coefficient with respect to speed                        [s/m] 
+         .dCD_dV           -   derivative of drag coefficient with respect to speed                        [s/m] 
            
 
     Properties Used:
        N/A
      """
+    if difference_scheme == 'forward':
+        signs = [1.]
+    elif difference_scheme == 'central':
+        signs = [1.,-1.]
+    else:
+        raise ValueError("Check the difference_scheme input. It is 'forward' or 'central'")
+    
     # check for surrogate
     surrogate_used = segment.analyses.aerodynamics.settings.use_surrogate
     
@@ -57,33 +74,65 @@ def compute_aero_derivatives(segment):
     
     n_cpts    = len(pitch)
     
+    vinf      = segment.state.conditions.frames.inertial.velocity_vector
+    vmag      = np.linalg.norm(vinf,axis=1)
+    gamma     = np.arctan2(vinf[:,2],vinf[:,0])
+    
     # ----------------------------------------------------------------------------
     # Perturb each state variable
     # ----------------------------------------------------------------------------
     h = 1e-4
-    # ----------------------------------------------------------------------------    
-    # Alpha perturbation
     
-    perturbed_segment = deepcopy(segment)    
-    pitch_plus        = pitch*(1+h)
-    perturbed_segment.state.conditions.frames.body.inertial_rotations[:,1] = pitch_plus
+    # one copy of the segment, shared by all perturbations
+    perturbed_segment = deepcopy(segment)
+    
+    def perturb_alpha(sign):
+        def perturb(conditions,rows):
+            conditions.frames.body.inertial_rotations[rows,1] = pitch*(1+sign*h)
+        return perturb
+    
+    def perturb_beta(sign):
+        def perturb(conditions,rows):
+            conditions.frames.body.inertial_rotations[rows,2] = psi+sign*h
+        return perturb
+    
+    def perturb_throttle(sign):
+        def perturb(conditions,rows):
+            conditions.propulsion.throttle[rows] = throttle*(1+sign*h)
+        return perturb
+    
+    def perturb_velocity(sign):
+        def perturb(conditions,rows):
+            conditions.frames.inertial.velocity_vector[rows,0] = vmag*(1+sign*h)*np.cos(gamma)
+            conditions.frames.inertial.velocity_vector[rows,2] = vmag*(1+sign*h)*np.sin(gamma)
+        return perturb
     
-    iterate = perturbed_segment.process.iterate
-    iterate.conditions(perturbed_segment) 
+    quantities    = ['alpha','beta','throttle','velocity']
+    perturbations = [perturb(sign) for perturb in [perturb_alpha,perturb_beta,perturb_throttle,perturb_velocity] for sign in signs]
+    results       = evaluate_perturbations(segment,perturbed_segment,perturbations)
     
-    # set segment derivatives based on perturbed segment
-    dAlpha = perturbed_segment.state.conditions.aerodynamics.angle_of_attack - segment.state.conditions.aerodynamics.angle_of_attack
-    dCL    = perturbed_segment.state.conditions.aerodynamics.lift_coefficient - segment.state.conditions.aerodynamics.lift_coefficient
+    # conditions on either side of each perturbation, the converged segment is the reference of forward differences
+    plus  = Data()
+    minus = Data()
+    for i, quantity in enumerate(quantities):
+        plus[quantity]  = results[i*len(signs)]
+        minus[quantity] = results[i*len(signs)+1] if len(signs) == 2 else segment.state.conditions
+    
+    # ----------------------------------------------------------------------------    
+    # Alpha perturbation
+    
+    dAlpha = plus.alpha.aerodynamics.angle_of_attack - minus.alpha.aerodynamics.angle_of_attack
+    dCL    = plus.alpha.aerodynamics.lift_coefficient - minus.alpha.aerodynamics.lift_coefficient
     
     if surrogate_used:
         dCM_dAlpha = segment.state.conditions.stability.static.Cm_alpha
     else:
         # use VLM outputs directly
-        dCM    = perturbed_segment.state.conditions.aerodynamics.moment_coefficient - segment.state.conditions.aerodynamics.moment_coefficient
+        dCM    = plus.alpha.aerodynamics.moment_coefficient - minus.alpha.aerodynamics.moment_coefficient
         dCM_dAlpha = dCM/dAlpha
         
     # propeller derivatives
-    dCT, dCP = propeller_derivatives(segment, perturbed_segment, n_cpts)
+    dCT, dCP = propeller_derivatives(minus.alpha, plus.alpha, n_cpts)
         
     dCL_dAlpha = dCL/dAlpha
     dCT_dAlpha = dCT/dAlpha[None,:,:]
@@ -98,15 +147,7 @@ def compute_aero_derivatives(segment):
     # ----------------------------------------------------------------------------    
     # Beta perturbation
     
-    perturbed_segment = deepcopy(segment)    
-    psi_plus          = psi+h
-    perturbed_segment.state.conditions.frames.body.inertial_rotations[:,2] = psi_plus
-    
-    iterate = perturbed_segment.process.iterate
-    iterate.conditions(perturbed_segment) 
-    
-    # set segment derivatives based on perturbed segment
-    dBeta  = perturbed_segment.state.conditions.aerodynamics.side_slip_angle - segment.state.conditions.aerodynamics.side_slip_angle
+    dBeta  = plus.beta.aerodynamics.side_slip_angle - minus.beta.aerodynamics.side_slip_angle
     
     # roll and yaw moment coefficient derivatives
     if surrogate_used:
@@ -123,13 +164,13 @@ def compute_aero_derivatives(segment):
             dCl_dBeta = None            
     else:
         # use VLM outputs directly
-        dCn = perturbed_segment.state.conditions.stability.static.yawing_moment_coefficient - segment.state.conditions.stability.static.yawing_moment_coefficient
-        dCl = perturbed_segment.state.conditions.stability.static.rolling_moment_coefficient - segment.state.conditions.stability.static.rolling_moment_coefficient
+        dCn = plus.beta.stability.static.yawing_moment_coefficient - minus.beta.stability.static.yawing_moment_coefficient
+        dCl = plus.beta.stability.static.rolling_moment_coefficient - minus.beta.stability.static.rolling_moment_coefficient
         dCn_dBeta = dCn/dBeta
         dCl_dBeta = dCl/dBeta
         
     # check for propellers
-    dCT, dCP = propeller_derivatives(segment, perturbed_segment, n_cpts)  
+    dCT, dCP = propeller_derivatives(minus.beta, plus.beta, n_cpts)  
 
     dCT_dBeta = dCT/dBeta
     dCP_dBeta = dCP/dBeta
@@ -143,20 +184,12 @@ def compute_aero_derivatives(segment):
     # ----------------------------------------------------------------------------    
     # Throttle perturbation
     
-    perturbed_segment = deepcopy(segment)    
-    throttle_plus     = throttle*(1+h)
-    perturbed_segment.state.conditions.propulsion.throttle = throttle_plus
-    
-    iterate = perturbed_segment.process.iterate
-    iterate.conditions(perturbed_segment) 
-    
-    # set segment derivatives based on perturbed segment
-    dThrottle = throttle_plus-throttle
-    dCL       = perturbed_segment.state.conditions.aerodynamics.lift_coefficient - segment.state.conditions.aerodynamics.lift_coefficient
-    dCD       = perturbed_segment.state.conditions.aerodynamics.drag_coefficient - segment.state.conditions.aerodynamics.drag_coefficient
+    dThrottle = throttle*h*len(signs)
+    dCL       = plus.throttle.aerodynamics.lift_coefficient - minus.throttle.aerodynamics.lift_coefficient
+    dCD       = plus.throttle.aerodynamics.drag_coefficient - minus.throttle.aerodynamics.drag_coefficient
 
     # check for propellers
-    dCT, dCP = propeller_derivatives(segment, perturbed_segment, n_cpts)  
+    dCT, dCP = propeller_derivatives(minus.throttle, plus.throttle, n_cpts)  
 
     dCL_dThrottle = dCL/dThrottle
     dCD_dThrottle = dCD/dThrottle
@@ -170,22 +203,26 @@ def compute_aero_derivatives(segment):
     
 
     # ----------------------------------------------------------------------------    
-    # Control surface deflection perturbation for each wing
+    # Control surface deflection perturbation for each wing, the deflections change the 
+    # geometry so they are evaluated one at a time on the copy of the segment
     for wing in list(segment.analyses.aerodynamics.geometry.wings.keys()):
         if len(segment.analyses.aerodynamics.geometry.wings[wing].control_surfaces) !=0:
             # set segment derivatives based on perturbed segment
             for cs in list(segment.analyses.aerodynamics.geometry.wings[wing].control_surfaces.keys()):
                 delta             = segment.analyses.aerodynamics.geometry.wings[wing].control_surfaces[cs].deflection                
-                perturbed_segment = deepcopy(segment)    
-                delta_plus        = delta + 0.1
-                perturbed_segment.analyses.aerodynamics.geometry.wings[wing].control_surfaces[cs].deflection = delta_plus
+                control_surface   = perturbed_segment.analyses.aerodynamics.geometry.wings[wing].control_surfaces[cs]
                 
-                iterate = perturbed_segment.process.iterate
-                iterate.conditions(perturbed_segment)                 
+                results = []
+                for sign in signs:
+                    control_surface.deflection = delta + sign*0.1
+                    results.append(evaluate_perturbation(segment,perturbed_segment,lambda conditions,rows: None))
+                control_surface.deflection = delta
+                plus_cs  = results[0]
+                minus_cs = results[1] if len(signs) == 2 else segment.state.conditions
                 
-                dDelta          = perturbed_segment.analyses.aerodynamics.geometry.wings[wing].control_surfaces[cs].deflection - segment.analyses.aerodynamics.geometry.wings[wing].control_surfaces[cs].deflection
-                dCL             = perturbed_segment.state.conditions.aerodynamics.lift_coefficient - segment.state.conditions.aerodynamics.lift_coefficient
-                dCD             = perturbed_segment.state.conditions.aerodynamics.drag_coefficient - segment.state.conditions.aerodynamics.drag_coefficient
+                dDelta          = 0.1*len(signs)
+                dCL             = plus_cs.aerodynamics.lift_coefficient - minus_cs.aerodynamics.lift_coefficient
+                dCD             = plus_cs.aerodynamics.drag_coefficient - minus_cs.aerodynamics.drag_coefficient
                 
                 # roll and yaw moment coefficient derivatives
                 if surrogate_used:
@@ -195,12 +232,12 @@ def compute_aero_derivatives(segment):
                     dCl = 0
                 else:
                     # use VLM outputs directly
-                    dCn = perturbed_segment.state.conditions.stability.static.yawing_moment_coefficient - segment.state.conditions.stability.static.yawing_moment_coefficient
-                    dCl = perturbed_segment.state.conditions.stability.static.rolling_moment_coefficient - segment.state.conditions.stability.static.rolling_moment_coefficient              
-                    dCM = perturbed_segment.state.conditions.aerodynamics.moment_coefficient - segment.state.conditions.aerodynamics.moment_coefficient
+                    dCn = plus_cs.stability.static.yawing_moment_coefficient - minus_cs.stability.static.yawing_moment_coefficient
+                    dCl = plus_cs.stability.static.rolling_moment_coefficient - minus_cs.stability.static.rolling_moment_coefficient              
+                    dCM = plus_cs.aerodynamics.moment_coefficient - minus_cs.aerodynamics.moment_coefficient
                     
                 # propeller derivatives 
-                dCT, dCP = propeller_derivatives(segment, perturbed_segment, n_cpts) 
+                dCT, dCP = propeller_derivatives(minus_cs, plus_cs, n_cpts) 
                     
                 dCL_dDelta      = dCL/dDelta 
                 dCD_dDelta      = dCD/dDelta
@@ -226,22 +263,10 @@ def compute_aero_derivatives(segment):
 
     # ----------------------------------------------------------------------------    
     # Velocity magnitude perturbation
-    vinf                = segment.state.conditions.frames.inertial.velocity_vector
-    vmag                = np.linalg.norm(vinf,axis=1)
-    gamma               = np.arctan2(vinf[:,2],vinf[:,0])
-    
-    perturbed_segment   = deepcopy(segment)    
-    vmag_plus           = vmag*(1+h) 
-    perturbed_segment.state.conditions.frames.inertial.velocity_vector[:,0] = vmag_plus*np.cos(gamma)
-    perturbed_segment.state.conditions.frames.inertial.velocity_vector[:,2] = vmag_plus*np.sin(gamma)
-        
-    iterate = perturbed_segment.process.iterate
-    iterate.conditions(perturbed_segment)
     
-    # set segment derivatives based on perturbed segment
-    dV      = perturbed_segment.state.conditions.freestream.velocity - segment.state.conditions.frames.inertial.velocity_vector
-    dCL     = perturbed_segment.state.conditions.aerodynamics.lift_coefficient - segment.state.conditions.aerodynamics.lift_coefficient
-    dCD     = perturbed_segment.state.conditions.aerodynamics.drag_coefficient - segment.state.conditions.aerodynamics.drag_coefficient
+    dV      = plus.velocity.freestream.velocity - minus.velocity.freestream.velocity
+    dCL     = plus.velocity.aerodynamics.lift_coefficient - minus.velocity.aerodynamics.lift_coefficient
+    dCD     = plus.velocity.aerodynamics.drag_coefficient - minus.velocity.aerodynamics.drag_coefficient
     dCL_dV  = dCL/dV   
     dCD_dV  = dCD/dV  
 
@@ -250,9 +275,133 @@ def compute_aero_derivatives(segment):
     
     return 
 
-def propeller_derivatives(segment, perturbed_segment, n_cpts):
-    props = segment.state.conditions.noise.sources.propellers
-    perturbed_props = perturbed_segment.state.conditions.noise.sources.propellers
+## @ingroup Methods-Flight_Dynamics-Static_Stability
+def evaluate_perturbations(segment,perturbed_segment,perturbations):
+    """Evaluates the conditions of a segment for several perturbations with one pass of the 
+    conditions process. Each perturbation gets its own block of control points, the 
+    differential operators of the numerics are repeated along the diagonal.
+    
+    Assumptions:
+       The conditions of each control point only depend on the control point and the time of
+       the segment. Rotor wakes above fidelity zero are shaped by the first control point and 
+       perturbations that change the time of the segment break this, then each perturbation 
+       is evaluated on its own
+
+    Source:
+      N/A
+
+    Inputs:
+      segment                converged SUAVE mission segment
+      perturbed_segment      copy of the segment that is evaluated
+      perturbations          functions perturb(conditions,rows) setting the perturbed values 
+                             of a block of control points
+      
+    Outputs: 
+      results                conditions of each perturbation           [list]
+
+    Properties Used:
+       N/A
+     """
+    # the mission methods import the analyses, which import this module
+    from SUAVE.Methods.Missions.Segments.Common.Batched_Segments import stack_conditions, split_conditions
+    
+    if not pointwise_wakes(segment.analyses.aerodynamics.geometry):
+        return [evaluate_perturbation(segment,perturbed_segment,perturb) for perturb in perturbations]
+    
+    state    = segment.state
+    n_cpts   = state.conditions.frames.inertial.time.shape[0]
+    n_blocks = len(perturbations)
+    sizes    = [n_cpts]*n_blocks
+    
+    # stack copies of the state
+    stacked  = deepcopy(state)
+    for key in ['conditions','unknowns','residuals']:
+        stacked[key] = stack_conditions([stacked[key]]*n_blocks,sizes)
+    stacked._size = n_cpts*n_blocks
+    stacked.numerics.number_control_points = n_cpts*n_blocks
+    for operators in [stacked.numerics.dimensionless,stacked.numerics.time]:
+        operators.control_points = np.tile(operators.control_points,(n_blocks,1))
+        operators.differentiate  = np.kron(np.eye(n_blocks),operators.differentiate)
+        operators.integrate      = np.kron(np.eye(n_blocks),operators.integrate)
+    
+    for i, perturb in enumerate(perturbations):
+        perturb(stacked.conditions,slice(i*n_cpts,(i+1)*n_cpts))
+    
+    perturbed_segment.state      = stacked
+    perturbed_segment.conditions = stacked.conditions
+    perturbed_segment.process.iterate.conditions(perturbed_segment)
+    
+    results = [Data() for perturb in perturbations]
+    split_conditions(stacked.conditions,results,sizes)
+    
+    # the blocks share the scaling of the differential operators
+    time = state.conditions.frames.inertial.time
+    if all([np.allclose(result.frames.inertial.time,time,rtol=1e-12,atol=0.) for result in results]):
+        return results
+    
+    return [evaluate_perturbation(segment,perturbed_segment,perturb) for perturb in perturbations]
+
+## @ingroup Methods-Flight_Dynamics-Static_Stability
+def evaluate_perturbation(segment,perturbed_segment,perturb):
+    """Evaluates the conditions of a segment for one perturbation.
+    
+    Assumptions:
+       N/A
+
+    Source:
+      N/A
+
+    Inputs:
+      segment                converged SUAVE mission segment
+      perturbed_segment      copy of the segment that is evaluated
+      perturb                function perturb(conditions,rows) setting the perturbed values
+      
+    Outputs: 
+      conditions             conditions of the perturbation 
+
+    Properties Used:
+       N/A
+     """
+    perturbed_segment.state      = deepcopy(segment.state)
+    perturbed_segment.conditions = perturbed_segment.state.conditions
+    perturb(perturbed_segment.state.conditions,slice(None))
+    perturbed_segment.process.iterate.conditions(perturbed_segment)
+    
+    return perturbed_segment.state.conditions
+
+## @ingroup Methods-Flight_Dynamics-Static_Stability
+def pointwise_wakes(vehicle):
+    """Checks that the rotor wakes of a vehicle are evaluated control point by control point.
+    
+    Assumptions:
+       Fidelity zero wakes work point by point, the other wakes are shaped by the first 
+       control point
+
+    Source:
+      N/A
+
+    Inputs:
+      vehicle.networks       SUAVE vehicle networks
+      
+    Outputs: 
+      pointwise              <boolean>
+
+    Properties Used:
+       N/A
+     """
+    for network in vehicle.networks:
+        for item in network.values():
+            if not isinstance(item,dict):
+                continue
+            for rotor in item.values():
+                if isinstance(rotor,dict) and 'Wake' in rotor and rotor.Wake.wake_method != 'Fidelity_Zero':
+                    return False
+    
+    return True
+
+def propeller_derivatives(conditions, perturbed_conditions, n_cpts):
+    props = conditions.noise.sources.propellers
+    perturbed_props = perturbed_conditions.noise.sources.propellers
     dCT = np.zeros((len(props),n_cpts,1))
     dCP = np.zeros((len(props),n_cpts,1))
     for i in range(len(props)):
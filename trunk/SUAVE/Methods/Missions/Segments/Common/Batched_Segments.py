@@ -0,0 +1,998 @@
+## @ingroup Methods-Missions-Segments-Common
+# Batched_Segments.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+from SUAVE.Core import Data
+from SUAVE.Analyses import Process
+from SUAVE.Core.Arrays import array_type
+from SUAVE.Analyses.Mission.Segments.Conditions import Conditions, State
+from SUAVE.Methods.Missions.Segments.converge_root import converge_root, block_sparsity, control_point_index, operator_coupling
+
+# ----------------------------------------------------------------------
+#  Initialize Batched Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def initialize_batched_segments(segment):
+    """ Evaluates every sub segment once at its initial guess, then decouples the sub segments by giving each
+        one a frozen copy of the final point of the segment before it. The quantities listed in
+        segment.continuity are taken out of that copy and become unknowns of the mission, closed by
+        continuity residuals.
+
+        Assumptions:
+        The sub segments have already been expanded
+
+        Inputs:
+        segment.segments                 [Data]
+        segment.continuity               [list of strings]
+
+        Outputs:
+        segment.state.unknowns           [Data]
+        segment.state.residuals          [Data]
+        segment.state.verified_steps     [Data]
+        segment.state.batched_layouts    [dict]
+        sub_segment.state.initials       [State]
+
+        Properties Used:
+        N/A
+
+    """
+
+    # a sequential pass at the initial guess gives every boundary a sensible starting value
+    last_tag = None
+
+    for tag,sub_segment in segment.segments.items():
+        if last_tag:
+            boundary = State()
+            boundary.conditions = final_point(segment.segments[last_tag].state.conditions)
+            sub_segment.state.initials = boundary
+        sub_segment.process.initialize(sub_segment)
+        sub_segment.process.iterate(sub_segment)
+        last_tag = tag
+
+    unknowns  = segment.state.unknowns
+    residuals = segment.state.residuals
+
+    for tag,sub_segment in segment.segments.items():
+        unknowns[tag]  = sub_segment.state.unknowns
+        residuals[tag] = sub_segment.state.residuals
+
+    unknowns.continuity  = Conditions()
+    residuals.continuity = Conditions()
+
+    # groups of sub segments whose batched steps have been checked against the per sub segment evaluation
+    segment.state.verified_steps = Conditions()
+    for path in segment.batched_steps:
+        segment.state.verified_steps[path] = []
+
+    # stacked conditions shared by the sub segments of each group, kept between iterations
+    segment.state.batched_layouts = dict()
+
+    for tag,sub_segment in list(segment.segments.items())[1:]:
+
+        boundary = sub_segment.state.initials.conditions
+
+        unknowns.continuity[tag]  = Conditions()
+        residuals.continuity[tag] = Conditions()
+
+        for path in segment.continuity:
+            try:
+                value = boundary.deep_get(path)
+            except (KeyError,AttributeError):
+                continue
+            key = path.replace('.','_')
+
+            unknowns.continuity[tag][key]  = value.copy()
+            residuals.continuity[tag][key] = np.zeros_like(value)
+
+    return
+
+# ----------------------------------------------------------------------
+#  Converge Batched Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def converge_batched_segments(segment):
+    """ Solves all sub segments together. Boundary quantities that are not continuity unknowns are
+        held frozen during a solve. After each solve they are refreshed in a sequential pass; if the
+        residuals no longer satisfy segment.boundary_tolerance the mission is solved again from there.
+        The mission is only converged if the last solve converged and the refreshed residuals satisfy
+        the tolerance, the final state is the sequential pass at the last solution.
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        segment.maximum_boundary_passes  [int]
+        segment.boundary_tolerance       [Unitless]
+
+        Outputs:
+        segment.state.numerics.converged [bool]
+        segment.converged                [bool]
+
+        Properties Used:
+        N/A
+
+    """
+
+    for i in range(segment.maximum_boundary_passes):
+        converge_root(segment)
+        residuals = refresh_boundaries(segment)
+        boundary_converged = np.max(np.abs(residuals)) <= segment.boundary_tolerance
+        if boundary_converged or not segment.state.numerics.converged:
+            break
+
+    if segment.state.numerics.converged and not boundary_converged:
+        print("Segment did not converge. Segment Tag: " + segment.tag)
+        print("Error Message:\nThe residuals after refreshing the segment boundaries exceed boundary_tolerance = " + \
+              str(segment.boundary_tolerance) + " after " + str(segment.maximum_boundary_passes) + " passes.")
+        segment.state.numerics.converged = False
+        segment.converged = False
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def refresh_boundaries(segment):
+    """ Reevaluates the sub segments in order at the current unknowns, updating the frozen boundary copy
+        of every sub segment with the final point of the segment before it.
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        segment.segments                 [Data]
+
+        Outputs:
+        residuals                        [array]
+
+        Properties Used:
+        N/A
+
+    """
+
+    unpack_continuity(segment)
+
+    last_tag = None
+
+    for tag,sub_segment in segment.segments.items():
+        if last_tag:
+            latest = final_point(segment.segments[last_tag].state.conditions)
+            update_boundary(sub_segment.state.initials.conditions,latest)
+        sub_segment.process.initialize(sub_segment)
+        sub_segment.process.iterate(sub_segment)
+        last_tag = tag
+
+    residual_continuity(segment)
+
+    return segment.state.residuals.pack_array()
+
+# ----------------------------------------------------------------------
+#  Update Batched Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def update_batched_segments(segment):
+    """ Runs the iterate process of all sub segments in lockstep. The steps listed in segment.batched_steps
+        are evaluated once over the stacked control points of all sub segments sharing the same analyses,
+        every other step is evaluated per sub segment. The first time a group is evaluated the batched
+        result is checked against the per sub segment result.
+
+        Assumptions:
+        A batched step only reads and writes segment.state.conditions and uses segment.analyses
+
+        Inputs:
+        segment.segments                 [Data]
+        segment.batched_steps            [list of strings]
+        segment.state.verified_steps     [Data]
+        segment.state.batched_layouts    [dict]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+
+    sub_segments = list(segment.segments.values())
+
+    steps   = [flatten_process(sub_segment.process.iterate) for sub_segment in sub_segments]
+    cursors = [0]*len(sub_segments)
+    batched = set(segment.batched_steps)
+
+    while True:
+
+        # run every sub segment up to its next batched step
+        waiting = []
+        for i, sub_segment in enumerate(sub_segments):
+            j = cursors[i]
+            while j < len(steps[i]) and steps[i][j][0] not in batched:
+                evaluate_step(steps[i][j][1],sub_segment)
+                j += 1
+            cursors[i] = j
+            if j < len(steps[i]):
+                waiting.append(i)
+
+        if not waiting:
+            break
+
+        # group the sub segments that can share an evaluation
+        groups = dict()
+        for i in waiting:
+            path, step = steps[i][cursors[i]]
+            key  = (path,id(step)) + tuple(id(analysis) for analysis in sub_segments[i].analyses.values())
+            groups.setdefault(key,[]).append(i)
+
+        for key, group in groups.items():
+            path, step = steps[group[0]][cursors[group[0]]]
+            tags  = [sub_segments[i].tag for i in group]
+            if tags in segment.state.verified_steps[path]:
+                evaluate_batched_step(step,[sub_segments[i] for i in group],segment.state.batched_layouts)
+            else:
+                verify_batched_step(step,[sub_segments[i] for i in group],path)
+                segment.state.verified_steps[path].append(tags)
+            for i in group:
+                cursors[i] += 1
+
+    # finish off the remaining steps
+    for i, sub_segment in enumerate(sub_segments):
+        for path, step in steps[i][cursors[i]:]:
+            evaluate_step(step,sub_segment)
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def evaluate_batched_step(step,sub_segments,layouts):
+    """ Evaluates one process step over the stacked conditions of several sub segments. The stacked
+        conditions of a group are kept between iterations and the arrays of each sub segment are views into
+        them, so only arrays that were replaced since the last evaluation are copied in or out.
+
+        Assumptions:
+        Arrays with one row per control point are stacked, anything else is taken from the first sub segment
+
+        Inputs:
+        step                             [function]
+        sub_segments                     [list]
+        layouts                          [dict]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+
+    if len(sub_segments) == 1:
+        evaluate_step(step,sub_segments[0])
+        return
+
+    key    = tuple(id(sub_segment) for sub_segment in sub_segments)
+    layout = layouts.get(key)
+    if layout is None or not gather_layout(layout,sub_segments):
+        layout = layouts[key] = batched_layout(sub_segments)
+
+    evaluate_step(step,layout.batch)
+
+    # anything the stacked arrays can not hold is split out and the layout rebuilt next time
+    if not scatter_layout(layout,sub_segments):
+        split_conditions(layout.batch.state.conditions,[sub_segment.state.conditions for sub_segment in sub_segments],
+                         layout.sizes)
+        del layouts[key]
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def verify_batched_step(step,sub_segments,path):
+    """ Evaluates one process step per sub segment and over the stacked conditions of the sub segments,
+        and checks that both give the same conditions. The per sub segment results are kept.
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        step                             [function]
+        sub_segments                     [list]
+        path                             [string]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+
+    if len(sub_segments) == 1:
+        evaluate_step(step,sub_segments[0])
+        return
+
+    sizes = [sub_segment.state.numerics.number_control_points for sub_segment in sub_segments]
+    batch = batched_segment(sub_segments,sizes)
+
+    for sub_segment in sub_segments:
+        evaluate_step(step,sub_segment)
+
+    try:
+        evaluate_step(step,batch)
+    except (AttributeError,KeyError,IndexError,ValueError) as error:
+        raise ValueError('Batched step ' + path + ' failed on the stacked control points, it can only be batched if it ' + \
+                         'works point by point. ' + repr(error))
+
+    reference = stack_conditions([sub_segment.state.conditions for sub_segment in sub_segments],sizes)
+    mismatch  = compare_conditions(batch.state.conditions,reference)
+    if mismatch:
+        raise ValueError('Batched step ' + path + ' does not work point by point, stacking the control points ' + \
+                         'changes conditions.' + mismatch)
+
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def batched_segment(sub_segments,sizes,leaves=None):
+    """ Builds a light stand in segment carrying the stacked conditions of several sub segments. The stand
+        in numerics only know the number of control points, so a step relying on the differential
+        operators fails instead of mixing up sub segments.
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        sub_segments                     [list]
+        sizes                            [list of int]
+        leaves                           [list] (optional, collects the stacked arrays)
+
+        Outputs:
+        batch                            [Conditions]
+
+        Properties Used:
+        N/A
+
+    """
+
+    batch = Conditions()
+    dict.update(batch,sub_segments[0])
+    batch.state            = State()
+    batch.state.conditions = stack_conditions([sub_segment.state.conditions for sub_segment in sub_segments],sizes,leaves)
+    batch.state.numerics   = Conditions()
+    batch.state.numerics.number_control_points = sum(sizes)
+    batch.state._size      = sum(sizes)
+
+    return batch
+
+## @ingroup Methods-Missions-Segments-Common
+def batched_layout(sub_segments):
+    """ Stacks the conditions of a group of sub segments and makes every stacked array of each sub segment a
+        view into the stacked array. The nodes holding each array are kept, so the arrays can be checked
+        without walking the conditions again.
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        sub_segments                     [list]
+
+        Outputs:
+        layout.batch                     [Conditions]
+        layout.sizes                     [list of int]
+        layout.leaves                    [list of (path, stacked array, views, stacked node, sub segment nodes)]
+        layout.nodes                     [list of (path, node, number of keys)]
+        layout.sub_nodes                 [list of (key, parent nodes, nodes)]
+
+        Properties Used:
+        N/A
+
+    """
+
+    sizes  = [sub_segment.state.numerics.number_control_points for sub_segment in sub_segments]
+    bounds = np.cumsum([0] + sizes)
+    leaves = []
+    batch  = batched_segment(sub_segments,sizes,leaves)
+    roots  = [sub_segment.state.conditions for sub_segment in sub_segments]
+
+    layout = Data()
+    layout.batch     = batch
+    layout.sizes     = sizes
+    layout.roots     = roots
+    layout.leaves    = []
+    layout.nodes     = []
+    layout.sub_nodes = []
+
+    for path, stacked in leaves:
+        views   = [stacked[bounds[i]:bounds[i+1]] for i in range(len(sub_segments))]
+        parents = [conditions_node(root,path[:-1]) for root in roots]
+        for parent, view in zip(parents,views):
+            dict.__setitem__(parent,path[-1],view)
+        layout.leaves.append((path,stacked,views,conditions_node(batch.state.conditions,path[:-1]),parents))
+
+    add_layout_nodes(layout,batch.state.conditions,())
+
+    # every node of the sub segments holding a stacked array, parents first
+    branches = sorted(set(path[:i] for path, *_ in layout.leaves for i in range(1,len(path))),key=len)
+    for branch in branches:
+        layout.sub_nodes.append((branch[-1],[conditions_node(root,branch[:-1]) for root in roots],
+                                 [conditions_node(root,branch) for root in roots]))
+
+    return layout
+
+## @ingroup Methods-Missions-Segments-Common
+def gather_layout(layout,sub_segments):
+    """ Copies the arrays the sub segments replaced since the last batched evaluation into the stacked arrays,
+        and points the sub segments back at their views
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        layout                           [Data]
+        sub_segments                     [list]
+
+        Outputs:
+        valid                            [bool], False if a sub segment replaced a node of its conditions
+
+        Properties Used:
+        N/A
+
+    """
+
+    for root, sub_segment in zip(layout.roots,sub_segments):
+        if sub_segment.state.conditions is not root:
+            return False
+    for key, parents, nodes in layout.sub_nodes:
+        for parent, node in zip(parents,nodes):
+            if dict.get(parent,key) is not node:
+                return False
+
+    for path, stacked, views, node, parents in layout.leaves:
+        key = path[-1]
+        for parent, view in zip(parents,views):
+            value = dict.get(parent,key)
+            if value is not view:
+                try:
+                    view[...] = value
+                except (TypeError,ValueError):
+                    return False
+                dict.__setitem__(parent,key,view)
+        dict.__setitem__(node,key,stacked)
+
+    return True
+
+## @ingroup Methods-Missions-Segments-Common
+def scatter_layout(layout,sub_segments):
+    """ Copies the arrays a batched step replaced in the stacked conditions into the stacked arrays, which the
+        sub segments see through their views. Branches of the conditions the step rebuilt are split out to the
+        sub segments instead.
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        layout                           [Data]
+        sub_segments                     [list]
+
+        Outputs:
+        valid                            [bool], False if the step removed conditions
+
+        Properties Used:
+        N/A
+
+    """
+
+    conditions = layout.batch.state.conditions
+    rebuilt    = []
+    under      = lambda path: any(path[:len(branch)] == branch for branch in rebuilt)
+
+    try:
+        for path, node, size in layout.nodes:
+            if rebuilt and under(path):
+                continue
+            current = conditions_node(conditions,path)
+            if current is not node or len(current) != size:
+                if not path:
+                    return False
+                rebuilt.append(path)
+
+        for branch in rebuilt:
+            items = [conditions_node(root,branch[:-1]) for root in layout.roots]
+            split_conditions({branch[-1]:conditions_node(conditions,branch)},items,layout.sizes)
+    except (KeyError,TypeError,ValueError):
+        return False
+
+    leaves = []
+    for leaf in layout.leaves:
+        path, stacked, views, node, parents = leaf
+        if rebuilt and under(path):
+            # rebound to the stacked array the next time the layout is gathered
+            try:
+                leaf = (path,stacked,views,conditions_node(conditions,path[:-1]),parents)
+            except (KeyError,TypeError):
+                return False
+        else:
+            value = dict.__getitem__(node,path[-1])
+            if value is not stacked:
+                try:
+                    stacked[...] = value
+                except (TypeError,ValueError):
+                    return False
+                dict.__setitem__(node,path[-1],stacked)
+        leaves.append(leaf)
+    layout.leaves = leaves
+
+    if rebuilt:
+        layout.nodes = [entry for entry in layout.nodes if not under(entry[0])]
+        for branch in rebuilt:
+            add_layout_nodes(layout,conditions_node(conditions,branch),branch)
+
+    return True
+
+## @ingroup Methods-Missions-Segments-Common
+def add_layout_nodes(layout,node,path):
+    """ Records a branch of the stacked conditions with the number of keys of each node
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        layout                           [Data]
+        node                             [Conditions]
+        path                             [tuple of strings]
+
+        Outputs:
+        layout.nodes                     [list of (path, node, number of keys)]
+
+        Properties Used:
+        N/A
+
+    """
+    layout.nodes.append((path,node,len(node)))
+    for k, v in dict.items(node):
+        if isinstance(v,dict):
+            add_layout_nodes(layout,v,path + (k,))
+    return
+
+# ----------------------------------------------------------------------
+#  Unpack Continuity
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def unpack_continuity(segment):
+    """ Writes the continuity unknowns into the boundary of each sub segment. The boundary is rewritten on
+        every iteration since segments may overwrite their initials, e.g. to set a starting altitude.
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        segment.state.unknowns.continuity [Data]
+        segment.continuity                [list of strings]
+
+        Outputs:
+        sub_segment.state.initials        [State]
+
+        Properties Used:
+        N/A
+
+    """
+
+    unknowns = segment.state.unknowns.continuity
+
+    for tag,sub_segment in segment.segments.items():
+        if tag not in unknowns:
+            continue
+        for path in segment.continuity:
+            key = path.replace('.','_')
+            if key in unknowns[tag]:
+                sub_segment.state.initials.conditions.deep_get(path)[...] = unknowns[tag][key]
+
+    return
+
+# ----------------------------------------------------------------------
+#  Residual Continuity
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def residual_continuity(segment):
+    """ Computes the mismatch between the continuity unknowns of each sub segment and the final point of the
+        sub segment before it.
+
+        Assumptions:
+        The residuals are normalized by the magnitude of the final point, but not less than one
+
+        Inputs:
+        segment.segments                 [Data]
+        segment.continuity               [list of strings]
+
+        Outputs:
+        segment.state.residuals.continuity [Data]
+
+        Properties Used:
+        N/A
+
+    """
+
+    unknowns  = segment.state.unknowns.continuity
+    residuals = segment.state.residuals.continuity
+    last_tag  = None
+
+    for tag,sub_segment in segment.segments.items():
+        if last_tag:
+            previous = segment.segments[last_tag].state.conditions
+            for path in segment.continuity:
+                key = path.replace('.','_')
+                if key not in residuals[tag]:
+                    continue
+                final = previous.deep_get(path)[-1:]
+                residuals[tag][key] = (unknowns[tag][key] - final)/np.maximum(np.abs(final),1.)
+        last_tag = tag
+
+    return
+
+# ----------------------------------------------------------------------
+#  Finalize Batched Segments
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def finalize_batched_segments(segment):
+    """ Passes the convergence status of the mission to the sub segments and finalizes them in order
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        segment.state.numerics.converged [bool]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+
+    last_tag = None
+
+    for tag,sub_segment in segment.segments.items():
+        
+        # post processing integrates from the finalized segment before, as in a sequential solve
+        if last_tag:
+            sub_segment.state.initials = segment.segments[last_tag].state
+            sub_segment.process.iterate.initials(sub_segment)
+        last_tag = tag
+        
+        sub_segment.state.numerics.converged = segment.state.numerics.converged
+        sub_segment.converged                = segment.state.numerics.converged
+        sub_segment.finalize()
+
+    return
+
+# ----------------------------------------------------------------------
+#  Batched Sparsity
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def batched_sparsity(segment):
+    """ Sparsity of the batched mission residuals. Each sub segment contributes its own block sparse
+        pattern, with the coupling through its differential operators found by probing the sub segment on
+        its own, which is much cheaper than probing the whole mission. The boundary unknowns of a sub
+        segment couple to all of its residuals, and its continuity residuals couple to the final control
+        point and the operator coupled unknowns of the sub segment before it. No blocks are returned, so
+        converge_root does not probe the mission again.
+
+        Assumptions:
+        Same assumptions as the block sparse pattern of a single segment
+
+        Inputs:
+        segment.segments                 [Data]
+        segment.state.unknowns           [Data]
+        segment.state.residuals          [Data]
+
+        Outputs:
+        sparsity                         [boolean array, n_residuals x n_unknowns]
+        unknown_blocks                   [empty list]
+        residual_blocks                  [empty list]
+
+        Properties Used:
+        N/A
+
+    """
+
+    unknowns  = segment.state.unknowns
+    residuals = segment.state.residuals
+
+    # locate every sub segment and boundary block in the packed arrays
+    u_size = lambda data: len(data.pack_array())
+
+    u_start, r_start = 0, 0
+    blocks = []
+    for tag,sub_segment in segment.segments.items():
+        n_u = u_size(sub_segment.state.unknowns)
+        n_r = u_size(sub_segment.state.residuals)
+        blocks.append([slice(u_start,u_start+n_u),slice(r_start,r_start+n_r)])
+        u_start += n_u
+        r_start += n_r
+
+    for i, tag in enumerate(segment.segments.keys()):
+        if i == 0:
+            blocks[i] += [slice(u_start,u_start),slice(r_start,r_start)]
+            continue
+        n_u = u_size(unknowns.continuity[tag])
+        n_r = u_size(residuals.continuity[tag])
+        blocks[i] += [slice(u_start,u_start+n_u),slice(r_start,r_start+n_r)]
+        u_start += n_u
+        r_start += n_r
+
+    sparsity = np.zeros((r_start,u_start),dtype=bool)
+    coupled  = []
+
+    sub_segments = list(segment.segments.values())
+
+    for i, sub_segment in enumerate(sub_segments):
+        columns, rows, boundary_columns, continuity_rows = blocks[i]
+
+        # probe the sub segment alone at its current unknowns
+        local, unknown_blocks, residual_blocks = block_sparsity(sub_segment)
+        sub_unknowns = sub_segment.state.unknowns.pack_array()
+        evaluations  = Data()
+        evaluations.count           = 0
+        evaluations.max_evaluations = np.inf
+        evaluations.points          = []
+        sub_sparsity = operator_coupling(sub_unknowns,sub_segment,local,unknown_blocks,residual_blocks,
+                                         evaluations,segment.state.numerics.step_size)
+        sub_segment.state.unknowns.unpack_array(sub_unknowns)
+
+        sparsity[rows,columns] = sub_sparsity
+        coupled.append(np.sum(sub_sparsity,axis=0) > np.sum(local,axis=0))
+
+        if i == 0:
+            continue
+
+        previous = sub_segments[i-1]
+        n_cp     = previous.state.numerics.number_control_points
+        points   = control_point_index(previous.state.unknowns,n_cp)
+        final    = np.where((points == n_cp-1) | (points == -1) | coupled[i-1])[0] + blocks[i-1][0].start
+
+        sparsity[rows,boundary_columns]            = True
+        sparsity[continuity_rows,boundary_columns] = True
+        sparsity[continuity_rows,blocks[i-1][2]]   = True
+        sparsity[continuity_rows.start:continuity_rows.stop,final] = True
+
+    return sparsity, [], []
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Missions-Segments-Common
+def flatten_process(process,prefix=''):
+    """ Lists the steps of a nested process in evaluation order with their dotted paths
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        process                          [Process]
+
+        Outputs:
+        steps                            [list of (string, function)]
+
+        Properties Used:
+        N/A
+
+    """
+    steps = []
+    for tag, step in process.items():
+        if isinstance(step,Process):
+            steps += flatten_process(step,prefix + tag + '.')
+        else:
+            steps.append((prefix + tag,step))
+    return steps
+
+## @ingroup Methods-Missions-Segments-Common
+def evaluate_step(step,segment):
+    """ Evaluates a single process step the same way Process does
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        step                             [function]
+        segment                          [Data]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+    if hasattr(step,'evaluate'):
+        step.evaluate(segment)
+    else:
+        step(segment)
+
+## @ingroup Methods-Missions-Segments-Common
+def final_point(conditions):
+    """ Copies the conditions keeping only the final row of every array
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        conditions                       [Data]
+
+        Outputs:
+        final                            [Conditions]
+
+        Properties Used:
+        N/A
+
+    """
+    final = Conditions()
+    for k, v in dict.items(conditions):
+        if isinstance(v,dict):
+            final[k] = final_point(v)
+        elif isinstance(v,array_type) and v.ndim > 0:
+            final[k] = v[-1:].copy()
+        else:
+            final[k] = v
+    return final
+
+## @ingroup Methods-Missions-Segments-Common
+def update_boundary(boundary,latest):
+    """ Copies new final point values into a boundary in place
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        boundary                         [Conditions]
+        latest                           [Conditions]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+    for k, v in dict.items(latest):
+        old = dict.get(boundary,k)
+        if isinstance(v,dict) and isinstance(old,dict):
+            update_boundary(old,v)
+        elif isinstance(v,array_type) and isinstance(old,array_type) and v.shape == old.shape:
+            old[...] = v
+        else:
+            boundary[k] = v
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def stack_conditions(items,sizes,leaves=None,path=()):
+    """ Stacks the conditions of several sub segments into one set of conditions
+
+        Assumptions:
+        Arrays with one row per control point in every item are stacked, anything else is taken from
+        the first item
+
+        Inputs:
+        items                            [list of Conditions]
+        sizes                            [list of int]
+        leaves                           [list] (optional, collects the path and value of stacked arrays)
+
+        Outputs:
+        stacked                          [Conditions]
+
+        Properties Used:
+        N/A
+
+    """
+    # skip the defaults machinery, this is rebuilt often
+    stacked = dict.__new__(Conditions)
+    stacked._size = sum(sizes)
+    for k, v in dict.items(items[0]):
+        values = [dict.get(item,k) for item in items]
+        if isinstance(v,dict):
+            if all(isinstance(value,dict) for value in values):
+                stacked[k] = stack_conditions(values,sizes,leaves,path + (k,))
+            else:
+                stacked[k] = v
+        elif all(isinstance(value,array_type) and value.ndim > 0 and value.shape[0] == n and value.shape[1:] == v.shape[1:] \
+                 for value, n in zip(values,sizes)):
+            stacked[k] = np.concatenate(values,axis=0)
+            if leaves is not None:
+                leaves.append((path + (k,),stacked[k]))
+        else:
+            stacked[k] = v
+    return stacked
+
+## @ingroup Methods-Missions-Segments-Common
+def split_conditions(stacked,items,sizes):
+    """ Scatters stacked conditions back into the conditions of each sub segment
+
+        Assumptions:
+        Any array with as many rows as all sub segments together is split by control point
+
+        Inputs:
+        stacked                          [Conditions]
+        items                            [list of Conditions]
+        sizes                            [list of int]
+
+        Outputs:
+        N/A
+
+        Properties Used:
+        N/A
+
+    """
+    total  = sum(sizes)
+    bounds = np.cumsum([0] + sizes)
+    for k, v in dict.items(stacked):
+        if isinstance(v,dict):
+            for item in items:
+                if not isinstance(dict.get(item,k),dict):
+                    item[k] = Conditions()
+            split_conditions(v,[dict.__getitem__(item,k) for item in items],sizes)
+        elif isinstance(v,array_type) and v.ndim > 0 and v.shape[0] == total:
+            for i, item in enumerate(items):
+                item[k] = v[bounds[i]:bounds[i+1]].copy()
+        else:
+            for item in items:
+                if k not in item:
+                    item[k] = v
+    return
+
+## @ingroup Methods-Missions-Segments-Common
+def compare_conditions(conditions,reference,path=''):
+    """ Lists the arrays of two sets of conditions that differ
+
+        Assumptions:
+        Values agreeing to a relative tolerance of 1e-8 are the same
+
+        Inputs:
+        conditions                       [Conditions]
+        reference                        [Conditions]
+
+        Outputs:
+        mismatch                         [string]
+
+        Properties Used:
+        N/A
+
+    """
+    mismatch = ''
+    for k, v in dict.items(reference):
+        value = dict.get(conditions,k)
+        if isinstance(v,dict) and isinstance(value,dict):
+            mismatch += compare_conditions(value,v,path + k + '.')
+        elif isinstance(v,array_type) and v.dtype.kind == 'f':
+            if not isinstance(value,array_type) or value.shape != v.shape or \
+               not np.allclose(value,v,rtol=1e-8,atol=1e-12,equal_nan=True):
+                mismatch += ' ' + path + k
+    return mismatch
+
+## @ingroup Methods-Missions-Segments-Common
+def conditions_node(conditions,path):
+    """ Follows a path of keys down a set of conditions
+
+        Assumptions:
+        N/A
+
+        Inputs:
+        conditions                       [Conditions]
+        path                             [tuple of strings]
+
+        Outputs:
+        node                             [Conditions]
+
+        Properties Used:
+        N/A
+
+    """
+    for k in path:
+        conditions = dict.__getitem__(conditions,k)
+    return conditions
@@ -3,6 +3,7 @@
 # @ingroup Methods-Missions-Segments
 
 from . import Sub_Segments
+from . import Batched_Segments
 from . import Aerodynamics
 from . import Energy
 from . import Noise 
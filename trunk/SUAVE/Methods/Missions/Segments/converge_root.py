@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2014, SUAVE Team
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -11,7 +12,8 @@
 import scipy.optimize
 import numpy as np
 
-from SUAVE.Core.Arrays import array_type
+from SUAVE.Core import Data
+from SUAVE.Core.Arrays import array_type, matrix_type, atleast_2d_col
 
 # ----------------------------------------------------------------------
 #  Converge Root
@@ -20,6 +22,15 @@ from SUAVE.Core.Arrays import array_type
 ## @ingroup Methods-Missions-Segments
 def converge_root(segment):
     """Interfaces the mission to a numerical solver. The solver may be changed by using root_finder.
+    The Jacobian handed to the solver is selected with state.numerics.solver_jacobian:
+    
+        "none"         - the root finder builds its own dense finite difference Jacobian
+        "block_sparse" - graph colored finite differences exploiting the per control point structure
+        function       - user supplied partials, called as jacobian(unknowns,segment)
+        
+    When a Jacobian is handed to the solver every process evaluation, including those made for the
+    Jacobian, counts against state.numerics.max_evaluations. With state.numerics.flat_state the unknowns
+    and residuals are kept in flat buffers, see Conditions.flat_layout.
 
     Assumptions:
     N/A
@@ -31,6 +42,9 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.max_evaluations     [Unitless]
+    state.numerics.solver_jacobian     [string or function]
+    state.numerics.flat_state          [boolean]
 
     Outputs:
     state.unknowns                     [Any]
@@ -46,14 +60,36 @@ def converge_root(segment):
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
+        
+    # keeps the recent residuals requested by the root finder and the number of process evaluations,
+    # a max_evaluations of zero takes the fsolve default for a finite difference Jacobian
+    evaluations = Data()
+    evaluations.count           = 0
+    evaluations.max_evaluations = segment.state.numerics.max_evaluations
+    if evaluations.max_evaluations <= 0:
+        evaluations.max_evaluations = 200*(len(unknowns)+1)
+    evaluations.points          = []
+        
+    # only hand a Jacobian to the root finder if one is requested
+    options  = dict()
+    function = iterate
+    fprime   = make_jacobian(segment,evaluations)
+    if fprime is not None:
+        options['fprime'] = fprime
+        function = lambda unknowns, segment: counted_iterate(unknowns,segment,evaluations)
     
-    unknowns,infodict,ier,msg = root_finder( iterate,
-                                         unknowns,
-                                         args = segment,
-                                         xtol = segment.state.numerics.tolerance_solution,
-                                         maxfev = segment.state.numerics.max_evaluations,
-                                         epsfcn = segment.state.numerics.step_size,
-                                         full_output = 1)
+    try:
+        unknowns,infodict,ier,msg = root_finder( function,
+                                             unknowns,
+                                             args = segment,
+                                             xtol = segment.state.numerics.tolerance_solution,
+                                             maxfev = segment.state.numerics.max_evaluations,
+                                             epsfcn = segment.state.numerics.step_size,
+                                             full_output = 1,
+                                             **options)
+    except Evaluation_Limit as limit:
+        ier = 0
+        msg = str(limit)
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -83,6 +119,7 @@ def iterate(unknowns, segment):
 
     Inputs:
     state.unknowns                [Data]
+    state.numerics.flat_state     [boolean]
     segment.process.iterate       [Data]
 
     Outputs:
@@ -91,13 +128,390 @@ def iterate(unknowns, segment):
     Properties Used:
     N/A
     """       
-    if isinstance(unknowns,array_type):
-        segment.state.unknowns.unpack_array(unknowns)
-    else:
+    flat_state = segment.state.numerics.get('flat_state',False)
+    
+    if not isinstance(unknowns,array_type):
         segment.state.unknowns = unknowns
+    elif flat_state:
+        segment.state.unknowns.flat_layout().unpack(unknowns)
+    else:
+        segment.state.unknowns.unpack_array(unknowns)
         
     segment.process.iterate(segment)
     
-    residuals = segment.state.residuals.pack_array()
+    # the root finder keeps residuals between calls, so the flat buffer is copied out once
+    if flat_state:
+        residuals = segment.state.residuals.flat_layout().pack().copy()
+    else:
+        residuals = segment.state.residuals.pack_array()
+        
+    return residuals 
+
+## @ingroup Methods-Missions-Segments
+class Evaluation_Limit(Exception):
+    """Raised when the process evaluations of a solve reach state.numerics.max_evaluations
+    """
+    pass
+
+## @ingroup Methods-Missions-Segments
+def counted_iterate(unknowns, segment, evaluations, keep=True):
+    """Runs one iteration of all analyses for the mission, counting it against the evaluation budget. The
+    residuals of the recently kept points are reused if the same unknowns are requested again, the root
+    finder asks for the Jacobian at points it has already evaluated.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                      [array]
+    segment                       [Data]
+    evaluations.count             [Unitless]
+    evaluations.max_evaluations   [Unitless]
+    evaluations.points            [list of (unknowns, residuals)]
+    keep                          [boolean]
+
+    Outputs:
+    residuals                     [Unitless]
+
+    Properties Used:
+    N/A
+    """
+    
+    unknowns = np.array(unknowns,dtype=float)
+    
+    for point, residuals in evaluations.points:
+        if np.array_equal(unknowns,point):
+            return residuals.copy()
+    
+    if evaluations.count >= evaluations.max_evaluations:
+        raise Evaluation_Limit('The number of process evaluations has reached max_evaluations = ' + str(int(evaluations.max_evaluations)) + '.')
+    
+    residuals = iterate(unknowns,segment)
+    evaluations.count += 1
+    
+    if keep:
+        evaluations.points = [(unknowns,residuals.copy())] + evaluations.points[:3]
+    
+    return residuals
+
+## @ingroup Methods-Missions-Segments
+def make_jacobian(segment,evaluations):
+    """Builds the Jacobian function passed to the root finder based on state.numerics.solver_jacobian.
+
+    Assumptions:
+    The block sparse Jacobian couples unknowns and residuals that share a control point. Unknowns which
+    also reach other control points through the differentiation and integration operators are found by
+    perturbing one entry of each at the first Jacobian, their columns are then coupled to every residual
+    array that responded.
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    state.numerics.solver_jacobian     [string or function]
+    state.numerics.jacobian_sparsity   [function] (optional, defaults to block_sparsity)
+    state.numerics.step_size           [Unitless]
+    evaluations                        [Data]
+
+    Outputs:
+    fprime                             [function or None]
+
+    Properties Used:
+    N/A
+    """
+    
+    jacobian_type = segment.state.numerics.get('solver_jacobian','none')
+    
+    if callable(jacobian_type):
+        return jacobian_type
+    elif jacobian_type in (None,'none'):
+        return None
+    elif jacobian_type == 'block_sparse':
+        sparsity_function = segment.state.numerics.get('jacobian_sparsity',block_sparsity)
+        epsfcn            = segment.state.numerics.step_size
+        pattern           = Data()
         
-    return residuals 
\ No newline at end of file
+        def fprime(unknowns,segment):
+            unknowns = np.array(unknowns,dtype=float)
+            if not pattern:
+                sparsity, unknown_blocks, residual_blocks = sparsity_function(segment)
+                pattern.sparsity = operator_coupling(unknowns,segment,sparsity,unknown_blocks,residual_blocks,evaluations,epsfcn)
+                pattern.colors   = color_columns(pattern.sparsity)
+            # the root finder checks the shape of the Jacobian at the initial guess before asking for it
+            elif np.array_equal(unknowns,pattern.unknowns):
+                return pattern.jacobian.copy()
+            pattern.unknowns = unknowns
+            pattern.jacobian = colored_jacobian(unknowns,segment,pattern.sparsity,pattern.colors,evaluations,epsfcn)
+            return pattern.jacobian.copy()
+        
+        return fprime
+    else:
+        raise ValueError('Unknown solver_jacobian "' + str(jacobian_type) + '" in segment ' + segment.tag)
+    
+## @ingroup Methods-Missions-Segments
+def block_sparsity(segment):
+    """Finds the per control point sparsity pattern of the residuals with respect to the unknowns. An entry
+    belonging to an array with one row per control point only couples to entries at the same control
+    point. Any other unknown (scalars, single row arrays) is treated as coupled to everything, any other
+    residual is left to be found by operator_coupling. Each column of an array with one row per control
+    point is also returned as a block, unknown blocks may couple to other control points through the
+    differentiation and integration operators.
+
+    Assumptions:
+    The unknowns and residuals are packed by Data.pack_array
+
+    Source:
+    N/A
+
+    Inputs:
+    state.unknowns                        [Data]
+    state.residuals                       [Data]
+    state.numerics.number_control_points  [Unitless]
+
+    Outputs:
+    sparsity                              [boolean array, n_residuals x n_unknowns]
+    unknown_blocks                        [list of arrays of int]
+    residual_blocks                       [list of arrays of int]
+
+    Properties Used:
+    N/A
+    """
+    
+    n_cp = segment.state.numerics.number_control_points
+    
+    unknown_points  = control_point_index(segment.state.unknowns,n_cp)
+    residual_points = control_point_index(segment.state.residuals,n_cp)
+    
+    coupled_u = unknown_points  == -1
+    local_r   = residual_points != -1
+    
+    sparsity = ((residual_points[:,None] == unknown_points[None,:]) & local_r[:,None]) | coupled_u[None,:]
+    
+    # the packed entries of a per control point array run from its first to its last control point
+    unknown_blocks  = [np.arange(start,start+n_cp) for start in np.where(unknown_points  == 0)[0]]
+    residual_blocks = [np.arange(start,start+n_cp) for start in np.where(residual_points == 0)[0]]
+    
+    return sparsity, unknown_blocks, residual_blocks
+
+## @ingroup Methods-Missions-Segments
+def operator_coupling(unknowns,segment,sparsity,unknown_blocks,residual_blocks,evaluations,epsfcn=None):
+    """Adds the coupling through the differentiation and integration operators to a per control point
+    sparsity pattern. Each unknown block is probed twice. One of its entries is perturbed, if residuals
+    outside its own control point respond the whole block is coupled to every residual block that
+    responded. Then the whole block is perturbed and coupled to the residuals outside any residual block
+    that responded, such as final condition errors.
+
+    Assumptions:
+    An entry reaching other control points means the whole block does. The second control point is probed
+    since the integration operators do not carry the first control point forward. Couplings that vanish at
+    the probed unknowns are not found.
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns         [array]
+    segment          [Data]
+    sparsity         [boolean array, n_residuals x n_unknowns]
+    unknown_blocks   [list of arrays of int]
+    residual_blocks  [list of arrays of int]
+    evaluations      [Data]
+    epsfcn           [Unitless]
+
+    Outputs:
+    sparsity         [boolean array, n_residuals x n_unknowns]
+
+    Properties Used:
+    N/A
+    """
+    
+    unknowns  = np.array(unknowns,dtype=float)
+    residuals = counted_iterate(unknowns,segment,evaluations)
+    steps     = finite_difference_steps(unknowns,epsfcn)
+    coupled   = sparsity.copy()
+    
+    single_rows = np.ones(len(residuals),dtype=bool)
+    for rows in residual_blocks:
+        single_rows[rows] = False
+    
+    for block in unknown_blocks:
+        
+        # coupling to the other control points
+        probe = block[min(1,len(block)-1)]
+        perturbed = unknowns.copy()
+        perturbed[probe] += steps[probe]
+        changed = counted_iterate(perturbed,segment,evaluations,keep=False) != residuals
+        
+        if np.any(changed & ~sparsity[:,probe] & ~single_rows):
+            for rows in residual_blocks:
+                if np.any(changed[rows]):
+                    coupled[np.ix_(rows,block)] = True
+                    
+        # coupling to residuals that are not per control point
+        if np.any(single_rows):
+            perturbed = unknowns.copy()
+            perturbed[block] += steps[block]
+            changed = counted_iterate(perturbed,segment,evaluations,keep=False) != residuals
+            coupled[np.ix_(changed & single_rows,block)] = True
+        
+    return coupled
+
+## @ingroup Methods-Missions-Segments
+def control_point_index(data,n_cp):
+    """Maps every entry of the packed array of a Data structure to the control point it belongs to.
+    Entries not associated with a single control point are marked with -1.
+
+    Assumptions:
+    Walks the data in the same order and with the same type rules as Data.pack_array
+
+    Source:
+    N/A
+
+    Inputs:
+    data          [Data]
+    n_cp          [Unitless]
+
+    Outputs:
+    index         [array of int]
+
+    Properties Used:
+    N/A
+    """
+    
+    valid_types = ( int, float, array_type, matrix_type )
+    
+    index = []
+    
+    def do_index(D):
+        for v in D.values():
+            if isinstance(v,dict):
+                do_index(v)
+                continue
+            elif not isinstance(v,valid_types): continue
+            elif np.ndim(v) > 2: continue
+            
+            v = atleast_2d_col(v)
+            rows, cols = v.shape
+            if rows == n_cp:
+                index.append(np.tile(np.arange(rows),cols))
+            else:
+                index.append(-np.ones(rows*cols,dtype=int))
+    
+    do_index(data)
+    
+    if index:
+        index = np.hstack(index)
+    else:
+        index = np.array([],dtype=int)
+    
+    return index
+
+## @ingroup Methods-Missions-Segments
+def color_columns(sparsity):
+    """Greedy coloring of the columns of a sparse Jacobian. Columns of the same color share no nonzero
+    rows, so they can be perturbed together in a single function evaluation.
+
+    Assumptions:
+    N/A
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, 1974
+
+    Inputs:
+    sparsity      [boolean array, n_residuals x n_unknowns]
+
+    Outputs:
+    colors        [array of int, n_unknowns]
+
+    Properties Used:
+    N/A
+    """
+    
+    S         = sparsity.astype(int)
+    conflicts = np.dot(S.T,S) > 0
+    n_columns = S.shape[1]
+    colors    = -np.ones(n_columns,dtype=int)
+    
+    for j in range(n_columns):
+        used  = set(colors[conflicts[j] & (colors >= 0)])
+        color = 0
+        while color in used:
+            color += 1
+        colors[j] = color
+        
+    return colors
+
+## @ingroup Methods-Missions-Segments
+def colored_jacobian(unknowns,segment,sparsity,colors,evaluations,epsfcn=None):
+    """Forward difference Jacobian of the residuals using one process evaluation per column color
+
+    Assumptions:
+    Step sizes follow the MINPACK forward difference convention used by fsolve
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns      [array]
+    segment       [Data]
+    sparsity      [boolean array, n_residuals x n_unknowns]
+    colors        [array of int, n_unknowns]
+    evaluations   [Data]
+    epsfcn        [Unitless]
+
+    Outputs:
+    jacobian      [array, n_residuals x n_unknowns]
+
+    Properties Used:
+    N/A
+    """
+    
+    unknowns  = np.array(unknowns,dtype=float)
+    residuals = counted_iterate(unknowns,segment,evaluations)
+    steps     = finite_difference_steps(unknowns,epsfcn)
+    
+    jacobian = np.zeros((len(residuals),len(unknowns)))
+    
+    for color in range(colors.max()+1):
+        columns = colors == color
+        perturbed = unknowns.copy()
+        perturbed[columns] += steps[columns]
+        delta = counted_iterate(perturbed,segment,evaluations,keep=False) - residuals
+        jacobian[:,columns] = np.where(sparsity[:,columns],delta[:,None]/steps[None,columns],0.)
+        
+    return jacobian
+
+## @ingroup Methods-Missions-Segments
+def finite_difference_steps(unknowns,epsfcn=None):
+    """Forward difference step for each unknown, following the MINPACK convention used by fsolve
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns      [array]
+    epsfcn        [Unitless]
+
+    Outputs:
+    steps         [array]
+
+    Properties Used:
+    N/A
+    """
+    
+    if epsfcn is None:
+        epsfcn = 0.
+    eps = np.sqrt(max(epsfcn,np.finfo(float).eps))
+    
+    steps = eps*np.abs(unknowns)
+    steps[steps==0.] = eps
+    
+    return steps
@@ -3,6 +3,7 @@
 # 
 # Created:  Jun 2015, Carlos Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -16,9 +17,7 @@ from .noise_landing_gear       import noise_landing_gear
 from .noise_leading_edge_slat  import noise_leading_edge_slat
 from .noise_trailing_edge_flap import noise_trailing_edge_flap
 
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import compute_noise_metrics
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import senel_noise
@@ -203,46 +202,15 @@ def noise_airframe_Fink(segment,analyses,config,settings,ioprint = 0, filename=0
         SPLt_dBA_history[i][:] = SPLt_dBA[:]
         SPLt_dBA_max[i] = max(SPLt_dBA)         
           
-    # Calculation of the Perceived Noise Level EPNL based on the sound time history 
-    PNL_total             = pnl_noise(SPL_total_history)
-    PNL_wing              = pnl_noise(SPL_wing_history)
-    PNL_ht                = pnl_noise(SPLht_history)
-    PNL_vt                = pnl_noise(SPLvt_history)
-    PNL_nose_landing_gear = pnl_noise(SPL_nose_landing_gear_history)
-    PNL_main_landing_gear = pnl_noise(SPL_main_landing_gear_history)
-    PNL_slat              = pnl_noise(SPL_slat_history)
-    PNL_flap              = pnl_noise(SPL_flap_history)
-     
-    # Calculation of the tones corrections on the SPL for each component and total
-    tone_correction_total             = noise_tone_correction(SPL_total_history) 
-    tone_correction_wing              = noise_tone_correction(SPL_wing_history)
-    tone_correction_ht                = noise_tone_correction(SPLht_history)
-    tone_correction_vt                = noise_tone_correction(SPLvt_history)
-    tone_correction_flap              = noise_tone_correction(SPL_flap_history)
-    tone_correction_slat              = noise_tone_correction(SPL_slat_history)
-    tone_correction_nose_landing_gear = noise_tone_correction(SPL_nose_landing_gear_history)
-    tone_correction_main_landing_gear = noise_tone_correction(SPL_main_landing_gear_history)
-    
-    # Calculation of the PLNT for each component and total
-    PNLT_total             = PNL_total+tone_correction_total
-    PNLT_wing              = PNL_wing+tone_correction_wing
-    PNLT_ht                = PNL_ht+tone_correction_ht
-    PNLT_vt                = PNL_vt+tone_correction_vt
-    PNLT_nose_landing_gear = PNL_nose_landing_gear+tone_correction_nose_landing_gear
-    PNLT_main_landing_gear = PNL_main_landing_gear+tone_correction_main_landing_gear
-    PNLT_slat              = PNL_slat+tone_correction_slat
-    PNLT_flap              = PNL_flap+tone_correction_flap
-    
-    #Calculation of the EPNL for each component and total
-    EPNL_total             = epnl_noise(PNLT_total)
-    EPNL_wing              = epnl_noise(PNLT_wing)
-    EPNL_ht                = epnl_noise(PNLT_ht)
-    EPNL_vt                = epnl_noise(PNLT_vt)    
-    EPNL_nose_landing_gear = epnl_noise(PNLT_nose_landing_gear)
-    EPNL_main_landing_gear = epnl_noise(PNLT_main_landing_gear)
-    EPNL_slat              = epnl_noise(PNLT_slat)
-    EPNL_flap              = epnl_noise(PNLT_flap)
-    
+    # Calculation of the noise metrics of the total noise and of each component at once
+    metrics = compute_noise_metrics(np.array([SPL_total_history,SPL_wing_history,SPLht_history,SPLvt_history,
+                                              SPL_nose_landing_gear_history,SPL_main_landing_gear_history,
+                                              SPL_slat_history,SPL_flap_history]))
+
+    # PNLT and EPNL for each component and total
+    PNLT_total, PNLT_wing, PNLT_ht, PNLT_vt, PNLT_nose_landing_gear, PNLT_main_landing_gear, PNLT_slat, PNLT_flap = metrics.PNLT
+    EPNL_total, EPNL_wing, EPNL_ht, EPNL_vt, EPNL_nose_landing_gear, EPNL_main_landing_gear, EPNL_slat, EPNL_flap = metrics.EPNL
+
     #Calculation of the SENEL total
     SENEL_total = senel_noise(SPLt_dBA_max)
     
@@ -4,6 +4,7 @@
 # Created:  May 2015, C. Ilario
 # Modified: Nov 2015, C. Ilario
 #           Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -21,13 +22,9 @@ from .noise_source_location     import noise_source_location
 from .primary_noise_component   import primary_noise_component
 from .secondary_noise_component import secondary_noise_component
 
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import pnl_noise
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import noise_tone_correction
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import epnl_noise
+from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import compute_noise_metrics
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import atmospheric_attenuation 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import SPL_arithmetic
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import senel_noise
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import dbA_noise 
 from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import print_engine_output
 
 # ----------------------------------------------------------------------        
@@ -44,6 +41,8 @@ def noise_SAE(turbofan,segment,analyses,config,settings,ioprint = 0, filename =
 
     Assumptions:
         SAE ARP876D: Gas Turbine Jet Exhaust Noise Prediction
+        The time steps, microphones and frequency bands are evaluated as arrays. The noise source location
+        of each time step starts from the emission angles of the previous time step.
 
     Inputs:
         vehicle	 - SUAVE type vehicle 
@@ -65,6 +64,7 @@ def noise_SAE(turbofan,segment,analyses,config,settings,ioprint = 0, filename =
             Engine_height              - Engine centerline height above the ground plane     [m]
             distance_microphone        - Distance from the nozzle exhaust to the microphones [m]
             angles                     - Array containing the desired polar angles           [rad]
+                                         (one per time step, or one column per microphone)
 
 
         airport   - SUAVE type airport data, with followig fields:
@@ -78,6 +78,7 @@ def noise_SAE(turbofan,segment,analyses,config,settings,ioprint = 0, filename =
         SPL_s                           - Sound Pressure Level of the secondary jet          [dB]
         SPL_m                           - Sound Pressure Level of the mixed jet              [dB]
         SPL_total                       - Sound Pressure Level of the total jet noise        [dB]
+        With one column per microphone the levels have a microphone axis after the time axis.
 
     """ 
     # unpack 
@@ -153,264 +154,220 @@ def noise_SAE(turbofan,segment,analyses,config,settings,ioprint = 0, filename =
 
     """Starting the main program"""
 
-    #Arrays for the calculation of atmospheric attenuation
-    Acq = np.array((0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.9, 1.2, 1.5, 1.9, 2.5, 2.9, 3.6, 4.9, 6.8))
-    Acf = np.array((0, 0, 0, 0, 0.1, 0.1, 0.1, 0.1, 0.1, 0.2, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0, 1.3, 1.8, 2.5, 3.0, 4.2, 6.1, 9.0))
-
     #Desired frequency range for noise evaluation
     frequency = settings.center_frequencies[5:] 
     num_f     = len(frequency)
 
-    # Defining each array before the main loop
-    B       = np.zeros(num_f)
-    theta_p = np.ones(num_f)*np.pi/2
-    theta_s = np.ones(num_f)*np.pi/2
-    theta_m = np.ones(num_f)*np.pi/2
-    EX_p    = np.zeros(num_f)
-    EX_s    = np.zeros(num_f)
-    EX_m    = np.zeros(num_f)
-    exc     = np.zeros(num_f)
-    SPL_p   = np.zeros(num_f)
-    SPL_s   = np.zeros(num_f)
-    SPL_m   = np.zeros(num_f)
-    PG_p    = np.zeros(num_f)
-    PG_s    = np.zeros(num_f)
-    PG_m    = np.zeros(num_f)
-
-    dspl_attenuation_p = np.zeros(num_f)
-    dspl_attenuation_s = np.zeros(num_f)
-    dspl_attenuation_m = np.zeros(num_f)
-
-    SPL_total_history     = np.zeros((nsteps,num_f))
-    SPL_primary_history   = np.zeros((nsteps,num_f))
-    SPL_secondary_history = np.zeros((nsteps,num_f))
-    SPL_mixed_history     = np.zeros((nsteps,num_f))
-
-    # Noise history in dBA
-    SPLt_dBA         = np.zeros((nsteps,num_f))
-    SPLt_dBA_history = np.zeros((nsteps,num_f))
-    SPLt_dBA_max     = np.zeros(nsteps)
-
-    # Start loop for each position of aircraft 
-    for id in range(0,nsteps):
-
-        # Jet Flow Parameters
+    # Time steps along the first axis, microphones along the second and frequency bands along the last
+    def column(values):
+        return np.reshape(values,(nsteps,1,1))
+
+    distance = np.reshape(distance_microphone,(nsteps,-1,1))
+    theta    = np.reshape(angles,(nsteps,-1,1))
+    num_mic  = distance.shape[1]
+
+    Velocity_p    = column(Velocity_primary)
+    Velocity_s    = column(Velocity_secondary)
+    Temperature_p = column(Temperature_primary)
+    Temperature_s = column(Temperature_secondary)
+    Pressure_p    = column(Pressure_primary)
+    Pressure_s    = column(Pressure_secondary)
+    sound_amb     = column(sound_ambient)
+    density_amb   = column(density_ambient)
+    pressure_a    = column(pressure_amb)
+
+    # Jet Flow Parameters
+
+    #Primary and Secondary jets
+    Cpp = R_gas/(1-1/gamma_primary)
+    Cp  = R_gas/(1-1/gamma)
+
+    density_primary   = Pressure_p/(R_gas*Temperature_p-(0.5*R_gas*Velocity_p**2/Cpp))
+    density_secondary = Pressure_s/(R_gas*Temperature_s-(0.5*R_gas*Velocity_s**2/Cp))
+
+    mass_flow_primary   = Area_primary*Velocity_p*density_primary
+    mass_flow_secondary = Area_secondary*Velocity_s*density_secondary
+
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft = Velocity_aircraft/sound_amb
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters
+    Velocity_mixed = (mass_flow_primary*Velocity_p+mass_flow_secondary*Velocity_s)/ \
+        (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed =(mass_flow_primary*Temperature_p+mass_flow_secondary*Temperature_s)/ \
+        (mass_flow_primary+mass_flow_secondary)
+    density_mixed = pressure_a/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed = Area_primary*density_primary*Velocity_p*(1+(mass_flow_secondary/mass_flow_primary))/ \
+        (density_mixed*Velocity_mixed)
+    Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+    #**********************************************
+    # START OF THE NOISE PROCEDURE CALCULATIONS
+    #**********************************************
+
+    XBPR = np.clip(mass_flow_secondary/mass_flow_primary - 5.5,0,4)
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.abs((Velocity_p - (Velocity_s*Area_secondary+Velocity_aircraft*Area_primary)/\
+                   (Area_secondary+Area_primary)))
+    DVPS = np.maximum(DVPS,0.3)
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
+    Str_s = frequency*Diameter_mixed/(Velocity_s-Velocity_aircraft) #Secondary jet
+    Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter
+    #Excitation Strouhal Number
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+    SX = np.where((excitation_Strouhal > 0.25) & (excitation_Strouhal < 0.5),0.0,
+                  50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5))
+
+    #Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)    
+
+    # The noise source location of each time step starts from the angles of the previous time step
+    B       = np.zeros((num_mic,num_f))
+    theta_p = np.ones((num_mic,num_f))*np.pi/2
+    theta_s = np.ones((num_mic,num_f))*np.pi/2
+    theta_m = np.ones((num_mic,num_f))*np.pi/2
+
+    theta_p_history = np.zeros((nsteps,num_mic,num_f))
+    theta_s_history = np.zeros((nsteps,num_mic,num_f))
+    theta_m_history = np.zeros((nsteps,num_mic,num_f))
 
-        #Primary and Secondary jets
-        Cpp = R_gas/(1-1/gamma_primary)
-        Cp  = R_gas/(1-1/gamma)
-
-        density_primary   = Pressure_primary[id]/(R_gas*Temperature_primary[id]-(0.5*R_gas*Velocity_primary[id]**2/Cpp))
-        density_secondary = Pressure_secondary[id]/(R_gas*Temperature_secondary[id]-(0.5*R_gas*Velocity_secondary[id]**2/Cp))
-
-        mass_flow_primary   = Area_primary*Velocity_primary[id]*density_primary
-        mass_flow_secondary = Area_secondary*Velocity_secondary[id]*density_secondary
-
-        #Mach number of the external flow - based on the aircraft velocity
-        Mach_aircraft[id] = Velocity_aircraft/sound_ambient[id]
-
-        #Calculation Procedure for the Mixed Jet Flow Parameters
-        Velocity_mixed = (mass_flow_primary*Velocity_primary[id]+mass_flow_secondary*Velocity_secondary[id])/ \
-            (mass_flow_primary+mass_flow_secondary)
-        Temperature_mixed =(mass_flow_primary*Temperature_primary[id]+mass_flow_secondary*Temperature_secondary[id])/ \
-            (mass_flow_primary+mass_flow_secondary)
-        density_mixed = pressure_amb[id]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
-        Area_mixed = Area_primary*density_primary*Velocity_primary[id]*(1+(mass_flow_secondary/mass_flow_primary))/ \
-            (density_mixed*Velocity_mixed)
-        Diameter_mixed = (4*Area_mixed/np.pi)**0.5
-
-        #**********************************************
-        # START OF THE NOISE PROCEDURE CALCULATIONS
-        #**********************************************
-
-        XBPR = mass_flow_secondary/mass_flow_primary - 5.5
-        if XBPR<0:
-            XBPR=0
-        elif XBPR>4:
-            XBPR=4
-
-        #Auxiliary parameter defined as DVPS
-        DVPS = np.abs((Velocity_primary[id] - (Velocity_secondary[id]*Area_secondary+Velocity_aircraft*Area_primary)/\
-                       (Area_secondary+Area_primary)))
-        if DVPS<0.3:
-            DVPS=0.3
-
-        # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
-        Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
-        Str_s = frequency*Diameter_mixed/(Velocity_secondary[id]-Velocity_aircraft) #Secondary jet
-        Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
-
-        #Calculation of the Excitation adjustment parameter
-        #Excitation Strouhal Number
-        excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
-        if (excitation_Strouhal > 0.25 and excitation_Strouhal < 0.5):
-            SX = 0.0
-        else:
-            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
-
-        #Effectiveness
-        exps = np.exp(-SX)
-
-        #Spectral Shape Factor
-        exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
-
-        #Fan Duct Lenght Factor
-        exd = np.exp(0.6-(EXA)**0.5)
-
-        #Excitation source location factor (zk)
-        zk = 1-0.4*(exd)*(exps)    
-
-        #Main loop for the desired polar angles
-
-        theta = angles[id]
-
-        # Call function noise source location for the calculation of theta
-        thetaj = noise_source_location(B,Xo,zk,Diameter_primary,theta_p,Area_primary,Area_secondary,distance_microphone[id],
-                                       Diameter_secondary,theta,theta_s,theta_m,Diameter_mixed,Velocity_primary[id],
-                                       Velocity_secondary[id],Velocity_mixed,Velocity_aircraft,sound_ambient[id],Str_m,Str_s)
-
-        # Loop for the frequency array range
-        for i in range(0,num_f):
-            #Calculation of the Directivity Factor
-            if (theta_m[i] <=1.4):
-                exc[i] = sound_ambient[id]/Velocity_mixed
-            elif (theta_m[i]>1.4):
-                exc[i] =(sound_ambient[id]/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m[i]-1.4))
-
-            #Acoustic excitation adjustment (EX)
-            EX_m[i] = exd*exs[i]*exc[i]   #mixed component - dependant of the frequency
-
-        EX_p = +5*exd*exps   #primary component - no frequency dependance
-        EX_s = 2*sound_ambient[id]/(Velocity_secondary[id]*(zk)) #secondary component - no frequency dependance    
-
-        distance_primary   = distance_microphone[id] 
-        distance_secondary = distance_microphone[id] 
-        distance_mixed     = distance_microphone[id]
-
-        #Noise attenuation due to Ambient Pressure
-        dspl_ambient_pressure = 20*np.log10(pressure_amb[id]/pressure_isa)
-
-        #Noise attenuation due to Density Gradientes
-        dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient[id]))
-        dspl_density_s = 20*np.log10((density_secondary+density_ambient[id])/(2*density_ambient[id]))
-        dspl_density_m = 20*np.log10((density_mixed+density_ambient[id])/(2*density_ambient[id]))
-
-        #Noise attenuation due to Spherical divergence
-        dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
-        dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
-        dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
-
-        # Noise attenuation due to Geometric Near-Field
-        if near_field ==0:
-            dspl_geometric_p = 0.0
-            dspl_geometric_s = 0.0
-            dspl_geometric_m = 0.0
-        elif near_field ==1:
-            dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_ambient[id]/frequency))/distance_primary)
-            dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_secondary)
-            dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_ambient[id]/frequency))/distance_mixed)
-
-        # Noise attenuation due to Acoustic Near-Field
-        if near_field ==0:
-            dspl_acoustic_p = 0.0;
-            dspl_acoustic_s = 0.0;
-            dspl_acoustic_m = 0.0;
-        elif near_field ==1:
-            dspl_acoustic_p = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_primary*frequency))**2)
-            dspl_acoustic_s = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_secondary*frequency))**2)
-            dspl_acoustic_m = 10*np.log10(1+0.13*(sound_ambient[id]/(distance_mixed*frequency))**2)
-
-        # Atmospheric attenuation coefficient
-        if tunnel==0:
-            f_primary   = frequency/(1-Mach_aircraft[id]*np.cos(theta_p))
-            f_secondary = frequency/(1-Mach_aircraft[id]*np.cos(theta_s))
-            f_mixed     = frequency/(1-Mach_aircraft[id]*np.cos(theta_m))
-            Aci         = Acf + ((temperature_ambient[id]-0)-15)/10*(Acq-Acf)    
-
-            Ac_primary   = np.interp(f_primary,frequency,Aci)
-            Ac_secondary = np.interp(f_secondary,frequency,Aci)
-            Ac_mixed     = np.interp(f_mixed,frequency,Aci)
-
-                #Atmospheric attenuation
-            delta_atmo = atmospheric_attenuation(distance_primary)
-
-            dspl_attenuation_p = -delta_atmo 
-            dspl_attenuation_s = -delta_atmo 
-            dspl_attenuation_m = -delta_atmo 
-
-        elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
-            dspl_attenuation_p = np.zeros(num_f)
-            dspl_attenuation_s = np.zeros(num_f)
-            dspl_attenuation_m = np.zeros(num_f)
-            EX_m = np.zeros(num_f)
-            EX_p = 0
-            EX_s = 0
-
-        # Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
-        DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
-        DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
-        DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
-
-
-        # Calculation of interference effects on jet noise
-        ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft[id],theta_m)
-        INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
-        Plug    = external_plug_effect(Velocity_primary[id],Velocity_secondary[id], Velocity_mixed, Diameter_primary,Diameter_secondary,
-                                       Diameter_mixed, Plug_diameter, sound_ambient[id], theta_p,theta_s,theta_m)
-
-        GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient[id],theta_m,engine_height,Diameter_mixed,frequency)
-
-        # Calculation of the sound pressure level for each jet component
-        SPL_p = primary_noise_component(SPL_p,Velocity_primary[id],Temperature_primary[id],R_gas,theta_p,DVPS,sound_ambient[id],
-                                        Velocity_secondary[id],Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug.PG_p
-
-        SPL_s = secondary_noise_component(SPL_s,Velocity_primary[id],theta_s,sound_ambient[id],Velocity_secondary[id],
-                                          Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
-
-        SPL_m = mixed_noise_component(SPL_m,Velocity_primary[id],theta_m,sound_ambient[id],Velocity_secondary[id],
-                                      Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + \
-            Plug.PG_m + ATK_m + GPROX_m
-
-        # Sum of the Total Noise
-        SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
-
-        # Store the SPL history     
-        SPL_total_history[id][:]     = SPL_total[:]
-        SPL_primary_history[id][:]   = SPL_p[:]
-        SPL_secondary_history[id][:] = SPL_s[:]
-        SPL_mixed_history[id][:]     = SPL_m[:]
-
-        # Calculation of dBA based on the sound pressure time history
-        SPLt_dBA                = dbA_noise(SPL_total)
-        SPLt_dBA_history[id][:] = dbA_noise(SPL_total)
-        SPLt_dBA_max[id]        = max(SPLt_dBA)
-
-    # Calculation of the Perceived Noise Level EPNL based on the sound time history
-    PNL_total               =  pnl_noise(SPL_total_history)    
-    PNL_primary             =  pnl_noise(SPL_primary_history)  
-    PNL_secondary           =  pnl_noise(SPL_secondary_history)  
-    PNL_mixed               =  pnl_noise(SPL_mixed_history)  
-
-    # Calculation of the tones corrections on the SPL for each component and total
-    tone_correction_total     = noise_tone_correction(SPL_total_history) 
-    tone_correction_primary   = noise_tone_correction(SPL_primary_history) 
-    tone_correction_secondary = noise_tone_correction(SPL_secondary_history) 
-    tone_correction_mixed     = noise_tone_correction(SPL_mixed_history) 
-
-    # Calculation of the PLNT for each component and total
-    PNLT_total     = PNL_total+tone_correction_total
-    PNLT_primary   = PNL_primary+tone_correction_primary
-    PNLT_secondary = PNL_secondary+tone_correction_secondary
-    PNLT_mixed     = PNL_mixed+tone_correction_mixed
-
-    # Calculation of the EPNL for each component and total
-    EPNL_total     = epnl_noise(PNLT_total)
-    EPNL_primary   = epnl_noise(PNLT_primary)
-    EPNL_secondary = epnl_noise(PNLT_secondary)
-    EPNL_mixed     = epnl_noise(PNLT_mixed)
-
-    #Calculation of the SENEL total
-    SENEL_total = senel_noise(SPLt_dBA_max)
+    for id in range(0,nsteps):
+        noise_source_location(B,Xo,zk[id],Diameter_primary,theta_p,Area_primary,Area_secondary,distance[id],
+                              Diameter_secondary,theta[id],theta_s,theta_m,Diameter_mixed[id],Velocity_p[id],
+                              Velocity_s[id],Velocity_mixed[id],Velocity_aircraft,sound_amb[id],Str_m[id],Str_s[id])
+
+        theta_p_history[id] = theta_p
+        theta_s_history[id] = theta_s
+        theta_m_history[id] = theta_m
+
+    theta_p = theta_p_history
+    theta_s = theta_s_history
+    theta_m = theta_m_history
+
+    #Calculation of the Directivity Factor
+    exc = np.where(theta_m <= 1.4,sound_amb/Velocity_mixed,(sound_amb/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)))
+
+    #Acoustic excitation adjustment (EX)
+    EX_m = exd*exs*exc   #mixed component - dependant of the frequency
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_amb/(Velocity_s*(zk)) #secondary component - no frequency dependance    
+
+    distance_primary   = distance 
+    distance_secondary = distance 
+    distance_mixed     = distance
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_a/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_amb))
+    dspl_density_s = 20*np.log10((density_secondary+density_amb)/(2*density_amb))
+    dspl_density_m = 20*np.log10((density_mixed+density_amb)/(2*density_amb))
+
+    #Noise attenuation due to Spherical divergence
+    dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+    dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+    dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
+
+    # Noise attenuation due to Geometric Near-Field
+    if near_field ==0:
+        dspl_geometric_p = 0.0
+        dspl_geometric_s = 0.0
+        dspl_geometric_m = 0.0
+    elif near_field ==1:
+        dspl_geometric_p = -10*np.log10(1+(2*Diameter_primary+(Diameter_primary*sound_amb/frequency))/distance_primary)
+        dspl_geometric_s = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_amb/frequency))/distance_secondary)
+        dspl_geometric_m = -10*np.log10(1+(2*Diameter_mixed+(Diameter_mixed*sound_amb/frequency))/distance_mixed)
+
+    # Noise attenuation due to Acoustic Near-Field
+    if near_field ==0:
+        dspl_acoustic_p = 0.0;
+        dspl_acoustic_s = 0.0;
+        dspl_acoustic_m = 0.0;
+    elif near_field ==1:
+        dspl_acoustic_p = 10*np.log10(1+0.13*(sound_amb/(distance_primary*frequency))**2)
+        dspl_acoustic_s = 10*np.log10(1+0.13*(sound_amb/(distance_secondary*frequency))**2)
+        dspl_acoustic_m = 10*np.log10(1+0.13*(sound_amb/(distance_mixed*frequency))**2)
+
+    # Atmospheric attenuation coefficient
+    if tunnel==0:
+        #Atmospheric attenuation
+        delta_atmo = atmospheric_attenuation(distance_primary)
+
+        dspl_attenuation_p = -delta_atmo 
+        dspl_attenuation_s = -delta_atmo 
+        dspl_attenuation_m = -delta_atmo 
+
+    elif tunnel==1: #These corrections are not applicable for jet rigs or static conditions
+        dspl_attenuation_p = np.zeros(num_f)
+        dspl_attenuation_s = np.zeros(num_f)
+        dspl_attenuation_m = np.zeros(num_f)
+        EX_m = np.zeros(num_f)
+        EX_p = 0
+        EX_s = 0
+
+    # Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+    DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
+    DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
+    DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
+
+
+    # Calculation of interference effects on jet noise
+    ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft,theta_m)
+    INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+    Plug    = external_plug_effect(Velocity_p,Velocity_s, Velocity_mixed, Diameter_primary,Diameter_secondary,
+                                   Diameter_mixed, Plug_diameter, sound_amb, theta_p,theta_s,theta_m)
+
+    GPROX_m = ground_proximity_effect(Velocity_mixed,sound_amb,theta_m,engine_height,Diameter_mixed,frequency)
+
+    # Calculation of the sound pressure level for each jet component
+    # The last frequency band of the primary jet is not modeled, it accumulates the plug effect over the time steps
+    SPL_p = np.cumsum(Plug.PG_p,axis=0) - Plug.PG_p
+    SPL_p = primary_noise_component(SPL_p,Velocity_p,Temperature_p,R_gas,theta_p,DVPS,sound_amb,
+                                    Velocity_s,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug.PG_p
+
+    SPL_s = secondary_noise_component(np.zeros(num_f),Velocity_p,theta_s,sound_amb,Velocity_s,
+                                      Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
+
+    SPL_m = mixed_noise_component(np.zeros(num_f),Velocity_p,theta_m,sound_amb,Velocity_s,
+                                  Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + \
+        Plug.PG_m + ATK_m + GPROX_m
+
+    # Sum of the Total Noise
+    SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+
+    # Store the SPL history, without the microphone axis for one microphone per time step
+    if np.ndim(distance_microphone) == 1:
+        SPL_p, SPL_s, SPL_m, SPL_total = SPL_p[:,0], SPL_s[:,0], SPL_m[:,0], SPL_total[:,0]
+    SPL_total_history     = SPL_total
+    SPL_primary_history   = SPL_p
+    SPL_secondary_history = SPL_s
+    SPL_mixed_history     = SPL_m
+    Mach_aircraft         = Mach_aircraft[:,0,0]
+
+    # Calculation of the noise metrics of the total noise and of each component, with the time steps
+    # next to the frequency bands
+    SPL_histories = np.array([SPL_total_history,SPL_primary_history,SPL_secondary_history,SPL_mixed_history])
+    metrics       = compute_noise_metrics(np.moveaxis(SPL_histories,1,-2))
+
+    PNLT_total, PNLT_primary, PNLT_secondary, PNLT_mixed = np.moveaxis(metrics.PNLT,-1,1)
+    EPNL_total, EPNL_primary, EPNL_secondary, EPNL_mixed = metrics.EPNL
+    SPLt_dBA_max = np.moveaxis(metrics.SPL_dBA_max[0],-1,0)
+    SENEL_total  = metrics.SENEL[0]
 
     # Open output file to print the results
     SAE_Engine_Noise_Outputs = Data(
@@ -449,7 +406,7 @@ def noise_SAE(turbofan,segment,analyses,config,settings,ioprint = 0, filename =
     engine_noise.EPNL_total        = EPNL_total 
     engine_noise.SENEL_total       = SENEL_total
     engine_noise.SPL_spectrum      = SPL_total_history
-    engine_noise.SPL               = SPL_arithmetic(SPL_total_history,sum_axis=1)
+    engine_noise.SPL               = SPL_arithmetic(SPL_total_history,sum_axis=-1)
     engine_noise.SPL_dBA           = SPLt_dBA_max
 
     return engine_noise
\ No newline at end of file
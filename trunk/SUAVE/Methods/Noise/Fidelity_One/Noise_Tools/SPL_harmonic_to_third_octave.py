@@ -4,13 +4,13 @@
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
 # Modified: Apr 2021, M. Clarke
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import SPL_arithmetic
 # ----------------------------------------------------------------------
 #  dbA Noise
 # ----------------------------------------------------------------------
@@ -18,10 +18,12 @@ from SUAVE.Methods.Noise.Fidelity_One.Noise_Tools import SPL_arithmetic
 ## @ingroup Methods-Noise-Fidelity_One-Noise_Tools 
 def SPL_harmonic_to_third_octave(SPL,f,settings): 
     """This method converts the SPL spectrum from blade harmonic passing frequency
-    to thrid octave spectrum
+    to thrid octave spectrum. The harmonics are binned into the bands with a membership
+    matrix, built once for the frequencies, and the energy of all control points, 
+    microphones and propellers is summed in a single product.
     
     Assumptions:
-        N/A
+        A harmonic on the edge of two bands is counted in both bands
 
     Source: 
 
@@ -42,26 +44,57 @@ def SPL_harmonic_to_third_octave(SPL,f,settings):
         
     """  
     # unpack 
-    cf               = settings.center_frequencies
     lf               = settings.lower_frequencies
     uf               = settings.upper_frequencies
     
-    dim_cpt          = len(SPL[:,0,0,0])
-    dim_mic          = len(SPL[0,:,0,0])
-    dim_prop         = len(SPL[0,0,:,0])
-    num_cf           = len(cf)
-    num_f            = len(f[0,:])
-    SPL_third_octave = np.zeros((dim_cpt,dim_mic,dim_prop,num_cf)) 
+    membership       = third_octave_membership(f,lf,uf)
+    p_prefs          = 10**(SPL/10)
+    
+    # sum the energy of the harmonics in each band, the frequencies are the same at all 
+    # control points for a broadband spectrum 
+    if membership.ndim == 2:
+        p_prefs_band = np.matmul(p_prefs,membership)
+        in_band      = np.any(membership,axis=0)[None,None,None,:]
+    else:
+        p_prefs_band = np.einsum('impk,ikj->impj',p_prefs,membership)
+        in_band      = np.any(membership,axis=1)[:,None,None,:]
     
-    # loop through 1/3 octave spectra and sum up components 
-    for i in range(dim_cpt):  
-        for j in range(num_cf):
-            SPL_in_range = np.empty(shape=[dim_mic,dim_prop,0 ])
-            for k in range(num_f):  
-                if (lf[j] <= f[i,k]) and (f[i,k] <= uf[j]):   
-                    SPL_in_range = np.concatenate((SPL_in_range,np.atleast_3d(SPL[i,:,:,k])), axis = 2) 
-                if len(SPL_in_range[0,0,:]) > 0:  
-                    SPL_in_range[SPL_in_range != 0]  
-                    SPL_third_octave[i,:,:,j] = SPL_arithmetic(SPL_in_range)   
+    with np.errstate(divide='ignore'):
+        SPL_third_octave = np.where(in_band,10*np.log10(p_prefs_band),0.)
                     
     return SPL_third_octave
+
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools 
+def third_octave_membership(f,lf,uf):
+    """This finds which 1/3 octave band each harmonic frequency falls into
+    
+    Assumptions:
+        A harmonic on the edge of two bands is counted in both bands
+
+    Source: 
+        N/A
+
+    Inputs:
+        f                      - blade passing spectrum frequencies            [Hz]
+        lf                     - lower frequencies of the 1/3 octave spectrum  [Hz]
+        uf                     - upper frequencies of the 1/3 octave spectrum  [Hz]
+
+    Outputs:
+        membership             - 1 where a harmonic is in a band, 
+                                 [harmonics x bands] if the frequencies are the same at 
+                                 all control points, else [control points x harmonics x bands]  [-]
+
+    Properties Used:
+        N/A 
+        
+    """  
+    f  = np.atleast_2d(f)
+    lf = np.asarray(lf)
+    uf = np.asarray(uf)
+    
+    if np.all(f == f[0]):
+        f = f[0]
+    
+    membership = (lf <= f[...,None]) & (f[...,None] <= uf)
+    
+    return membership.astype(float)
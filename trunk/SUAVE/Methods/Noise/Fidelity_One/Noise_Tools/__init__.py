@@ -10,6 +10,7 @@ from .dbA_noise                             import dbA_noise, A_weighting
 from .noise_geometric                       import noise_geometric
 from .noise_certification_limits            import noise_certification_limits 
 from .senel_noise                           import senel_noise
+from .noise_metrics                         import compute_noise_metrics
 from .decibel_arithmetic                    import pressure_ratio_to_SPL_arithmetic
 from .decibel_arithmetic                    import SPL_arithmetic 
 from .decibel_arithmetic                    import SPL_spectra_arithmetic
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -20,55 +21,79 @@ def epnl_noise(PNLT):
     time history Perceived Noise Level with Tone Correction (PNLT).
      
     Assumptions:
-        N/A
+        The time steps are along the last axis, any other axes, e.g. microphones and
+        noise components, are evaluated at once.
 
     Source:
         N/A
 
     Inputs:
-        PNLT - Perceived Noise Level with Tone Correction  [PNLdB]
+        PNLT - Perceived Noise Level with Tone Correction  [PNLdB]  (..., time)
      
      Outputs:
-        EPNL - Effective Perceived Noise Level in          [EPNdB]
+        EPNL - Effective Perceived Noise Level in          [EPNdB]  (...)
      
     Properties Used:
         N/A  
     """           
     # Maximum PNLT on the time history data    
-    PNLT_max = np.max(PNLT)
-    
-    # Calculates the number of discrete points on the trajectory
-    nsteps   = len(PNLT)    
-    
-    # Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
-    if all(PNLT==0):
-        EPNL = 0
-        return(EPNL)
+    PNLT     = np.asarray(PNLT)
+    PNLT_max = np.max(PNLT,axis=-1)
 
     # Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-    i = 0
-    while PNLT[i]<=(PNLT_max-10) and i<=nsteps:
-        i = i+1
-    t1 = i #t1 is the first time interval
-    i  = i+1
-
-    # Correction for PNLTM-10 when it falls outside the limit of the data
-    if PNLT[nsteps-1]>=(PNLT_max-10):
-        t2=nsteps-2
-    else:
-        while i<=nsteps and PNLT[i]>=(PNLT_max-10):
-            i = i+1
-        t2 = i-1 #t2 is the last time interval 
-    
+    window = noise_duration_window(PNLT)
+
     # Calculates the integral of the PNLT which between t1 and t2 points
-    sumation = 0
-    for i in range (t1-1,t2+1):
-        sumation = 10**(PNLT[i]/10)+sumation
-        
+    sumation = np.sum(np.where(window,10**(PNLT/10),0.),axis=-1)
+
     # Duration Correction calculation
-    duration_correction = 10*np.log10(sumation)-PNLT_max-13
-                
+    with np.errstate(divide='ignore'):
+        duration_correction = 10*np.log10(sumation)-PNLT_max-13
+
     # Final EPNL calculation
     EPNL = PNLT_max+duration_correction
-    
-    return EPNL   
\ No newline at end of file
+
+    # Exclude sources that are not being calculated or doesn't contribute for the total noise of the aircraft
+    EPNL = np.where(np.all(PNLT==0,axis=-1),0.,EPNL)
+
+    return EPNL[()]
+
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+def noise_duration_window(level):
+    """This method finds the time steps of a noise time history that are summed for
+    the duration correction of the EPNL and SENEL. The window starts one time step
+    before the first level that is higher than the maximum level - 10 dB and ends at
+    the last level of that run that is at least the maximum level - 10 dB, or at the
+    second to last time step when the last level is at least the maximum level - 10 dB.
+     
+    Assumptions:
+        The time steps are along the last axis. A window that starts before the first
+        time step includes the last time step.
+
+    Source:
+        N/A
+
+    Inputs:
+        level  - noise level time history, e.g. PNLT or dBA  [dB]  (..., time)
+     
+     Outputs:
+        window - time steps in the duration window           [-]   (..., time)
+     
+    Properties Used:
+        N/A  
+    """
+    level     = np.asarray(level)
+    nsteps    = level.shape[-1]
+    index     = np.arange(nsteps)
+    threshold = np.max(level,axis=-1,keepdims=True)-10
+
+    # first time interval
+    t1 = np.argmax(level>threshold,axis=-1)[...,None]
+
+    # last time interval, correction for the maximum level - 10 dB when it falls outside the limit of the data
+    t2 = np.argmax((level<threshold) & (index>t1),axis=-1)[...,None]-1
+    t2 = np.where(level[...,-1:]>=threshold,nsteps-2,t2)
+
+    window = ((index>=t1-1) & (index<=t2)) | ((t1==0) & (index==nsteps-1))
+
+    return window
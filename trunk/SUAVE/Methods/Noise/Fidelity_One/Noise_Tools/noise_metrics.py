@@ -0,0 +1,60 @@
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+# noise_metrics.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+from SUAVE.Core import Data
+
+from .pnl_noise             import pnl_noise
+from .noise_tone_correction import noise_tone_correction
+from .epnl_noise            import epnl_noise
+from .senel_noise           import senel_noise
+from .dbA_noise             import dbA_noise
+
+# ----------------------------------------------------------------------
+#   Noise Metrics
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
+def compute_noise_metrics(SPL):
+    """This method calculates the certification noise metrics of 1/3 octave band
+    noise spectra time histories, e.g. of all noise components and microphones at once.
+
+    Assumptions:
+        The frequency bands are along the last axis and the time steps along the second
+        to last axis. Any other axes, e.g. microphones and noise components, are
+        evaluated at once.
+
+    Source:
+        N/A
+
+    Inputs:
+        SPL                - Sound Pressure Level in 1/3 octave band      [dB]     (..., time, 24)
+
+    Outputs:
+        metrics.
+          PNL              - Perceived Noise Level                        [PNLdB]  (..., time)
+          tone_correction  - Maximum tone correction                      [dB]     (..., time)
+          PNLT             - Perceived Noise Level with Tone Correction   [PNLdB]  (..., time)
+          EPNL             - Effective Perceived Noise Level              [EPNdB]  (...)
+          SPL_dBA_max      - Maximum A-weighted Sound Pressure Level      [dBA]    (..., time)
+          SENEL            - Single Event Noise Exposure Level            [dB]     (...)
+
+    Properties Used:
+        N/A
+    """
+
+    metrics                 = Data()
+    metrics.PNL             = pnl_noise(SPL)
+    metrics.tone_correction = noise_tone_correction(SPL)
+    metrics.PNLT            = metrics.PNL + metrics.tone_correction
+    metrics.EPNL            = epnl_noise(metrics.PNLT)
+    metrics.SPL_dBA_max     = np.max(dbA_noise(SPL),axis=-1)
+    metrics.SENEL           = senel_noise(metrics.SPL_dBA_max)
+
+    return metrics
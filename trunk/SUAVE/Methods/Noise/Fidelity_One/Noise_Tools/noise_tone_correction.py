@@ -3,6 +3,7 @@
 #
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -20,16 +21,17 @@ def noise_tone_correction(SPL):
         a correction tone factor
         
     Assumptions:
-        None
+        The frequency bands are along the last axis, any other axes, e.g. time steps,
+        microphones and noise components, are evaluated at once.
     
     Source:
         None 
 
     Inputs:
-        SPL                     - Sound Pressure Level in 1/3 octave band
+        SPL                     - Sound Pressure Level in 1/3 octave band             [dB] (..., 24)
 
     Outputs: 
-        tone_correction_max     - Maximum tone correction for a time history signal 
+        tone_correction_max     - Maximum tone correction for a time history signal   [dB] (...)
         
     Properties Used:
         N/A     
@@ -37,136 +39,83 @@ def noise_tone_correction(SPL):
         
         
     # Defining the necessary arrays for the tone correction procedure
-    nsteps              = len(SPL)
-    slope               = np.zeros(23)
-    aux_ds              = np.zeros(23)
-    delta_slope         = np.zeros(23)
-    tone_correction_max = np.zeros(nsteps)
-    
-    for j in range(0,nsteps):
-    
-        #------------------------------------------------------------
-        #STEP 1 - Calculation of slopes in the one-third octave bands
-        #------------------------------------------------------------
-        for i in range(3,23):
-            slope[i] = SPL[j][i]-SPL[j][i-1]
-        
-        #------------------------------------------------------------
-        #STEP 2 - Encircle the necessary values of the slope
-        #------------------------------------------------------------    
-        for i in range(3,23):        
-            aux_ds[i] = np.abs(slope[i]-slope[i-1])
-            
-            if aux_ds[i]>5:
-                delta_slope[i]=1
-            else:
-                delta_slope[i]=0
-        #------------------------------------------------------------
-        #STEP 3 - Encircle the slope
-        #------------------------------------------------------------
-        step3  = np.zeros(23)
-        step3a = np.zeros(23)
-        step3b = np.zeros(23)
-        for i in range(3,23):
-            if delta_slope[i]==1 and slope[i]>0 and slope[i]>slope[i-1]:
-                step3a[i]   = 1
-            if  delta_slope[i]==1 and slope[i]<=0 and slope[i-1]>0:
-                step3b[i-1] = 1
-        step3 = step3a + step3b
-        
-        #------------------------------------------------------------
-        #STEP 4 - Compute new adjusted sound pressure level
-        #------------------------------------------------------------        
-        step4 = np.zeros(23)
-        for i in range(1,23):
-            if step3[i]!=0 and i<23:
-                step4[i] = (SPL[j][i-1]+SPL[j][i+1])/2
-            if step3[i]!=0 and i==22:
-                step4[i] = SPL[j][i-1]+slope[i-1]
-            if step3[i]==0:
-                step4[i] = SPL[j][i]
-                
-        #------------------------------------------------------------
-        #STEP 5 - Recompute new slope
-        #------------------------------------------------------------    
-        step5 = np.zeros(25)
-        for i in range(3,23):
-            step5[i]=step4[i]-step4[i-1]
-        step5[2]  = step5[3]
-        step5[24] = step5[23]
-        
-        #------------------------------------------------------------
-        #STEP 6 - Compute the arithmetic average of the three adjacent slopes
-        #------------------------------------------------------------
-        step6 = np.zeros(23)
-        for i in range(2,22):
-            if i==22:
-                step6[i] = (step5[i]+step5[i+1])/3.
-            else:
-                step6[i] = (step5[i]+step5[i+1]+step5[i+2])/3.
-        
-        #------------------------------------------------------------
-        #STEP 7 - Compute the final 1/3 octave band
-        #------------------------------------------------------------
-        step7 = np.zeros(24)
-        step7[2]=SPL[j][2]
-        for i in range(3,23):
-            step7[i] = step7[i-1]+step6[i-1]
-        
-        #------------------------------------------------------------
-        #STEP 8 - Compute the differences between original SPL and final SPL
-        #------------------------------------------------------------    
-        step8 = np.zeros(24)
-        step8_aux = np.zeros(24)
-        for i in range(2,16):
-            step8_aux[i] = SPL[j][i]-step7[i]
-            if step8_aux[i]>=1.5:
-                step8[i] = step8_aux[i]
-            else:
-                step8[i]=0.
-        for i in range(17,22):
-            step8_aux[i] = SPL[j][i]-step7[i]
-            if step8_aux[i]>=1.5 and SPL[j][i]>0 and SPL[j][i+1]>0 and SPL[j][i-1]>0:
-                step8[i] = step8_aux[i]
-            else:
-                step8[i] = 0.
-        
-        step8_aux[23] = SPL[j][23]-step7[23]
-        if step8_aux[23]>=1.5 and SPL[j][23]>0 and SPL[j][22]>0:
-            step8[23] = step8_aux[23]
-        else:
-            step8[23]=0.
-            
-        #------------------------------------------------------------
-        #STEP 9 - Determine tone correction factors for each 1/3 octave band
-        #------------------------------------------------------------
-        tone_correction = np.zeros(23)
-        for i in range(2,9):
-            if step8[i]>=1.5 and step8[i]<3:
-                tone_correction[i] = (step8[i]/3)-0.5
-            if step8[i]>=3 and step8[i]<20:
-                tone_correction[i] = step8[i]/6.
-            if step8[i]>20:
-                tone_correction[i] = 3+(1/3)
-        for i in range(10,20):
-            if step8[i]>=1.5 and step8[i]<3:
-                tone_correction[i] = (2/3)*(step8[i])-1
-            if step8[i]>=3 and step8[i]<20:
-                tone_correction[i] = step8[i]/3.
-            if step8[i]>20:
-                tone_correction[i] = 6+(2/3)
-        for i in range(21,23):
-            if step8[i]>=1.5 and step8[i]<3:
-                tone_correction[i] = (step8[i]/3)-(1/2)
-            if step8[i]>=3 and step8[i]<20:
-                tone_correction[i] = step8[i]/6.
-            if step8[i]>20:
-                tone_correction[i] = 3+(1/3)
-                
-        #------------------------------------------------------------
-        #STEP 10 - Largest tone correction factor
-        #------------------------------------------------------------
-        tone_correction_max[j] = np.max(tone_correction)
-    
-        return tone_correction_max
-    
\ No newline at end of file
+    SPL   = np.asarray(SPL)
+    shape = np.shape(SPL)[:-1]
+
+    #------------------------------------------------------------
+    #STEP 1 - Calculation of slopes in the one-third octave bands
+    #------------------------------------------------------------
+    slope          = np.zeros(shape + (23,))
+    slope[...,3:]  = SPL[...,3:23]-SPL[...,2:22]
+
+    #------------------------------------------------------------
+    #STEP 2 - Encircle the necessary values of the slope
+    #------------------------------------------------------------    
+    delta_slope         = np.zeros(shape + (23,),dtype=bool)
+    delta_slope[...,3:] = np.abs(slope[...,3:]-slope[...,2:22])>5
+
+    #------------------------------------------------------------
+    #STEP 3 - Encircle the slope
+    #------------------------------------------------------------
+    step3a           = np.zeros(shape + (23,))
+    step3b           = np.zeros(shape + (23,))
+    step3a[...,3:]   = delta_slope[...,3:] & (slope[...,3:]>0) & (slope[...,3:]>slope[...,2:22])
+    step3b[...,2:22] = delta_slope[...,3:] & (slope[...,3:]<=0) & (slope[...,2:22]>0)
+    step3            = step3a + step3b
+
+    #------------------------------------------------------------
+    #STEP 4 - Compute new adjusted sound pressure level
+    #------------------------------------------------------------        
+    step4         = np.zeros(shape + (23,))
+    step4[...,1:] = np.where(step3[...,1:]!=0,(SPL[...,0:22]+SPL[...,2:24])/2,SPL[...,1:23])
+    step4[...,22] = np.where(step3[...,22]!=0,SPL[...,21]+slope[...,21],step4[...,22])
+
+    #------------------------------------------------------------
+    #STEP 5 - Recompute new slope
+    #------------------------------------------------------------    
+    step5           = np.zeros(shape + (25,))
+    step5[...,3:23] = step4[...,3:23]-step4[...,2:22]
+    step5[...,2]    = step5[...,3]
+    step5[...,24]   = step5[...,23]
+
+    #------------------------------------------------------------
+    #STEP 6 - Compute the arithmetic average of the three adjacent slopes
+    #------------------------------------------------------------
+    step6           = np.zeros(shape + (23,))
+    step6[...,2:22] = (step5[...,2:22]+step5[...,3:23]+step5[...,4:24])/3.
+
+    #------------------------------------------------------------
+    #STEP 7 - Compute the final 1/3 octave band
+    #------------------------------------------------------------
+    step7           = np.zeros(shape + (24,))
+    step7[...,2:23] = np.cumsum(np.concatenate((SPL[...,2:3],step6[...,2:22]),axis=-1),axis=-1)
+
+    #------------------------------------------------------------
+    #STEP 8 - Compute the differences between original SPL and final SPL
+    #------------------------------------------------------------    
+    step8_aux        = SPL[...,:23]-step7[...,:23]
+    step8            = np.zeros(shape + (23,))
+    step8[...,2:16]  = np.where(step8_aux[...,2:16]>=1.5,step8_aux[...,2:16],0.)
+    positive         = (SPL[...,17:22]>0) & (SPL[...,18:23]>0) & (SPL[...,16:21]>0)
+    step8[...,17:22] = np.where((step8_aux[...,17:22]>=1.5) & positive,step8_aux[...,17:22],0.)
+
+    #------------------------------------------------------------
+    #STEP 9 - Determine tone correction factors for each 1/3 octave band
+    #------------------------------------------------------------
+    low  = (step8>=1.5) & (step8<3)
+    mid  = (step8>=3) & (step8<20)
+    high = step8>20
+    tone_correction_low_band  = np.where(low,(step8/3)-0.5,0.) + np.where(mid,step8/6.,0.) + np.where(high,3+(1/3),0.)
+    tone_correction_mid_band  = np.where(low,(2/3)*(step8)-1,0.) + np.where(mid,step8/3.,0.) + np.where(high,6+(2/3),0.)
+
+    tone_correction           = np.zeros(shape + (23,))
+    tone_correction[...,2:9]  = tone_correction_low_band[...,2:9]
+    tone_correction[...,10:20] = tone_correction_mid_band[...,10:20]
+    tone_correction[...,21:23] = tone_correction_low_band[...,21:23]
+
+    #------------------------------------------------------------
+    #STEP 10 - Largest tone correction factor
+    #------------------------------------------------------------
+    tone_correction_max = np.max(tone_correction,axis=-1)
+
+    return tone_correction_max
@@ -3,6 +3,7 @@
 # 
 # Created:  Jul 2015, C. Ilario
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,16 +19,17 @@ def pnl_noise (SPL):
     """This method calculates de Perceived Noise Level PNL from a 1/3 octave band noise spectra
  
     Assumptions:
-        None
+        The frequency bands are along the last axis, any other axes, e.g. time steps,
+        microphones and noise components, are evaluated at once.
 
     Source:
         None
  
     Inputs:
-        SPL - Sound Pressure Level in 1/3 octave band  [dB]
+        SPL - Sound Pressure Level in 1/3 octave band  [dB]      (..., 24)
    
     Outputs:
-        PNL - Perceived Noise Level                    [dB]
+        PNL - Perceived Noise Level                    [dB]      (...)
    
     Properties Used:
         N/A    
@@ -61,40 +63,36 @@ def pnl_noise (SPL):
             [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]]
 
     
+    noy = np.array(noy)
+
     # Defining the necessary arrays for the calculation
-    nsteps  = len(SPL)
-    SPL_noy = np.zeros((nsteps,24))
-    PNL     = np.zeros(nsteps)
-    
+    SPL     = np.asarray(SPL)
+    SPL_noy = np.zeros(np.shape(SPL))
+
     #-------------------------------------------
     # STEP 1 - Convert SPL to Perceived Noisiness
     #-------------------------------------------  
-    for j in range(0,nsteps):
-    
-        for i in range(0,23):
-            if SPL[j][i]>=noy[1][2]:
-                SPL_noy[j][i] = 10**(noy[i][8]*(SPL[j][i]-noy[i][4]))
-                
-            if SPL[j][i]>=noy[i][3] and SPL[j][i]<noy[i][2]:
-                SPL_noy[j][i] = 10**(noy[i][7]*(SPL[j][i]-noy[i][3]))
-                
-            if SPL[j][i]>=noy[i][6] and SPL[j][i]<noy[i][3]:
-                SPL_noy[j][i] = 0.3*(10**(noy[i][10]*(SPL[j][i]-noy[i][6])))
-                
-            if SPL[j][i]>=noy[i][5] and SPL[j][i]<noy[i][6]:
-                SPL_noy[j][i] = 0.1*(10**(noy[i][9]*(SPL[j][i]-noy[i][5])))
-            
-        #-------------------------------------------  
-        # STEP 2 - Combine perceived noiseness values  
-        #-------------------------------------------
-        max_noy = np.max(SPL_noy[j][:])            
-        Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy[j][:])
-        
-        #-----------------------------------------------------------------
-        # STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
-        #------------------------------------------------------------------    
-        if Perceived_noisinees==0:
-            Perceived_noisinees = 0.0625
-        PNL[j] = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
-        
-    return PNL
\ No newline at end of file
+    band_SPL = SPL[...,:23]
+    band_noy = np.zeros(np.shape(band_SPL))
+    noy      = noy[:23]
+
+    band_noy = np.where(band_SPL>=noy[1,2],10**(noy[:,8]*(band_SPL-noy[:,4])),band_noy)
+    band_noy = np.where((band_SPL>=noy[:,3]) & (band_SPL<noy[:,2]),10**(noy[:,7]*(band_SPL-noy[:,3])),band_noy)
+    band_noy = np.where((band_SPL>=noy[:,6]) & (band_SPL<noy[:,3]),0.3*(10**(noy[:,10]*(band_SPL-noy[:,6]))),band_noy)
+    band_noy = np.where((band_SPL>=noy[:,5]) & (band_SPL<noy[:,6]),0.1*(10**(noy[:,9]*(band_SPL-noy[:,5]))),band_noy)
+
+    SPL_noy[...,:23] = band_noy
+
+    #-------------------------------------------  
+    # STEP 2 - Combine perceived noiseness values  
+    #-------------------------------------------
+    max_noy = np.max(SPL_noy,axis=-1)
+    Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy,axis=-1)
+
+    #-----------------------------------------------------------------
+    # STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
+    #------------------------------------------------------------------    
+    Perceived_noisinees = np.where(Perceived_noisinees==0,0.0625,Perceived_noisinees)
+    PNL = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+
+    return PNL
@@ -2,6 +2,7 @@
 # senel_noise.py
 # 
 # Created:  Jul 2015, C. Ilario
+# Modified: Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------        
 #   Imports
@@ -9,56 +10,40 @@
 
 import numpy as np
 
+from .epnl_noise import noise_duration_window
+
 # ----------------------------------------------------------------------        
 #   SENEL Noise Metric
 # ---------------------------------------------------------------------- 
 
 ## @ingroup Methods-Noise-Fidelity_One-Noise_Tools
 def senel_noise(SPLt_dBA_max):
-    """This method calculates the effective perceived noise level (EPNL) based on a time history 
-    Perceived Noise Level with Tone Correction (PNLT).
+    """This method calculates the single event noise exposure level (SENEL) based on a time history 
+    of the maximum A-weighted Sound Pressure Level.
 
     Assumptions:
-        None
+        The time steps are along the last axis, any other axes, e.g. microphones and
+        noise components, are evaluated at once.
 
     Source:
         None  
     
     Inputs:
-        PNLT                     - Perceived Noise Level with Tone Correction [Unitless]
+        SPLt_dBA_max             - Maximum A-weighted Sound Pressure Level    [dBA] (..., time)
 
     Outputs: 
-        EPNL                     - Effective Perceived Noise Level            [EPNdB]
+        SENEL                    - Single Event Noise Exposure Level          [dB]  (...)
         
     Properties Used:
         N/A     
     """       
-    # Maximum PNLT on the time history data    
-    dBA_max = np.max(SPLt_dBA_max)
-    
-    # Calculates the number of discrete points on the trajectory
-    nsteps   = len(SPLt_dBA_max)    
+    # Finding the time duration for the noise history where dBA is higher than the maximum dBA - 10 dB
+    SPLt_dBA_max = np.asarray(SPLt_dBA_max)
+    window       = noise_duration_window(SPLt_dBA_max)
 
-    # Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-    i = 0
-    while SPLt_dBA_max[i]<=(dBA_max-10) and i<=nsteps:
-        i = i+1
-    t1 = i # t1 is the first time interval
-    i  = i+1
+    # Calculates the integral of the dBA which between t1 and t2 points
+    sumation = np.sum(np.where(window,10**(SPLt_dBA_max/10),0.),axis=-1)
 
-    # Correction for PNLTM-10 when it falls outside the limit of the data
-    if SPLt_dBA_max[nsteps-1]>=(dBA_max-10):
-        t2=nsteps-2
-    else:
-        while i<=nsteps and SPLt_dBA_max[i]>=(dBA_max-10):
-            i = i+1
-        t2 = i-1 #t2 is the last time interval 
-        
-    # Calculates the integral of the PNLT which between t1 and t2 points
-    sumation = 0
-    for i in range (t1-1,t2+1):
-        sumation = 10**(SPLt_dBA_max[i]/10)+sumation
-        
     SENEL = 10*np.log10(sumation)
-    
-    return SENEL    
\ No newline at end of file
+
+    return SENEL[()]
@@ -2,13 +2,14 @@
 # electric_payload_range.py
 #
 # Created: Jan 2021, J. Smart
-# Modified:
+# Modified: Oct 2026, SUAVE Team
 
 #------------------------------------------------------------------------------
 # Imports
 #------------------------------------------------------------------------------
 
 from SUAVE.Core import Units, Data
+from SUAVE.Methods.Performance.mission_sweep import mission_sweep
 
 import numpy as np
 import matplotlib.pyplot as plt
@@ -21,15 +22,19 @@ import matplotlib.pyplot as plt
 def electric_payload_range(vehicle,
                            mission,
                            cruise_segment_tag,
-                           display_plot=True):
+                           display_plot=True,
+                           processes=1):
 
     """electric_payload_range(vehicle,
                            mission,
                            cruise_segment_tag,
-                           display_plot=True):
+                           display_plot=True,
+                           processes=1):
 
         Calculates and optionally displays a payload range diagram for a
         Variable Cruise Distance - State of Charge SUAVE Mission and Vehicle.
+        The points of the diagram are evaluated with mission_sweep, in
+        parallel when processes > 1.
 
         Sources:
         N/A
@@ -54,6 +59,8 @@ def electric_payload_range(vehicle,
 
             cruise_segment_tag              mission.cruise_tag              [String]
 
+            processes                       Number of Worker Processes      [Unitless]
+
         Outputs:
 
             payload_range = Data()
@@ -90,17 +97,16 @@ def electric_payload_range(vehicle,
     TOW =   [MTOW,      OEW]    # Takeoff Weights
     PLD =   [MaxPLD,    0.]     # Payload Weights
 
-    # Initialize Range Array
-
-    R = np.zeros(2)
-
     # Calculate Vehicle Range for Max Payload and Ferry Conditions
 
+    cases = []
     for i in range(2):
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-        R[i]    = segment.conditions.frames.inertial.position_vector[-1,0]
+        case = Data()
+        case.takeoff_weight     = TOW[i]
+        case.cruise_segment_tag = cruise_segment_tag
+        cases.append(case)
+
+    R = mission_sweep(mission, cases, electric_payload_range_point, processes).range
 
     # Insert Starting Point for Diagram Construction
 
@@ -124,3 +130,44 @@ def electric_payload_range(vehicle,
         plt.grid(True) 
 
     return payload_range
+
+#------------------------------------------------------------------------------
+# Electric Payload Range Point
+#------------------------------------------------------------------------------
+
+## @ingroup Methods-Performance
+def electric_payload_range_point(mission, case):
+
+    """electric_payload_range_point(mission, case):
+
+        Evaluates the range of one point of the payload range diagram.
+
+        Sources:
+        N/A
+
+        Assumptions:
+
+        Assumes use of Battery Propeller Energy Network
+
+        Inputs:
+
+            mission                         SUAVE Mission Structure
+
+            case                            Data()
+                .takeoff_weight             Vehicle Takeoff Mass            [kg]
+                .cruise_segment_tag         mission.cruise_tag              [String]
+
+        Outputs:
+
+            point = Data()
+                .range                      Range at the End of the Cruise  [m]
+    """
+
+    mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = case.takeoff_weight
+    results = mission.evaluate()
+    segment = results.segments[case.cruise_segment_tag]
+
+    point = Data()
+    point.range = segment.conditions.frames.inertial.position_vector[-1,0]
+
+    return point
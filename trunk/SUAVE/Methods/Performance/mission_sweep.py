@@ -0,0 +1,295 @@
+## @ingroup Methods-Performance
+# mission_sweep.py
+#
+# Created:  Oct 2026, SUAVE Team
+# Modified:
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+
+import numpy as np
+import multiprocessing
+import queue
+import copy
+
+# ----------------------------------------------------------------------
+#  Mission Sweep
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Performance
+def mission_sweep(mission,cases,evaluate_case,processes=1,warm_start=True):
+    """Evaluates a mission over a set of independent cases, such as the points of a payload range
+    diagram or a sweep in cruise altitude or Mach number. Each case is started from the unknowns of the
+    nearest case already solved. With more than one process the mission is copied once into each worker
+    and the cases are handed out to the workers as they become free.
+
+    Assumptions:
+    The cases are independent of each other. The distance between cases is measured on their numeric
+    inputs, each scaled by its spread over all cases.
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                      SUAVE Mission
+    cases                        [list of Data], the inputs of each case
+    evaluate_case                function(mission,case) returning a Data of outputs, it must be importable
+                                 from a module when processes > 1
+    processes                    [int]
+    warm_start                   [bool]
+
+    Outputs:
+    sweep                        Data, one array per input and output with one entry per case
+
+    Properties Used:
+    N/A
+    """
+
+    cases   = list(cases)
+    points  = case_points(cases)
+    outputs = [None] * len(cases)
+    solved  = dict()
+
+    def nearest(i):
+        if not warm_start or not solved:
+            return None
+        done  = list(solved.keys())
+        index = done[np.argmin(np.sum((points[done] - points[i])**2,axis=1))]
+        return solved[index]
+
+    if processes <= 1:
+        for i, case in enumerate(cases):
+            load_unknowns(mission,nearest(i))
+            outputs[i] = evaluate_case(mission,case)
+            solved[i]  = save_unknowns(mission)
+
+        return tabulate(cases,outputs)
+
+    finished = queue.Queue()
+    pool     = multiprocessing.Pool(processes,initializer=start_worker,initargs=(mission,evaluate_case))
+
+    try:
+        pending = list(range(len(cases)))
+        running = 0
+        while pending or running:
+            while pending and running < processes:
+                i = pending.pop(0)
+                pool.apply_async(evaluate_worker,(i,cases[i],nearest(i)),
+                                 callback=finished.put,error_callback=finished.put)
+                running += 1
+
+            result   = finished.get()
+            running -= 1
+            if isinstance(result,BaseException):
+                raise result
+
+            i, outputs[i], solved[i] = result
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return tabulate(cases,outputs)
+
+# ----------------------------------------------------------------------
+#  Workers
+# ----------------------------------------------------------------------
+
+# the mission copy and case function of a worker process
+worker = Data()
+
+## @ingroup Methods-Performance
+def start_worker(mission,evaluate_case):
+    """Keeps the copy of the mission a worker process received.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                      SUAVE Mission
+    evaluate_case                function
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    worker.mission       = mission
+    worker.evaluate_case = evaluate_case
+
+    return
+
+## @ingroup Methods-Performance
+def evaluate_worker(index,case,unknowns):
+    """Evaluates one case on the mission copy of a worker process.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    index                        [int]
+    case                         Data
+    unknowns                     Data, warm start or None
+
+    Outputs:
+    index                        [int]
+    outputs                      Data
+    unknowns                     Data, solved unknowns of the case
+
+    Properties Used:
+    N/A
+    """
+
+    load_unknowns(worker.mission,unknowns)
+    outputs = worker.evaluate_case(worker.mission,case)
+
+    return index, outputs, save_unknowns(worker.mission)
+
+# ----------------------------------------------------------------------
+#  Helper Functions
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Performance
+def save_unknowns(mission):
+    """Copies the unknowns of a mission and of each of its segments.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission.state.unknowns       Data
+    mission.segments             Data
+
+    Outputs:
+    unknowns                     Data
+
+    Properties Used:
+    N/A
+    """
+
+    unknowns = Data()
+    unknowns.mission  = copy.deepcopy(mission.state.unknowns)
+    unknowns.segments = Data()
+    for tag, segment in mission.segments.items():
+        unknowns.segments[tag] = copy.deepcopy(segment.state.unknowns)
+
+    return unknowns
+
+## @ingroup Methods-Performance
+def load_unknowns(mission,unknowns):
+    """Sets the unknowns of a mission and of each of its segments to a copy of saved unknowns.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                      SUAVE Mission
+    unknowns                     Data, from save_unknowns, or None to leave the mission as is
+
+    Outputs:
+    N/A
+
+    Properties Used:
+    N/A
+    """
+
+    if unknowns is None:
+        return
+
+    for k, v in unknowns.mission.items():
+        mission.state.unknowns[k] = copy.deepcopy(v)
+    for tag, segment_unknowns in unknowns.segments.items():
+        for k, v in segment_unknowns.items():
+            mission.segments[tag].state.unknowns[k] = copy.deepcopy(v)
+
+    return
+
+## @ingroup Methods-Performance
+def case_points(cases):
+    """Places the cases in the space of their numeric inputs, each input scaled by its spread.
+
+    Assumptions:
+    Inputs that are not scalar numbers are not used
+
+    Source:
+    N/A
+
+    Inputs:
+    cases                        [list of Data]
+
+    Outputs:
+    points                       [array, n_cases x n_inputs]
+
+    Properties Used:
+    N/A
+    """
+
+    keys = []
+    for case in cases:
+        for k, v in case.items():
+            if np.isscalar(v) and not isinstance(v,(str,bool)) and k not in keys:
+                keys.append(k)
+
+    points = np.array([[case.get(k,np.nan) for k in keys] for case in cases],dtype=float).reshape(len(cases),len(keys))
+    if not len(cases):
+        return points
+
+    lower  = np.nanmin(points,axis=0)
+    spread = np.nanmax(points,axis=0) - lower
+    spread[~(spread > 0.)] = 1.
+    points = np.nan_to_num((points - lower) / spread)
+
+    return points
+
+## @ingroup Methods-Performance
+def tabulate(cases,outputs):
+    """Collects the inputs and outputs of all cases into one table.
+
+    Assumptions:
+    Numeric values are stacked into arrays, anything else is kept as a list
+
+    Source:
+    N/A
+
+    Inputs:
+    cases                        [list of Data]
+    outputs                      [list of Data]
+
+    Outputs:
+    sweep                        Data
+
+    Properties Used:
+    N/A
+    """
+
+    sweep = Data()
+    for rows in (cases,outputs):
+        for row in rows:
+            for k in row.keys():
+                if k not in sweep:
+                    sweep[k] = None
+
+    for k in sweep.keys():
+        values = [case[k] if k in case else output.get(k) for case, output in zip(cases,outputs)]
+        try:
+            sweep[k] = np.array(values,dtype=float)
+        except (TypeError,ValueError):
+            sweep[k] = values
+
+    return sweep
@@ -3,12 +3,14 @@
 #
 # Created:  Apr 2014, T. Orra
 # Modified: Jan 2016, E. Botero
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
-from SUAVE.Core import Units
+from SUAVE.Core import Units, Data
+from SUAVE.Methods.Performance.mission_sweep import mission_sweep
 import time
 import numpy as np
 
@@ -17,8 +19,9 @@ import numpy as np
 # ----------------------------------------------------------------------
 
 ## @ingroup Methods-Performance
-def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
-    """Calculates a vehicle's payload range diagram. Includes plotting.
+def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.,processes=1):
+    """Calculates a vehicle's payload range diagram. Includes plotting. The points of the diagram are
+    evaluated with mission_sweep, in parallel when processes > 1.
 
     Assumptions:
     Constant altitude cruise
@@ -37,6 +40,8 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     mission.segments[0].analyses.weights.
       vehicle.mass_properties.takeoff     [kg]
     cruise_segment_tag                    <string>
+    reserves                              [kg]
+    processes                             [int]
 
     Outputs:
     payload_range.
@@ -100,70 +105,24 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
     FUEL    = [ min(TOW[1] - OEW - MaxPLD,MaxFuel) , MaxFuel                , MaxFuel       ]
     PLD     = [ MaxPLD                             , MTOW - MaxFuel - OEW   , 0.            ]
 
-    # allocating Range array
-    R       = [0,0,0]
-
     # evaluate the mission
     if iprint:
         print('\n\n\n .......... PAYLOAD RANGE DIAGRAM CALCULATION ..........\n')
 
-    # loop for each point of Payload Range Diagram
+    # each point of Payload Range Diagram is a case of the sweep
+    cases = []
     for i in range(len(TOW)):
-##    for i in [2]:
-        if iprint:
-            print(('   EVALUATING POINT : ' + str(i+1)))
-
-        # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
-
-        maxIter = 10 # maximum iteration limit
-        tol = 1.     # fuel convergency tolerance
-        err = 9999.  # error to be minimized
-        iter = 0     # iteration count
-
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
-
-            # Current total fuel burned in mission
-            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
-
-            # Difference between burned fuel and target fuel
-            missingFuel = FUEL[i] - TotalFuel - reserves
-
-            # Current distance and fuel consuption in the cruise segment
-            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
-            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
-            # Current specific range (m/kg)
-            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
-
-            # Estimated distance that will result in total fuel burn = target fuel
-            DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
-
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[cruise_segment_tag]
-
-            # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves
-
-            if iprint:
-                print(('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
-                  + str('%8.0F' % FUEL[i]) + ' (kg) | Current Fuel: ' \
-                  + str('%8.0F' % (err+FUEL[i]))+' (kg) | Residual : '+str('%8.0F' % err)))
-
-        # Allocating resulting range in ouput array.
-        R[i] = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+        case = Data()
+        case.point              = i + 1
+        case.takeoff_weight     = TOW[i]
+        case.fuel               = FUEL[i]
+        case.reserves           = reserves
+        case.cruise_segment_tag = cruise_segment_tag
+        case.iprint             = iprint
+        cases.append(case)
+
+    sweep = mission_sweep(mission,cases,payload_range_point,processes)
+    R     = list(sweep.range)
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
@@ -225,3 +184,95 @@ def payload_range(vehicle,mission,cruise_segment_tag,reserves=0.):
         plt.show()
 
     return payload_range
+
+## @ingroup Methods-Performance
+def payload_range_point(mission,case):
+    """Finds the range of one point of the payload range diagram. The cruise distance is iterated until
+    the fuel burned matches the fuel of the point.
+
+    Assumptions:
+    Constant altitude cruise
+
+    Source:
+    N/A
+
+    Inputs:
+    mission                               SUAVE Mission
+    case.
+      point                               [int]
+      takeoff_weight                      [kg]
+      fuel                                [kg]
+      reserves                            [kg]
+      cruise_segment_tag                  <string>
+      iprint                              [int]
+
+    Outputs:
+    point.
+      range                               [nm]
+
+    Properties Used:
+    N/A
+    """
+
+    TOW                = case.takeoff_weight
+    FUEL               = case.fuel
+    reserves           = case.reserves
+    cruise_segment_tag = case.cruise_segment_tag
+
+    if case.iprint:
+        print(('   EVALUATING POINT : ' + str(case.point)))
+
+    # Define takeoff weight
+    mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW
+
+    # Evaluate mission with current TOW
+    results = mission.evaluate()
+    segment = results.segments[cruise_segment_tag]
+
+    # Distance convergency in order to have total fuel equal to target fuel
+    #
+    # User don't have the option of run a mission for a given fuel. So, we
+    # have to iterate distance in order to have total fuel equal to target fuel
+    #
+
+    maxIter = 10 # maximum iteration limit
+    tol = 1.     # fuel convergency tolerance
+    err = 9999.  # error to be minimized
+    iter = 0     # iteration count
+
+    while abs(err) > tol and iter < maxIter:
+        iter = iter + 1
+
+        # Current total fuel burned in mission
+        TotalFuel  = TOW - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+        # Difference between burned fuel and target fuel
+        missingFuel = FUEL - TotalFuel - reserves
+
+        # Current distance and fuel consuption in the cruise segment
+        CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
+        CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
+        # Current specific range (m/kg)
+        CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
+
+        # Estimated distance that will result in total fuel burn = target fuel
+        DeltaDist  =  CruiseSR *  missingFuel
+        mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
+
+        # running mission with new distance
+        results = mission.evaluate()
+        segment = results.segments[cruise_segment_tag]
+
+        # Difference between burned fuel and target fuel
+        err = ( TOW - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL + reserves
+
+        if case.iprint:
+            print(('     iter: ' +str('%2g' % iter) + ' | Target Fuel: '   \
+              + str('%8.0F' % FUEL) + ' (kg) | Current Fuel: ' \
+              + str('%8.0F' % (err+FUEL))+' (kg) | Residual : '+str('%8.0F' % err)))
+
+    # Resulting range
+    point = Data()
+    point.range = ( results.segments[-1].conditions.frames.inertial.position_vector[-1,0] ) * Units.m / Units.nautical_mile      #Distance [nm]
+
+    return point
@@ -0,0 +1,94 @@
+## @ingroup Methods-Power-Fuel_Cell-Discharge
+# find_current_density_larminie.py
+#
+# Created : Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+import scipy as sp
+from SUAVE.Core import Units
+from .find_power_larminie import find_power_larminie
+
+# ----------------------------------------------------------------------
+#  Find Current Density Larminie
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Power-Fuel_Cell-Discharge
+def find_current_density_larminie(fuel_cell, power_desired, lb, ub, tolerance=1E-10, max_iterations=50, number_of_points=64):
+    '''
+    function that determines the current density at which each fuel cell
+    gives the desired power. All powers are solved at once with a Newton
+    method that is safeguarded by bisection, starting from a lookup of the
+    polarization curve.
+
+    Assumptions:
+    The current density is on the rising branch of the power curve, below
+    the current density of maximum power. Powers above the maximum power
+    give the current density of maximum power, powers below the power at
+    the lower bound give the lower bound.
+
+    Inputs:
+    power_desired                  [W]
+    lb                             [A/m**2]
+    ub                             [A/m**2]
+    fuel_cell.
+        interface_area             [m**2]
+        r                          [Ohms*m**2]
+        A1                         [V]
+        m                          [V]
+        n                          [m**2/A]
+        Eoc                        [V]
+
+    Outputs:
+    current_density                [A/m**2]
+    '''
+
+    power_desired = np.asarray(power_desired,dtype=float)
+
+    # current density of maximum power, the end of the rising branch
+    i_max = sp.optimize.fminbound(find_power_larminie, lb, ub, args=(fuel_cell, -1.), xtol=tolerance*ub)
+
+    # lookup of the rising branch of the power curve for the initial current densities
+    i_table = np.linspace(lb,i_max,number_of_points)
+    P_table = find_power_larminie(i_table,fuel_cell)
+    P_lb    = P_table[0]
+    P_max   = P_table[-1]
+    i       = np.interp(power_desired,P_table,i_table)
+
+    # bracket of each current density
+    lower = np.full_like(i,lb)
+    upper = np.full_like(i,i_max)
+
+    # unit conversions of the polarization curve, see find_voltage_larminie
+    scale = Units.mA/(Units.cm**2.)
+    r     = fuel_cell.r/(Units.kohm*(Units.cm**2))
+
+    for _ in range(max_iterations):
+        P      = find_power_larminie(i,fuel_cell)
+        lower  = np.where(P < power_desired,i,lower)
+        upper  = np.where(P > power_desired,i,upper)
+
+        # derivative of the power with respect to current density
+        i1     = i/scale
+        v      = P/(i*fuel_cell.interface_area)
+        dv_di  = (-r - fuel_cell.A1/i1 - fuel_cell.m*fuel_cell.n*np.exp(fuel_cell.n*i1))/scale
+        dP_di  = (v + i*dv_di)*fuel_cell.interface_area
+
+        # Newton step, bisection where the step leaves the bracket
+        with np.errstate(divide='ignore',invalid='ignore'):
+            i_new = i - (P - power_desired)/dP_di
+        outside   = ~((i_new > lower) & (i_new < upper))
+        i_new     = np.where(outside,(lower + upper)/2,i_new)
+        converged = np.abs(i_new - i) <= tolerance*np.abs(i)
+        i         = i_new
+        if np.all(converged):
+            break
+
+    # powers outside the rising branch
+    i = np.where(power_desired >= P_max,i_max,i)
+    i = np.where(power_desired <= P_lb,lb,i)
+
+    return i
@@ -3,16 +3,16 @@
 #
 # Created : Apr 2015, M. Vegh 
 # Modified: Feb 2016, E. Botero
+#           Oct 2026, SUAVE Team
   
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-import scipy as sp
 from SUAVE.Core import Units
 from .find_voltage_larminie import find_voltage_larminie
-from .find_power_diff_larminie import find_power_diff_larminie
+from .find_current_density_larminie import find_current_density_larminie
 
 # ----------------------------------------------------------------------
 #  Larminie
@@ -24,7 +24,7 @@ def larminie(fuel_cell,conditions,numerics):
     function that determines the mass flow rate based on a required power input
     
     Assumptions:
-    None (calls other functions)
+    The current density is on the rising branch of the power curve (calls other functions)
     
     Inputs:
     fuel_cell.
@@ -46,15 +46,11 @@ def larminie(fuel_cell,conditions,numerics):
     ub              = 1200.0*Units.mA/(Units.cm**2.)
     current_density = np.zeros_like(power)
     
-    for i in range(len(power)):
-        current_density[i] = sp.optimize.fminbound(find_power_diff_larminie, lb, ub, args=(fuel_cell, power[i]))
+    # solve all control points at once
+    current_density[...] = find_current_density_larminie(fuel_cell, power, lb, ub)
     
     v          = find_voltage_larminie(fuel_cell,current_density)    
     efficiency = np.divide(v, fuel_cell.ideal_voltage)
     mdot       = np.divide(power,np.multiply(fuel_cell.propellant.specific_energy,efficiency))
-
-    print('efficiency=', efficiency)
-    print('current_density=', current_density)
-    print('v=', v)
    
     return mdot
\ No newline at end of file
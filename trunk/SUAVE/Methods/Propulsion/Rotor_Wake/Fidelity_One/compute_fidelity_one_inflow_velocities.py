@@ -3,6 +3,7 @@
 #
 # Created:  Sep 2021, R. Erhard
 # Modified: Jan 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -82,7 +83,11 @@ def compute_fidelity_one_inflow_velocities( wake, prop ):
         # Compute induced velocities at blade from the helical fixed wake
         VD.Wake_collapsed = WD
         
-        V_ind   = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i)
+        V_ind   = compute_wake_induced_velocity(WD, VD, cpts, azi_start_idx=i,
+                                                memory_budget     = wake.wake_settings.memory_budget,
+                                                number_of_threads = wake.wake_settings.number_of_threads,
+                                                method            = wake.wake_settings.induced_velocity_method,
+                                                opening_angle     = wake.wake_settings.treecode_opening_angle)
         
         # velocities in vehicle frame
         u       = V_ind[:,:,0]   # velocity in vehicle x-frame
@@ -3,6 +3,7 @@
 # 
 # Created:  Sep 2020, M. Clarke 
 # Modified: Dec 2021, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,20 +11,36 @@
 
 # package imports
 import numpy as np 
+from concurrent.futures import ThreadPoolExecutor
+
+from .vortex_treecode import build_vortex_tree, treecode_induced_velocity
+
+# approximate bytes of the temporaries of the kernel per pair of vortex and evaluation points
+kernel_bytes = 400
 
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
-def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress_root=False):  
+def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress_root=False,memory_budget=2E9,number_of_threads=1,
+                                  method='direct',opening_angle=0.5):  
     """ This computes the velocity induced by the Fidelity One semi-prescribed vortex wake (PVW)
     on lifting surface control points
 
     Assumptions:  
+    The vortex and evaluation points are broadcast against each other. The evaluation points are 
+    processed in chunks so the temporaries of the kernel stay within the memory budget. The chunks 
+    can be run on a pool of threads, numpy releases the GIL in the array operations. With the treecode 
+    method, clusters of wake segments that are far from an evaluation point are replaced by the 
+    expansion of their vorticity.
     
     Source:   
     
     Inputs: 
-    WD     - helical wake distribution points               [Unitless] 
-    VD     - vortex distribution points on lifting surfaces [Unitless] 
-    cpts   - control points in segment                      [Unitless] 
+    WD                - helical wake distribution points               [Unitless] 
+    VD                - vortex distribution points on lifting surfaces [Unitless] 
+    cpts              - control points in segment                      [Unitless] 
+    memory_budget     - memory for the temporaries of all threads      [bytes]
+    number_of_threads - number of threads running the chunks           [Unitless]
+    method            - 'direct' or 'treecode'                         [String]
+    opening_angle     - treecode accuracy, smaller is more accurate    [Unitless]
 
     Properties Used:
     N/A
@@ -35,52 +52,79 @@ def compute_wake_induced_velocity(WD,VD,cpts,azi_start_idx=0,sigma=0.11,suppress
     
     dtype = np.float64
 
-    # expand vortex points
-    WXA1  = np.tile(WD.XA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYA1  = np.tile(WD.YA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))     
-    WZA1  = np.tile(WD.ZA1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WXA2  = np.tile(WD.XA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYA2  = np.tile(WD.YA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZA2  = np.tile(WD.ZA2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
+    # vortex points, broadcast along the evaluation points
+    WXA1  = WD.XA1.astype(dtype)[azi_start_idx,:,:,None]
+    WYA1  = WD.YA1.astype(dtype)[azi_start_idx,:,:,None]
+    WZA1  = WD.ZA1.astype(dtype)[azi_start_idx,:,:,None]
+    WXA2  = WD.XA2.astype(dtype)[azi_start_idx,:,:,None]
+    WYA2  = WD.YA2.astype(dtype)[azi_start_idx,:,:,None]
+    WZA2  = WD.ZA2.astype(dtype)[azi_start_idx,:,:,None]
                 
-    WXB1  = np.tile(WD.XB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYB1  = np.tile(WD.YB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZB1  = np.tile(WD.ZB1.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WXB2  = np.tile(WD.XB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WYB2  = np.tile(WD.YB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    WZB2  = np.tile(WD.ZB2.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    GAMMA = np.tile(WD.GAMMA.astype(dtype)[azi_start_idx,:,:,None], (1,1,num_eval_pts))
-    
-    # expand evaluation points
-    XC    = np.tile(VD.XC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
-    YC    = np.tile(VD.YC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
-    ZC    = np.tile(VD.ZC.astype(dtype)[None,None,:],(cpts,num_vortex_pts,1))
+    WXB1  = WD.XB1.astype(dtype)[azi_start_idx,:,:,None]
+    WYB1  = WD.YB1.astype(dtype)[azi_start_idx,:,:,None]
+    WZB1  = WD.ZB1.astype(dtype)[azi_start_idx,:,:,None]
+    WXB2  = WD.XB2.astype(dtype)[azi_start_idx,:,:,None]
+    WYB2  = WD.YB2.astype(dtype)[azi_start_idx,:,:,None]
+    WZB2  = WD.ZB2.astype(dtype)[azi_start_idx,:,:,None]
+    GAMMA = WD.GAMMA.astype(dtype)[azi_start_idx,:,:,None]
+    
+    if method == 'treecode':
+        return treecode_wake_induced_velocity(WD,VD,cpts,WXA1,WYA1,WZA1,WXA2,WYA2,WZA2,WXB1,WYB1,WZB1,
+                                              WXB2,WYB2,WZB2,GAMMA,sigma,opening_angle)
+    
+    # evaluation points, broadcast along the control points and vortex points
+    XC    = VD.XC.astype(dtype)[None,None,:]
+    YC    = VD.YC.astype(dtype)[None,None,:]
+    ZC    = VD.ZC.astype(dtype)[None,None,:]
+    
+    # chunks of evaluation points within the memory budget. A chunk of a single point is contiguous 
+    # along the vortex points and would be summed in a different order, so chunks keep at least two 
+    # points and V_ind does not depend on the chunks
+    number_of_threads = max(int(number_of_threads),1)
+    chunk_size        = int(memory_budget/(number_of_threads*kernel_bytes*cpts*num_vortex_pts))
+    num_chunks        = int(np.ceil(num_eval_pts/max(chunk_size,1)))
+    num_chunks        = max(min(num_chunks,num_eval_pts//2),1)
+    bounds            = np.linspace(0,num_eval_pts,num_chunks+1).astype(int)
+    chunks            = [slice(bounds[i],bounds[i+1]) for i in range(num_chunks)]
     
     # -------------------------------------------------------------------------------------------
     # Compute velocity induced by horseshoe vortex segments on every control point by every panel
     # -------------------------------------------------------------------------------------------     
     # Create empty data structure
     V_ind = np.zeros((cpts,VD.n_cp,3))
-     
-    # compute influence of bound vortices 
-    _ , res_C_AB = vortex(XC, YC, ZC, WXA1, WYA1, WZA1, WXB1, WYB1, WZB1,sigma,GAMMA,bv=True,WD=WD) 
-    C_AB         = res_C_AB.transpose(1,3,0,2) 
-    
-    # compute influence of right vortex segment
-    _ , res_C_BC = vortex(XC, YC, ZC, WXB1, WYB1, WZB1, WXB2, WYB2, WZB2,sigma,GAMMA)
-    C_BC         = res_C_BC.transpose(1,3,0,2) 
-    
-    # compute influence of bottom vortex segment
-    _ , res_C_CD = vortex(XC, YC, ZC, WXB2, WYB2, WZB2, WXA2, WYA2, WZA2,sigma,GAMMA) 
-    C_CD         = res_C_CD.transpose(1,3,0,2) 
     
-    # compute influence of left vortex segment 
-    _ , res_C_DA = vortex(XC, YC, ZC, WXA2, WYA2, WZA2, WXA1, WYA1, WZA1,sigma,GAMMA) 
-    C_DA         = res_C_DA.transpose(1,3,0,2) 
-    
-    # Add all the influences together
-    V_ind =  row_reduction_summation(C_AB) + row_reduction_summation(C_BC)  + row_reduction_summation(C_CD) + row_reduction_summation(C_DA)   
+    def induced_velocity(chunk):
+        X = XC[:,:,chunk]
+        Y = YC[:,:,chunk]
+        Z = ZC[:,:,chunk]
+        
+        # compute influence of bound vortices 
+        _ , res_C_AB = vortex(X, Y, Z, WXA1, WYA1, WZA1, WXB1, WYB1, WZB1,sigma,GAMMA,bv=True,WD=WD) 
+        C_AB         = res_C_AB.transpose(1,3,0,2) 
+        
+        # compute influence of right vortex segment
+        _ , res_C_BC = vortex(X, Y, Z, WXB1, WYB1, WZB1, WXB2, WYB2, WZB2,sigma,GAMMA)
+        C_BC         = res_C_BC.transpose(1,3,0,2) 
+        
+        # compute influence of bottom vortex segment
+        _ , res_C_CD = vortex(X, Y, Z, WXB2, WYB2, WZB2, WXA2, WYA2, WZA2,sigma,GAMMA) 
+        C_CD         = res_C_CD.transpose(1,3,0,2) 
+        
+        # compute influence of left vortex segment 
+        _ , res_C_DA = vortex(X, Y, Z, WXA2, WYA2, WZA2, WXA1, WYA1, WZA1,sigma,GAMMA) 
+        C_DA         = res_C_DA.transpose(1,3,0,2) 
+        
+        # Add all the influences together
+        V_ind[:,chunk] =  row_reduction_summation(C_AB) + row_reduction_summation(C_BC)  + row_reduction_summation(C_CD) + row_reduction_summation(C_DA)   
+        
+        return 
     
+    if number_of_threads > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(number_of_threads) as pool:
+            list(pool.map(induced_velocity,chunks))
+    else:
+        for chunk in chunks:
+            induced_velocity(chunk)
 
     return V_ind
   
@@ -141,20 +185,87 @@ def vortex(X,Y,Z,X1,Y1,Z1,X2,Y2,Z2,sigma, GAMMA = 1, bv=False,WD=None,use_regula
 
     if bv:
         # ignore the row of panels corresponding to the lifting line of the rotor
-        COEF_new = np.reshape(COEF[0,:,:,0],np.shape(WD.reshaped_wake.XA1[0,:,:,:,:]))
-        m = np.shape(WD.reshaped_wake.XA1)[1]
-        
-        lifting_line_panels = np.zeros_like(COEF_new,dtype=bool)
-        lifting_line_panels[:,:,:,0] = True
-        lifting_line_panels_compressed = np.reshape(lifting_line_panels, (m,np.size(lifting_line_panels[0,:,:,:])))
-        
-        COEF[:,lifting_line_panels_compressed,:] = 0
+        COEF[:,lifting_line_panels(WD),:] = 0
     
 
     V_IND  = GAMMA * COEF
     
     return COEF , V_IND  
 
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def treecode_wake_induced_velocity(WD,VD,cpts,WXA1,WYA1,WZA1,WXA2,WYA2,WZA2,WXB1,WYB1,WZB1,WXB2,WYB2,WZB2,GAMMA,sigma,opening_angle):
+    """ This computes the velocity induced by the wake with a treecode over the four segments of 
+    every wake panel, one tree per control point
+    
+    Assumptions:  
+    See treecode_induced_velocity
+    
+    Source: 
+    N/A
+    
+    Inputs:
+    WD                - helical wake distribution points               [Unitless] 
+    VD                - vortex distribution points on lifting surfaces [Unitless] 
+    cpts              - control points in segment                      [Unitless] 
+    [WXA1 ... WZB2]   - corners of the wake panels, (cpts,n_vortex,1)  [m]
+    GAMMA             - circulation of the wake panels                 [m^2/s]
+    sigma             - regularization radius                          [m]
+    opening_angle     - accuracy of the treecode                       [Unitless]
+    
+    Outputs:
+    V_ind             - induced velocity, (cpts,n_cp,3)                [m/s]
+    
+    Properties Used:
+    N/A
+    """
+    XC    = VD.XC.astype(np.float64)
+    YC    = VD.YC.astype(np.float64)
+    ZC    = VD.ZC.astype(np.float64)
+    bound = ~lifting_line_panels(WD)
+    V_ind = np.zeros((cpts,VD.n_cp,3))
+    
+    for i in range(cpts):
+        # bound, right, bottom and left segments of the panels 
+        b    = bound[i]
+        X1   = np.hstack([WXA1[i,b,0],WXB1[i,:,0],WXB2[i,:,0],WXA2[i,:,0]])
+        Y1   = np.hstack([WYA1[i,b,0],WYB1[i,:,0],WYB2[i,:,0],WYA2[i,:,0]])
+        Z1   = np.hstack([WZA1[i,b,0],WZB1[i,:,0],WZB2[i,:,0],WZA2[i,:,0]])
+        X2   = np.hstack([WXB1[i,b,0],WXB2[i,:,0],WXA2[i,:,0],WXA1[i,:,0]])
+        Y2   = np.hstack([WYB1[i,b,0],WYB2[i,:,0],WYA2[i,:,0],WYA1[i,:,0]])
+        Z2   = np.hstack([WZB1[i,b,0],WZB2[i,:,0],WZA2[i,:,0],WZA1[i,:,0]])
+        G    = np.hstack([GAMMA[i,b,0],GAMMA[i,:,0],GAMMA[i,:,0],GAMMA[i,:,0]])
+        
+        tree       = build_vortex_tree(X1,Y1,Z1,X2,Y2,Z2,G)
+        V_ind[i]   = treecode_induced_velocity(XC,YC,ZC,tree,vortex,sigma,opening_angle)
+    
+    return V_ind
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def lifting_line_panels(WD):
+    """ This finds the wake panels of the first time step, whose bound segments lie on the 
+    lifting line of the rotor
+    
+    Assumptions:  
+    None
+    
+    Source: 
+    N/A
+    
+    Inputs:
+    WD                - helical wake distribution points               [Unitless] 
+    
+    Outputs:
+    panels            - panels on the lifting line, (cpts,n_vortex)    [Boolean]
+    
+    Properties Used:
+    N/A
+    """
+    shape  = np.shape(WD.reshaped_wake.XA1[0,:,:,:,:])
+    panels = np.zeros(shape,dtype=bool)
+    panels[:,:,:,0] = True
+    
+    return np.reshape(panels,(shape[0],np.size(panels[0,:,:,:])))
+
 def row_reduction_summation(A):
     # sum along last axis
     sum_res = A.dot(np.ones(A.shape[-1])) # sum along axis
@@ -2,8 +2,9 @@
 # fidelity_one_wake_convergence.py
 #
 # Created:  Feb 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
+from SUAVE.Core import Data
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.compute_fidelity_one_inflow_velocities import compute_fidelity_one_inflow_velocities
 from SUAVE.Methods.Propulsion.Rotor_Wake.Fidelity_One.generate_fidelity_one_wake_shape import generate_fidelity_one_wake_shape
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_inflow_and_tip_loss
@@ -13,7 +14,9 @@ import numpy as np
 ## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
 def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
     """
-    This converges on the wake shape for the fidelity-one rotor wake.
+    This converges on the wake shape for the fidelity-one rotor wake. With the warm start of the 
+    wake, the convergence starts from the last converged inflow of each control point, and the 
+    converged wake is kept for the next evaluation.
     
     Assumptions:
     None
@@ -27,7 +30,9 @@ def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
     wake_inputs - inputs passed from the BET rotor spin function
     
     Outputs:
-    None
+    WD          - converged wake vortex distribution
+    va          - axially-induced velocity from rotor wake
+    vt          - tangentially-induced velocity from rotor wake
     
     Properties Used:
     None
@@ -52,6 +57,10 @@ def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
             print("\tGenerating fully-prescribed wake shape...")
         ii_max = 1
         
+    # start from the last converged inflow at the rotor disc
+    if wake.warm_start and wake.semi_prescribed_converge and converged_inflow_change(wake,rotor,wake_inputs) < np.inf:
+        rotor.outputs.disc_axial_induced_velocity = wake.converged_wake.disc_axial_induced_velocity
+        
 
     while va_diff > tol:  
         # generate wake geometry for rotor
@@ -80,4 +89,62 @@ def fidelity_one_wake_convergence(wake,rotor,wake_inputs):
     # save converged wake:
     wake, rotor  = generate_fidelity_one_wake_shape(wake,rotor)
     
-    return wake.vortex_distribution, va, vt
\ No newline at end of file
+    wake.convergence.iterations        = ii
+    wake.convergence.total_iterations += ii
+    if wake.semi_prescribed_converge and wake.verbose:
+        print("\tWake shape iterations: " + str(ii))
+    
+    # keep the converged wake for the next evaluation
+    if wake.warm_start:
+        state                             = wake.converged_wake
+        state.velocity_axial              = np.array(Ua)
+        state.velocity_tangential         = np.array(Ut)
+        state.twist_distribution          = np.array(wake_inputs.twist_distribution)
+        state.origin                      = np.array(rotor.origin)
+        state.wake_settings               = Data(wake.wake_settings)
+        state.disc_axial_induced_velocity = rotor.outputs.disc_axial_induced_velocity
+        state.vortex_distribution         = wake.vortex_distribution
+        state.va                          = va
+        state.vt                          = vt
+    
+    return wake.vortex_distribution, va, vt
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def converged_inflow_change(wake,rotor,wake_inputs):
+    """
+    This finds the largest change of the inflow at the rotor blades since the last converged wake.
+    
+    Assumptions:
+    A change of the blade angle changes the circulation like a change of the inflow angle, it
+    is measured as the normal velocity it gives at the blade sections. The converged wake can 
+    not be used with a different number of control points, rotor location or wake settings.
+    
+    Source:
+    N/A
+    
+    Inputs:
+    wake        - rotor wake
+    rotor       - rotor
+    wake_inputs - inputs passed from the BET rotor spin function
+    
+    Outputs:
+    change      - largest change of the inflow, infinite without a matching converged wake [m/s]
+    
+    Properties Used:
+    None
+    """
+    state = wake.converged_wake
+    Ua    = wake_inputs.velocity_axial
+    Ut    = wake_inputs.velocity_tangential
+    beta  = wake_inputs.twist_distribution
+    
+    if ('velocity_axial' not in state) or (np.shape(state.velocity_axial) != np.shape(Ua)) \
+       or (np.shape(state.twist_distribution) != np.shape(beta)) or not np.array_equal(state.origin,rotor.origin) \
+       or (dict(state.wake_settings) != dict(wake.wake_settings)):
+        return np.inf
+    
+    U      = np.sqrt(Ua**2 + Ut**2)
+    change = np.maximum(abs(Ua - state.velocity_axial),abs(Ut - state.velocity_tangential))
+    change = np.maximum(change,abs(beta - state.twist_distribution)*U)
+    
+    return np.max(change)
\ No newline at end of file
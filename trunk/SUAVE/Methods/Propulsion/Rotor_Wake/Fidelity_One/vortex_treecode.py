@@ -0,0 +1,189 @@
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+# vortex_treecode.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+# package imports
+from SUAVE.Core import Data
+import numpy as np
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def build_vortex_tree(X1,Y1,Z1,X2,Y2,Z2,GAMMA,leaf_size=64):
+    """ This sorts vortex segments into a tree of clusters by bisecting the longest side of the
+    bounding box of each cluster. Each cluster keeps the moments of its vorticity about its center.
+
+    Assumptions:
+    The far field of a segment is the field of a point vortex element at its midpoint
+
+    Source:
+    Barnes, J., and Hut, P., "A hierarchical O(N log N) force-calculation algorithm", Nature 324,
+    1986, pp. 446-449
+
+    Inputs:
+    [X1,Y1,Z1]  - location of point 1 of the segments, (n_segments)               [m]
+    [X2,Y2,Z2]  - location of point 2 of the segments, (n_segments)               [m]
+    GAMMA       - circulation of the segments, (n_segments)                       [m^2/s]
+    leaf_size   - largest number of segments in a leaf of the tree                [Unitless]
+
+    Outputs:
+    tree.
+      segments  - endpoints and circulation of the segments, sorted by cluster    [Data]
+      nodes     - clusters, each with the range of its segments, center, radius,
+                  moments and children                                            [list]
+
+    Properties Used:
+    N/A
+    """
+    P1    = np.stack([X1,Y1,Z1],axis=-1)
+    P2    = np.stack([X2,Y2,Z2],axis=-1)
+    mid   = (P1 + P2)/2
+    order = np.arange(len(GAMMA))
+    nodes = []
+
+    # split the clusters at the median of the longest side, the segments of a cluster stay contiguous
+    stack = [(0,len(GAMMA),None)]
+    while stack:
+        start, end, parent = stack.pop()
+
+        node          = Data()
+        node.start    = start
+        node.end      = end
+        node.children = []
+        if parent is not None:
+            nodes[parent].children.append(len(nodes))
+        nodes.append(node)
+
+        if end - start > leaf_size:
+            index = order[start:end]
+            axis  = np.argmax(np.ptp(mid[index],axis=0))
+            half  = (end - start)//2
+            order[start:end] = index[np.argpartition(mid[index,axis],half)]
+            stack.append((start + half,end,len(nodes)-1))
+            stack.append((start,start + half,len(nodes)-1))
+
+    P1    = P1[order]
+    P2    = P2[order]
+    mid   = mid[order]
+    alpha = GAMMA[order,None]*(P2 - P1)   # vorticity of each segment
+
+    # bounds and moments of the vorticity, the children of a cluster come after it
+    for node in reversed(nodes):
+        if not node.children:
+            s           = slice(node.start,node.end)
+            ends        = np.vstack([P1[s],P2[s]])
+            node.lower  = np.min(ends,axis=0)
+            node.upper  = np.max(ends,axis=0)
+            node.center = (node.lower + node.upper)/2
+            node.radius = np.sqrt(np.max(np.sum(np.square(ends - node.center),axis=1)))
+            d           = mid[s] - node.center
+            node.A      = np.sum(alpha[s],axis=0)
+            node.C      = np.sum(cross(alpha[s],d),axis=0)
+            node.M      = np.dot(alpha[s].T,d)
+        else:
+            children    = [nodes[i] for i in node.children]
+            node.lower  = np.min([child.lower for child in children],axis=0)
+            node.upper  = np.max([child.upper for child in children],axis=0)
+            node.center = (node.lower + node.upper)/2
+            node.A      = np.zeros(3)
+            node.C      = np.zeros(3)
+            node.M      = np.zeros((3,3))
+            node.radius = 0.
+            
+            # moments of the children shifted to the center
+            for child in children:
+                delta       = child.center - node.center
+                node.radius = max(node.radius,np.sqrt(np.sum(np.square(delta))) + child.radius)
+                node.A      = node.A + child.A
+                node.C      = node.C + child.C + np.cross(child.A,delta)
+                node.M      = node.M + child.M + np.outer(child.A,delta)
+
+    tree = Data()
+    tree.segments = Data()
+    tree.segments.X1    = X1[order]
+    tree.segments.Y1    = Y1[order]
+    tree.segments.Z1    = Z1[order]
+    tree.segments.X2    = X2[order]
+    tree.segments.Y2    = Y2[order]
+    tree.segments.Z2    = Z2[order]
+    tree.segments.GAMMA = GAMMA[order]
+    tree.nodes          = nodes
+
+    return tree
+
+## @ingroup Methods-Propulsion-Rotor_Wake-Fidelity_One
+def treecode_induced_velocity(X,Y,Z,tree,kernel,sigma,opening_angle=0.5):
+    """ This computes the velocity induced on evaluation points by the segments of a vortex tree.
+    Clusters that are small as seen from an evaluation point are replaced by the multipole
+    expansion of their vorticity, the remaining segments are summed directly with the regularized
+    vortex kernel.
+
+    Assumptions:
+    The regularization of the kernel is negligible beyond six regularization radii of a cluster.
+    The error of the expansion is of the order of the square of the opening angle.
+
+    Source:
+    Barnes, J., and Hut, P., "A hierarchical O(N log N) force-calculation algorithm", Nature 324,
+    1986, pp. 446-449
+
+    Inputs:
+    [X,Y,Z]       - location of the evaluation points, (n_eval)                   [m]
+    tree          - vortex tree from build_vortex_tree                            [Data]
+    kernel        - direct segment kernel with the interface of vortex() in
+                    compute_wake_induced_velocity
+    sigma         - regularization radius                                         [m]
+    opening_angle - largest ratio of cluster radius and distance of an expansion  [Unitless]
+
+    Outputs:
+    V_ind         - induced velocity, (n_eval,3)                                  [m/s]
+
+    Properties Used:
+    N/A
+    """
+    P     = np.stack([X,Y,Z],axis=-1)
+    V_ind = np.zeros_like(P)
+    seg   = tree.segments
+
+    stack = [(0,np.arange(len(P)))]
+    while stack:
+        i, targets = stack.pop()
+        node       = tree.nodes[i]
+
+        R    = P[targets] - node.center
+        dist = np.sqrt(np.sum(np.square(R),axis=1))
+        far  = (node.radius < opening_angle*dist) & (dist - node.radius > 6*sigma)
+
+        # multipole expansion of the cluster
+        if np.any(far):
+            R_far  = R[far]
+            r3     = dist[far,None]**3
+            r5     = dist[far,None]**5
+            MR     = np.dot(R_far,node.M.T)
+            V_ind[targets[far]] += (cross(node.A[None,:],R_far)/r3 - node.C/r3 + 3*cross(MR,R_far)/r5)/(4*np.pi)
+
+        near = targets[~far]
+        if len(near) == 0:
+            continue
+
+        if node.children:
+            for child in node.children:
+                stack.append((child,near))
+        else:
+            # direct sum of the segments of the leaf
+            s = slice(node.start,node.end)
+            _, V = kernel(X[near][None,:],Y[near][None,:],Z[near][None,:],
+                          seg.X1[s,None],seg.Y1[s,None],seg.Z1[s,None],
+                          seg.X2[s,None],seg.Y2[s,None],seg.Z2[s,None],sigma,seg.GAMMA[s,None])
+            V_ind[near] += np.sum(V,axis=1).T
+
+    return V_ind
+
+def cross(a,b):
+    """ Cross product of the rows of two (n,3) arrays
+    """
+    return np.stack([a[:,1]*b[:,2] - a[:,2]*b[:,1],
+                     a[:,2]*b[:,0] - a[:,0]*b[:,2],
+                     a[:,0]*b[:,1] - a[:,1]*b[:,0]],axis=-1)
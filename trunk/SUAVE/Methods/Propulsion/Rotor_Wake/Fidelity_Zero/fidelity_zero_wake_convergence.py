@@ -2,7 +2,7 @@
 # fidelity_zero_wake_convergence.py
 #
 # Created:  Feb 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 from SUAVE.Methods.Aerodynamics.Common.Fidelity_Zero.Lift.BET_calculations import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss
 import numpy as np
@@ -16,7 +16,8 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     following Helmholtz vortex theory.
     
     Assumptions:
-    None
+    The residual of each blade station depends only on the inflow angle of that station, which 
+    the station by station Newton solver relies on.
 
     Source:
     Drela, M. "Qprop Formulation", MIT AeroAstro, June 2006
@@ -50,7 +51,10 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     else:
         PSI    = np.ones((ctrl_pts,Nr))
 
-    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+    if wake.get('inflow_solver','fsolve') == 'newton':
+        PSI_final, ier = newton_iteration(PSI,wake_inputs,rotor,rotor.sol_tolerance)
+    else:
+        PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
     
     if ier!=1:
         print("Rotor BEVW did not converge to a solution (Stall)")
@@ -140,6 +144,61 @@ def iteration(PSI, wake_inputs, rotor):
     
     return Rsquiggly.flatten()
 
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def newton_iteration(PSI, wake_inputs, rotor, tol, max_iterations = 50, max_step = 0.2):
+    """
+    Solves the BEVW iteration station by station with a safeguarded Newton method. The derivative
+    of the residual of each station is taken by a finite difference. The steps head for a root 
+    where the residual increases with the inflow angle, and once a station has seen residuals of 
+    both signs its root is bracketed and steps that leave the bracket are replaced by bisection.
+
+    Assumptions:
+    The residual of a station depends only on its own inflow angle
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI                        initial inflow angle                            [rad]
+       wake_inputs                inputs passed from the BET rotor spin function
+       rotor                      SUAVE rotor
+       tol                        relative tolerance on the inflow angle          [-]
+       max_iterations             largest number of Newton steps                  [-]
+       max_step                   largest change of the inflow angle in a step    [rad]
+
+    Outputs:
+       PSI                        inflow angle, flattened                         [rad]
+       ier                        1 if all stations converged                     [-]
+
+    """
+    PSI   = np.array(PSI,dtype=float).flatten()
+    lower = np.full_like(PSI,np.nan)   # latest inflow angle with a negative residual
+    upper = np.full_like(PSI,np.nan)   # latest inflow angle with a positive residual
+    h     = np.sqrt(np.finfo(float).eps)
+    
+    for i in range(max_iterations):
+        R0    = iteration(PSI,wake_inputs,rotor)
+        lower = np.where(R0 < 0,PSI,lower)
+        upper = np.where(R0 > 0,PSI,upper)
+        dPSI  = h*np.maximum(abs(PSI),1.)
+        dR    = (iteration(PSI + dPSI,wake_inputs,rotor) - R0)/dPSI
+        
+        # Newton step, or a full step downhill where the residual does not increase 
+        with np.errstate(divide='ignore',invalid='ignore'):
+            step = np.where(dR > 0,np.clip(-R0/dR,-max_step,max_step),-np.sign(R0)*max_step)
+        PSI_new = PSI + step
+        
+        # bisect the stations whose step leaves the bracket of their root
+        outside = np.isfinite(lower) & np.isfinite(upper) & ~((PSI_new - lower)*(PSI_new - upper) < 0)
+        PSI_new = np.where(outside,(lower + upper)/2,PSI_new)
+        step    = PSI_new - PSI
+        PSI     = PSI_new
+        
+        if np.all((abs(step) <= tol*np.maximum(abs(PSI),1.)) | (R0 == 0)):
+            return PSI, 1
+        
+    return PSI, 5
+
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def va_vt(PSI, wake_inputs, rotor):
     """
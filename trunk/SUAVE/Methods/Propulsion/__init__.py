@@ -1,20 +1,22 @@
-## @defgroup Methods-Propulsion Propulsion
-# Description
-# @ingroup Methods
-
-from . import Rotor_Wake
-from .ducted_fan_sizing import ducted_fan_sizing
-from .propeller_design import propeller_design
-from .turbofan_emission_index import turbofan_emission_index
-from .electric_motor_sizing import size_from_kv, size_from_mass
-from .turbofan_sizing import turbofan_sizing
-from .turbojet_sizing import turbojet_sizing
-from .ramjet_sizing import ramjet_sizing
-from .scramjet_sizing import scramjet_sizing
-from .fm_id import fm_id
-from .fm_solver import fm_solver
-from .rayleigh import rayleigh
-from .nozzle_calculations import exit_Mach_shock, mach_area, normal_shock, pressure_ratio_isentropic, pressure_ratio_shock_in_nozzle
-from . import electric_motor_sizing
-from .liquid_rocket_sizing import liquid_rocket_sizing
-from .serial_HTS_turboelectric_sizing import serial_HTS_turboelectric_sizing
\ No newline at end of file
+## @defgroup Methods-Propulsion Propulsion
+# Description
+# @ingroup Methods
+
+from . import Rotor_Wake
+from .ducted_fan_sizing import ducted_fan_sizing
+from .propeller_design import propeller_design
+from .turbofan_emission_index import turbofan_emission_index
+from .electric_motor_sizing import size_from_kv, size_from_mass
+from .turbofan_sizing import turbofan_sizing
+from .turbojet_sizing import turbojet_sizing
+from .ramjet_sizing import ramjet_sizing
+from .scramjet_sizing import scramjet_sizing
+from .invert_mach_relation import invert_mach_relation
+from .fm_id import fm_id
+from .fm_solver import fm_solver
+from .rayleigh import rayleigh
+from .nozzle_calculations import exit_Mach_shock, mach_area, normal_shock, pressure_ratio_isentropic, pressure_ratio_shock_in_nozzle
+from . import electric_motor_sizing
+from .liquid_rocket_sizing import liquid_rocket_sizing
+from .serial_HTS_turboelectric_sizing import serial_HTS_turboelectric_sizing
+from .spin_motors_and_rotors import spin_motors_and_rotors
\ No newline at end of file
@@ -3,13 +3,14 @@
 #
 # Created:  Sep 2017, P Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
 # ----------------------------------------------------------------------
 
 import numpy as np
-from scipy.optimize import fsolve
+from .invert_mach_relation import invert_mach_relation
 
 # ----------------------------------------------------------------------
 #  fm_solver
@@ -34,14 +35,17 @@ def fm_solver(area_ratio, M0, gamma):
     https://web.stanford.edu/~cantwell/AA210A_Course_Material/AA210A_Course_Notes/
     """
     # Area-Mach Function
-    func = lambda M1: ((M0/M1*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**((gamma+1.)/(2.*(gamma-1.))))-area_ratio)
+    k     = (gamma-1.)/2.
+    e     = (gamma+1.)/(2.*(gamma-1.))
+    func  = lambda M1: ((M0/M1*((1.+k*M1*M1)/(1.+k*M0*M0))**e)-area_ratio)
+    dfunc = lambda M1: M0/(M1*M1)*(M1*M1-1.)*(1.+k*M1*M1)**(e-1.)/(1.+k*M0*M0)**e
 
     # Initializing the array
-    M1_guess = np.ones_like(M0)
+    M1_guess = np.ones_like(M0*gamma*area_ratio,dtype=float)
 
     # Separating supersonic and subsonic solutions
-    i_low = M0 < 1.0
-    i_high = M0 >= 1.0
+    i_low = np.broadcast_to(M0 < 1.0,M1_guess.shape)
+    i_high = np.broadcast_to(M0 >= 1.0,M1_guess.shape)
 
     # Subsonic solution initialization
     M1_guess[i_low]= 0.1
@@ -49,7 +53,9 @@ def fm_solver(area_ratio, M0, gamma):
     # Supersonic solution initialization
     M1_guess[i_high]= 1.1
 
-    # Solving
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    # Solving each element on its own branch
+    lower = np.where(i_low,0.,1.)
+    upper = np.where(i_low,1.,np.inf)
+    M1    = np.atleast_1d(invert_mach_relation(func,dfunc,M1_guess,lower,upper))
 
     return M1
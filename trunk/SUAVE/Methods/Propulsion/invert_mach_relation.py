@@ -0,0 +1,83 @@
+## @ingroup Methods-Propulsion
+# invert_mach_relation.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+import numpy as np
+
+# ----------------------------------------------------------------------
+#  invert_mach_relation
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def invert_mach_relation(residual, derivative, M_guess, lower, upper, tolerance=1E-12, max_iterations=100):
+    """ Finds the Mach number of each element that zeros a compressible flow
+    relation. Every element is solved on its own with a Newton method, steps
+    that leave the bracket of the root are replaced by bisection. Infinite
+    upper bounds are replaced by twice the lower bound, and doubled until they
+    bracket a root.
+
+    Assumptions:
+    The elements are independent. The relation has one root between the bounds.
+    Without a root between finite bounds the Mach number goes to the bound where
+    the relation is closest to zero, e.g. sonic flow at thermal choking.
+
+    Source:
+    N/A
+
+    Inputs:
+    residual       - relation of the Mach number, element-wise          [function]
+    derivative     - derivative of the relation, element-wise          [function]
+    M_guess        - initial Mach number                               [dimensionless]
+    lower          - lower bound of the Mach number                    [dimensionless]
+    upper          - upper bound of the Mach number                    [dimensionless]
+    tolerance      - relative tolerance of the Mach number             [dimensionless]
+    max_iterations - largest number of Newton steps                    [-]
+
+    Outputs:
+    M              - Mach number                                       [dimensionless]
+
+    """
+
+    M_guess, lower, upper = np.broadcast_arrays(M_guess, lower, upper)
+    M     = np.array(M_guess,dtype=float)
+    lower = np.array(lower,dtype=float)
+    upper = np.array(upper,dtype=float)
+
+    with np.errstate(divide='ignore',invalid='ignore',over='ignore'):
+
+        # grow the infinite upper bounds until the relation changes sign
+        r_lower   = residual(lower)
+        unbounded = np.isinf(upper)
+        upper     = np.where(unbounded,2.*np.maximum(lower,1.),upper)
+        for _ in range(30):
+            grow = unbounded & (np.sign(residual(upper)) == np.sign(r_lower))
+            if not np.any(grow):
+                break
+            upper = np.where(grow,2.*upper,upper)
+        M = np.clip(M,lower,upper)
+
+        for _ in range(max_iterations):
+            r  = residual(M)
+            dr = derivative(M)
+
+            # move the bound on the side of the root that has the sign of the residual
+            same    = np.sign(r) == np.sign(r_lower)
+            lower   = np.where(same,M,lower)
+            r_lower = np.where(same,r,r_lower)
+            upper   = np.where(same,upper,M)
+
+            # Newton step, bisection where the step leaves the bracket
+            M_new   = M - r/dr
+            outside = ~((M_new > np.minimum(lower,upper)) & (M_new < np.maximum(lower,upper)))
+            M_new   = np.where(outside,(lower + upper)/2.,M_new)
+            done    = (np.abs(M_new - M) <= tolerance*np.abs(M)) | (r == 0.)
+            M       = np.where(r == 0.,M,M_new)
+            if np.all(done):
+                break
+
+    return M
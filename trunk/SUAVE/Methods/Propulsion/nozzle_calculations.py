@@ -2,10 +2,10 @@
 # nozzle_calculations.py
 # 
 # Created:  Sep 2017, P. Goncalves
-# Modified: 
+# Modified: Oct 2026, SUAVE Team
 
 import numpy as np
-from scipy.optimize import fsolve
+from .invert_mach_relation import invert_mach_relation
 
 # ----------------------------------------------------------------------
 #  nozzle calculations
@@ -33,15 +33,16 @@ def exit_Mach_shock(area_ratio, gamma, Pt_out, P0):
     Me            [dimensionless]      
     
     """
-    func = lambda Me : (Pt_out/P0)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
+    func  = lambda Me : (Pt_out/P0)*(1./area_ratio)-(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*Me*((1.+(gamma-1.)/2.*Me**2.)**0.5)
+    dfunc = lambda Me : -(((gamma+1.)/2.)**((gamma+1.)/(2.*(gamma-1.))))*(1.+(gamma-1.)*Me**2.)/((1.+(gamma-1.)/2.*Me**2.)**0.5)
 
     #Initializing the array
-    Me_initial_guess = np.ones_like(Pt_out) 
+    Me_initial_guess = np.ones_like(Pt_out*P0*gamma*area_ratio,dtype=float)
     i_sol = Me_initial_guess < 10.0
     Me_initial_guess[i_sol] = 0.1
 
-    # Solving for Me
-    Me = fsolve(func,Me_initial_guess)
+    # Solving for Me, the relation falls with Me
+    Me = invert_mach_relation(func,dfunc,Me_initial_guess,0.,np.inf)
         
     return Me
         
@@ -64,13 +65,19 @@ def mach_area(area_ratio, gamma, subsonic):
     Me            [dimensionless]  
     
     """
-    func = lambda Me : (area_ratio**2. - ((1./Me)**2.)*(((2./(gamma+1.))*(1.+((gamma-1.)/2.)*Me**2.))**((gamma+1.)/((gamma-1.)))))[:,0]
+    k     = (gamma-1.)/2.
+    e     = (gamma+1.)/(2.*(gamma-1.))
+    func  = lambda Me : (1./Me)*((2./(gamma+1.))*(1.+k*Me**2.))**e - area_ratio
+    dfunc = lambda Me : (2./(gamma+1.))**e*(1.+k*Me**2.)**(e-1.)*(Me**2.-1.)/Me**2.
     if subsonic:
-        Me_initial_guess = np.ones_like(gamma)*0.01
+        Me_initial_guess = np.ones_like(gamma*area_ratio,dtype=float)*0.01
+        lower, upper     = 0., 1.
     else:
-        Me_initial_guess = np.ones_like(gamma)*2.0         
+        Me_initial_guess = np.ones_like(gamma*area_ratio,dtype=float)*2.0         
+        lower, upper     = 1., np.inf
         
-    Me = np.atleast_2d(fsolve(func,Me_initial_guess, factor = 0.1)).T
+    # Solving each element on its own branch
+    Me = np.reshape(invert_mach_relation(func,dfunc,Me_initial_guess,lower,upper),(-1,1))
 
     return Me
 
@@ -3,10 +3,11 @@
 # 
 # Created:  Aug 2017, P. Goncalves
 # Modified: Jan 2018, W. Maier
+#           Oct 2026, SUAVE Team
 
 import numpy as np
 
-from scipy.optimize import fsolve
+from .invert_mach_relation import invert_mach_relation
 
 # ----------------------------------------------------------------------
 #  rayleigh
@@ -31,14 +32,15 @@ def rayleigh(gamma, M0, TtR):
     
     """
 
-    func = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
+    func  = lambda M1: (((1.+gamma*M0*M0)**2.*M1*M1*(1.+(gamma-1.)/2.*M1*M1))/((1.+gamma*M1*M1)**2.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))-TtR)
+    dfunc = lambda M1: ((1.+gamma*M0*M0)**2.*2.*M1*(1.-M1*M1))/((1.+gamma*M1*M1)**3.*M0*M0*(1.+(gamma-1.)/2.*M0*M0))
 
     #Initializing the array
-    M1_guess = np.ones_like(M0)
+    M1_guess = np.ones_like(M0*gamma*TtR,dtype=float)
     
     # Separating supersonic and subsonic solutions
-    i_low = M0 <= 1.0
-    i_high = M0 > 1.0
+    i_low = np.broadcast_to(M0 <= 1.0,M1_guess.shape)
+    i_high = np.broadcast_to(M0 > 1.0,M1_guess.shape)
 
     #--Subsonic solution Guess
     M1_guess[i_low]= .01
@@ -46,8 +48,10 @@ def rayleigh(gamma, M0, TtR):
     #--Supersonic solution Guess
     M1_guess[i_high]= 1.1
 
-    # Find Mach number
-    M1 = fsolve(func,M1_guess, factor=0.1)
+    # Find Mach number, each element on its own branch
+    lower = np.where(i_low,0.,1.)
+    upper = np.where(i_low,1.,np.inf)
+    M1    = np.atleast_1d(invert_mach_relation(func,dfunc,M1_guess,lower,upper))
     
     #Calculate stagnation pressure ratio
     Ptr = ((1.+gamma*M0*M0)/(1.+gamma*M1*M1)*((1.+(gamma-1.)/2.*M1*M1)/(1.+(gamma-1.)/2.*M0*M0))**(gamma/(gamma-1.)))
@@ -0,0 +1,309 @@
+## @ingroup Methods-Propulsion
+# spin_motors_and_rotors.py
+#
+# Created:  Oct 2026, SUAVE Team
+
+# ----------------------------------------------------------------------
+#  Imports
+# ----------------------------------------------------------------------
+
+from SUAVE.Core import Data
+import numpy as np
+import copy
+
+# attributes of the rotors that must agree for the rotors to be stacked
+blade_attributes = ['number_of_blades','tip_radius','hub_radius','twist_distribution','chord_distribution',
+                    'sweep_distribution','radius_distribution','thickness_to_chord','airfoil_geometry',
+                    'airfoil_polars','airfoil_polar_stations','number_azimuthal_stations','use_2d_analysis',
+                    'nonuniform_freestream','variable_pitch','sol_tolerance']
+
+# ----------------------------------------------------------------------
+#  Spin Motors and Rotors
+# ----------------------------------------------------------------------
+
+## @ingroup Methods-Propulsion
+def spin_motors_and_rotors(motors,rotors,voltage,power_coefficients,conditions):
+    """ Runs the motors and rotors of a network. Rotors with the same blades are stacked along the
+    control points and spun in one call, the motors are stacked along the columns of the power
+    coefficients and run in one call. Otherwise each motor and rotor is run on its own.
+
+    Assumptions:
+    The rotors can differ in rotation rate, blade pitch, orientation and location, the motors in
+    their constants. Only the Fidelity Zero wake of uniform inflow is stacked.
+
+    Source:
+    N/A
+
+    Inputs:
+    motors                           - motors, one per rotor                           [list]
+    rotors                           - rotors                                          [list]
+    voltage                          - motor voltage                                   [V]
+    power_coefficients               - rotor power coefficient of each motor,
+                                       (ctrl_pts,n_rotors)                             [-]
+    conditions.
+      freestream.
+        density                                                                        [kg/m^3]
+        dynamic_viscosity                                                              [kg/(m-s)]
+        speed_of_sound                                                                 [m/s]
+        temperature                                                                    [K]
+        velocity                                                                       [m/s]
+      frames.
+        body.transform_to_inertial                                                     (rotation matrix)
+        inertial.velocity_vector                                                       [m/s]
+      propulsion.throttle                                                              [-]
+
+    Outputs:
+    results                          - thrust vector, torque, power, power coefficient,
+                                       outputs, propeller efficiency and motor
+                                       efficiency of each rotor                        [list]
+    conditions.propulsion.
+      etap                           - propeller efficiency of the last rotor          [-]
+      etam                           - motor efficiency of the last motor              [-]
+
+    Properties Used:
+    N/A
+    """
+
+    if len(rotors) > 1 and stackable_rotors(rotors) and stackable_motors(motors):
+
+        # run all motors for their rotation rate
+        motor                      = stack_motors(motors)
+        motor.inputs.voltage       = voltage
+        motor.inputs.propeller_CP  = power_coefficients
+        motor.omega(conditions)
+
+        # spin all rotors at once
+        for i, (m, r) in enumerate(zip(motors,rotors)):
+            m.outputs.omega  = motor.outputs.omega[:,i,None]
+            m.outputs.torque = motor.outputs.torque[:,i,None]
+            r.inputs.omega   = m.outputs.omega
+        rotor             = stack_rotors(rotors)
+        stacked           = stack_conditions(conditions,len(rotors))
+        F, Q, P, Cp, outputs, etap = rotor.spin(stacked)
+
+        # run all motors for their current
+        current, etam = motor.current(conditions)
+
+        # split the stacked results
+        results = []
+        ctrl_pts = len(voltage)
+        for i, (m, r) in enumerate(zip(motors,rotors)):
+            rows                  = slice(i*ctrl_pts,(i+1)*ctrl_pts)
+            m.outputs.current     = current[:,i,None]
+            r.outputs             = unstack_outputs(outputs,rows,len(rotors)*ctrl_pts)
+            r.azimuthal_distribution = rotor.azimuthal_distribution
+            if rotor.variable_pitch and np.any(r.inputs.pitch_command != 0):
+                r.variable_pitch  = True
+            results.append((F[rows],Q[rows],P[rows],Cp[rows],r.outputs,etap[rows],etam[:,i,None]))
+
+        conditions.propulsion.etap = results[-1][5]
+        conditions.propulsion.etam = results[-1][6]
+
+    else:
+        results = []
+        for i, (motor, rotor) in enumerate(zip(motors,rotors)):
+            motor.inputs.voltage      = voltage
+            motor.inputs.propeller_CP = np.atleast_2d(power_coefficients[:,i]).T
+            motor.omega(conditions)
+
+            rotor.inputs.omega         = motor.outputs.omega
+            F, Q, P, Cp, outputs, etap = rotor.spin(conditions)
+
+            _, etam = motor.current(conditions)
+            results.append((F,Q,P,Cp,outputs,etap,etam))
+
+    return results
+
+## @ingroup Methods-Propulsion
+def stackable_rotors(rotors):
+    """ Checks that rotors have the same blades and uniform inflow, so they can be spun in one call
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    rotors          - rotors                                                           [list]
+
+    Outputs:
+    stackable       - rotors can be stacked                                            [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    first = rotors[0]
+    if 'Wake' not in first or getattr(first.Wake,'wake_method',None) != 'Fidelity_Zero' or first.nonuniform_freestream:
+        return False
+
+    for rotor in rotors[1:]:
+        if type(rotor) != type(first) or getattr(rotor.Wake,'wake_method',None) != 'Fidelity_Zero':
+            return False
+        for key in blade_attributes:
+            if not np.array_equal(np.array(rotor.get(key),dtype=object),np.array(first.get(key),dtype=object)):
+                return False
+
+    return True
+
+## @ingroup Methods-Propulsion
+def stackable_motors(motors):
+    """ Checks that motors are of the same model, so they can be run in one call
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    motors          - motors                                                           [list]
+
+    Outputs:
+    stackable       - motors can be stacked                                            [boolean]
+
+    Properties Used:
+    N/A
+    """
+
+    return all(type(motor) == type(motors[0]) for motor in motors)
+
+## @ingroup Methods-Propulsion
+def stack_motors(motors):
+    """ Makes one motor whose constants are the constants of the motors side by side
+
+    Assumptions:
+    The motor models are evaluated element by element
+
+    Source:
+    N/A
+
+    Inputs:
+    motors          - motors                                                           [list]
+
+    Outputs:
+    motor           - stacked motor, constants of shape (1,n_motors)                   [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    motor         = copy.copy(motors[0])
+    motor.inputs  = Data()
+    motor.outputs = Data()
+    for key, value in motors[0].items():
+        if isinstance(value,(int,float)) and not isinstance(value,bool):
+            motor[key] = np.array([[m[key] for m in motors]])
+
+    return motor
+
+## @ingroup Methods-Propulsion
+def stack_rotors(rotors):
+    """ Makes one rotor whose control points are the control points of all rotors in turn
+
+    Assumptions:
+    The rotors have the same blades. The inflow of the stacked rotor is solved station by station.
+
+    Source:
+    N/A
+
+    Inputs:
+    rotors          - rotors                                                           [list]
+
+    Outputs:
+    rotor           - stacked rotor                                                    [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    ctrl_pts = len(rotors[0].inputs.omega)
+
+    rotor        = copy.copy(rotors[0])
+    rotor.inputs = Data()
+    
+    # the stations of the stacked rotor are solved one by one rather than as one system
+    rotor.Wake               = copy.copy(rotors[0].Wake)
+    rotor.Wake.inflow_solver = 'newton'
+    
+    rotor.inputs.omega           = np.vstack([r.inputs.omega for r in rotors])
+    rotor.inputs.y_axis_rotation = np.vstack([np.broadcast_to(np.atleast_2d(r.inputs.y_axis_rotation),(ctrl_pts,1)) for r in rotors])
+    rotor.orientation_euler_angles = np.repeat(np.array([r.orientation_euler_angles for r in rotors],dtype=float),ctrl_pts,axis=0)
+
+    # keep a scalar pitch command when the rotors agree
+    pitch = [r.inputs.pitch_command for r in rotors]
+    if all(np.size(p) == 1 for p in pitch) and len(np.unique(pitch)) == 1:
+        rotor.inputs.pitch_command = rotors[0].inputs.pitch_command
+    else:
+        rotor.inputs.pitch_command = np.vstack([np.broadcast_to(np.atleast_2d(p),(ctrl_pts,1)) for p in pitch])
+
+    return rotor
+
+## @ingroup Methods-Propulsion
+def stack_conditions(conditions,n_rotors):
+    """ Repeats the conditions read by the rotor spin for every rotor
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    conditions      - segment conditions                                               [Data]
+    n_rotors        - number of rotors                                                 [-]
+
+    Outputs:
+    stacked         - conditions of the stacked rotor                                  [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    stacked = Data()
+    stacked.freestream = Data()
+    for key in ['density','dynamic_viscosity','speed_of_sound','temperature']:
+        stacked.freestream[key] = np.tile(conditions.freestream[key],(n_rotors,1))
+
+    stacked.frames          = Data()
+    stacked.frames.inertial = Data()
+    stacked.frames.body     = Data()
+    stacked.frames.inertial.velocity_vector   = np.tile(conditions.frames.inertial.velocity_vector,(n_rotors,1))
+    stacked.frames.body.transform_to_inertial = np.tile(conditions.frames.body.transform_to_inertial,(n_rotors,1,1))
+
+    stacked.propulsion          = Data()
+    stacked.propulsion.throttle = np.tile(conditions.propulsion.throttle,(n_rotors,1))
+
+    return stacked
+
+## @ingroup Methods-Propulsion
+def unstack_outputs(outputs,rows,stacked_rows):
+    """ Takes the outputs of one rotor from the outputs of the stacked rotor
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    outputs         - outputs of the stacked rotor                                     [Data]
+    rows            - control points of the rotor in the stacked rotor                 [slice]
+    stacked_rows    - number of control points of the stacked rotor                    [-]
+
+    Outputs:
+    rotor_outputs   - outputs of the rotor                                             [Data]
+
+    Properties Used:
+    N/A
+    """
+
+    rotor_outputs = Data()
+    for key, value in outputs.items():
+        if isinstance(value,np.ndarray) and value.ndim > 0 and len(value) == stacked_rows:
+            rotor_outputs[key] = value[rows]
+        else:
+            rotor_outputs[key] = value
+
+    return rotor_outputs
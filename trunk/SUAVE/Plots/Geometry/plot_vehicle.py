@@ -9,6 +9,7 @@
 #           Dec 2021, M. Clarke
 #           Feb 2022, R. Erhard
 #           Mar 2022, R. Erhard
+#           Oct 2026, SUAVE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -198,7 +199,7 @@ def plot_propeller_wake(axes, prop,face_color,edge_color,alpha,ctrl_pt=0):
     Properties Used:
     N/A
     """
-    wVD = prop.Wake.vortex_distribution.reshaped_wake
+    wVD = prop.Wake.offset_vortex_distribution().reshaped_wake
     num_cpts = len(wVD.XA1[0,:,0,0,0])
     num_B    = len(wVD.XA1[0,0,:,0,0])
     dim_R    = len(wVD.XA1[0,0,0,:,0])